@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0017_create_sales_rollup_tables"
+down_revision = "a69fcc420eab"
+branch_labels = None
+depends_on = None
+
+
+def _counter_columns() -> list[sa.Column]:
+    return [
+        sa.Column("sales_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("quantity", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("revenue", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("returned_quantity", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("returned_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_hourly_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("hour", sa.Integer(), primary_key=True),
+        sa.Column("currency", sa.String(length=3), primary_key=True),
+        sa.Column("slot", sa.SmallInteger(), primary_key=True, server_default="0"),
+        *_counter_columns(),
+    )
+
+    op.create_table(
+        "sales_daily_product_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("product_id", sa.String(length=26), primary_key=True),
+        sa.Column("currency", sa.String(length=3), primary_key=True),
+        *_counter_columns(),
+    )
+    op.create_index(
+        "ix_sales_daily_product_rollups_product_day",
+        "sales_daily_product_rollups",
+        ["product_id", "day"],
+    )
+
+    op.create_table(
+        "sales_daily_customer_rollups",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("customer_id", sa.String(length=26), primary_key=True),
+        sa.Column("currency", sa.String(length=3), primary_key=True),
+        *_counter_columns(),
+    )
+    op.create_index(
+        "ix_sales_daily_customer_rollups_customer_day",
+        "sales_daily_customer_rollups",
+        ["customer_id", "day"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sales_daily_customer_rollups_customer_day", table_name="sales_daily_customer_rollups")
+    op.drop_table("sales_daily_customer_rollups")
+    op.drop_index("ix_sales_daily_product_rollups_product_day", table_name="sales_daily_product_rollups")
+    op.drop_table("sales_daily_product_rollups")
+    op.drop_table("sales_hourly_rollups")
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0018_create_customer_stats"
+down_revision = "0017_create_sales_rollup_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "customer_stats",
+        sa.Column(
+            "customer_id",
+            sa.String(length=26),
+            sa.ForeignKey("customers.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("total_sales", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("total_quantity", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("returned_quantity", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("returned_amount", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("first_sale_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_sale_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_sale_id", sa.String(length=26), nullable=True),
+        sa.Column("last_sale_amount", sa.Numeric(12, 2), nullable=True),
+        sa.Column("currency", sa.String(length=3), nullable=True),
+    )
+
+    # Backfill from existing history; afterwards the table is maintained on write.
+    op.execute(
+        """
+        INSERT INTO customer_stats (
+            customer_id, total_sales, total_amount, total_quantity,
+            returned_quantity, returned_amount, first_sale_at, last_sale_at
+        )
+        SELECT customer_id, COUNT(id), SUM(total_amount), SUM(total_quantity), 0, 0,
+               MIN(created_at), MAX(created_at)
+        FROM sales
+        WHERE customer_id IS NOT NULL
+        GROUP BY customer_id
+        """
+    )
+    for column, source in (("last_sale_id", "id"), ("last_sale_amount", "total_amount"), ("currency", "currency")):
+        op.execute(
+            f"""
+            UPDATE customer_stats SET {column} = (
+                SELECT s.{source} FROM sales s
+                WHERE s.customer_id = customer_stats.customer_id
+                ORDER BY s.created_at DESC, s.id DESC
+                LIMIT 1
+            )
+            """
+        )
+    for column, source in (("returned_quantity", "total_quantity"), ("returned_amount", "total_amount")):
+        op.execute(
+            f"""
+            UPDATE customer_stats SET {column} = COALESCE((
+                SELECT SUM(r.{source}) FROM returns r
+                JOIN sales s ON s.id = r.sale_id
+                WHERE s.customer_id = customer_stats.customer_id
+            ), 0)
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("customer_stats")
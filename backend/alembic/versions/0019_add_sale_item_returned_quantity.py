@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0019_sale_item_returned_qty"
+down_revision = "0018_create_customer_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sale_items",
+        sa.Column("returned_quantity", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE sale_items SET returned_quantity = COALESCE((
+            SELECT SUM(ri.quantity) FROM return_items ri
+            WHERE ri.sale_item_id = sale_items.id
+        ), 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sale_items", "returned_quantity")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0020_refresh_token_indexes"
+down_revision = "0019_sale_item_returned_qty"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The composite index serves logout-all and covers every user_id lookup the single-column one did.
+    op.create_index("ix_refresh_tokens_user_id_revoked", "refresh_tokens", ["user_id", "revoked"])
+    op.drop_index("ix_refresh_tokens_user_id", table_name="refresh_tokens")
+    op.create_index("ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"])
+    # Revoked-token retention runs from the revocation; tokens revoked before this upgrade count from now.
+    op.add_column("refresh_tokens", sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE refresh_tokens SET revoked_at = CURRENT_TIMESTAMP WHERE revoked")
+    op.create_index("ix_refresh_tokens_revoked_at", "refresh_tokens", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_revoked_at", table_name="refresh_tokens")
+    op.drop_column("refresh_tokens", "revoked_at")
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
+    op.create_index("ix_refresh_tokens_user_id", "refresh_tokens", ["user_id"])
+    op.drop_index("ix_refresh_tokens_user_id_revoked", table_name="refresh_tokens")
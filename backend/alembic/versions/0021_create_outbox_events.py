@@ -0,0 +1,43 @@
+"""create outbox events
+
+Revision ID: 0021_create_outbox_events
+Revises: 0020_refresh_token_indexes
+Create Date: 2026-10-19
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0021_create_outbox_events"
+down_revision: str | None = "0020_refresh_token_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox_events",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), primary_key=True, autoincrement=True),
+        sa.Column("event_id", sa.String(length=26), nullable=False, unique=True),
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("aggregate_id", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_outbox_events_status_available_at", "outbox_events", ["status", "available_at"])
+    op.create_index("ix_outbox_events_aggregate_id_id", "outbox_events", ["aggregate_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_aggregate_id_id", table_name="outbox_events")
+    op.drop_index("ix_outbox_events_status_available_at", table_name="outbox_events")
+    op.drop_table("outbox_events")
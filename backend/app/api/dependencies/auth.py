@@ -4,25 +4,85 @@ from typing import Awaitable, Callable
 
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.dependencies.cache import get_redis
+from app.application.auth.services.login_throttle import LoginThrottle, LoginThrottlePolicy
+from app.application.auth.services.principal_cache import PrincipalCache
 from app.application.auth.use_cases.get_current_user import (
     GetCurrentUserInput,
     GetCurrentUserUseCase,
 )
+from app.core.metrics import metrics
 from app.core.settings import get_settings
 from app.domain.auth.entities import User, UserRole
 from app.domain.common.errors import RoleForbiddenError, TokenError, UnauthorizedError
 from app.infrastructure.auth.token_provider import TokenProvider
+from app.infrastructure.cache.principal_invalidation import PostCommitPrincipalInvalidator
+from app.infrastructure.cache.sliding_window_store import MemorySlidingWindowStore, RedisSlidingWindowStore
+from app.infrastructure.db.admin_action_writer import BufferedAdminActionWriter, PostCommitAdminActionSink
 from app.infrastructure.db.repositories.user_repository import UserRepository
-from app.infrastructure.db.session import get_session
+from app.infrastructure.db.session import AsyncSessionLocal, get_session
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# One per worker process; invalidations from other workers arrive via Redis pub/sub (see app.api.main).
+principal_cache = PrincipalCache(ttl=get_settings().AUTH_PRINCIPAL_CACHE_TTL_SECONDS)
+metrics.register_gauge("auth.principal_cache.hits", lambda: principal_cache.hits)
+metrics.register_gauge("auth.principal_cache.misses", lambda: principal_cache.misses)
+metrics.register_gauge("auth.principal_cache.hit_ratio", lambda: principal_cache.hit_ratio)
+
+
+def get_principal_cache() -> PrincipalCache:
+    return principal_cache
+
+
+def get_principal_invalidator(session: AsyncSession = Depends(get_session)) -> PostCommitPrincipalInvalidator:
+    return PostCommitPrincipalInvalidator(session, principal_cache)
+
+
+# Started and drained by the app lifespan; until then entries are spooled and flushed on read.
+admin_action_writer = BufferedAdminActionWriter(
+    AsyncSessionLocal,
+    get_settings().AUDIT_SPOOL_DIR,
+    batch_size=get_settings().AUDIT_BATCH_SIZE,
+    flush_interval=get_settings().AUDIT_FLUSH_INTERVAL_SECONDS,
+)
+metrics.register_gauge("audit.admin_actions.pending", lambda: admin_action_writer.pending)
+
+
+def get_admin_action_writer() -> BufferedAdminActionWriter:
+    return admin_action_writer
+
+
+def get_admin_action_sink(session: AsyncSession = Depends(get_session)) -> PostCommitAdminActionSink:
+    return PostCommitAdminActionSink(session, admin_action_writer)
+
+
+# Fallback when Redis is unreachable: failures are then counted per worker process.
+_login_attempts = MemorySlidingWindowStore()
+
+
+def _count_login_event(event: str) -> None:
+    metrics.increment(f"auth.login.{event}")
+
+
+async def get_login_throttle(redis: Redis | None = Depends(get_redis)) -> LoginThrottle:
+    settings = get_settings()
+    policy = LoginThrottlePolicy(
+        max_failures_per_email=settings.LOGIN_MAX_FAILURES_PER_EMAIL,
+        max_failures_per_client=settings.LOGIN_MAX_FAILURES_PER_CLIENT,
+        window_seconds=settings.LOGIN_FAILURE_WINDOW_SECONDS,
+        lockout_base_seconds=settings.LOGIN_LOCKOUT_BASE_SECONDS,
+        lockout_max_seconds=settings.LOGIN_LOCKOUT_MAX_SECONDS,
+    )
+    store = RedisSlidingWindowStore(redis) if redis else _login_attempts
+    return LoginThrottle(store, policy, on_event=_count_login_event)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-    session: AsyncSession = Depends(get_session),
 ) -> User:
     if credentials is None or credentials.scheme.lower() != "bearer":
         raise UnauthorizedError("not authenticated")
@@ -38,9 +98,14 @@ async def get_current_user(
     sub = payload.get("sub")
     if not sub:
         raise TokenError("invalid token subject")
-    repo = UserRepository(session)
-    use_case = GetCurrentUserUseCase(repo)
-    return await use_case.execute(GetCurrentUserInput(user_id=sub))
+    cached = principal_cache.get(sub)
+    if cached is not None:
+        return cached
+    # Only a miss opens a session, and it is closed before the endpoint runs.
+    async with AsyncSessionLocal() as session:
+        user = await GetCurrentUserUseCase(UserRepository(session)).execute(GetCurrentUserInput(user_id=sub))
+    principal_cache.put(user)
+    return user
 
 
 def require_roles(*roles: UserRole) -> Callable[..., Awaitable[User]]:
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+from fastapi import Header
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.db.routing import CONSISTENCY_TOKEN_HEADER
+from app.infrastructure.db.session import ReadSessionLocal
+
+
+async def get_read_session(
+    consistency_token: str | None = Header(None, alias=CONSISTENCY_TOKEN_HEADER),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session, routed to the replica unless it is behind the caller's last write. Never commits."""
+    async with ReadSessionLocal(consistency_token=consistency_token) as session:
+        yield session
+
+
+async def get_primary_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session pinned to the primary, for reads that repopulate caches invalidated by writes."""
+    async with ReadSessionLocal(use_replica=False) as session:
+        yield session
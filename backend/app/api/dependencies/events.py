@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from app.core.settings import get_settings
+from app.infrastructure.db.session import AsyncSessionLocal
+from app.infrastructure.events.in_memory import InMemoryEventDispatcher
+from app.infrastructure.events.outbox_relay import OutboxRelay
+
+# Subscribers register here; sale events reach them through the outbox once the sale has committed.
+domain_events = InMemoryEventDispatcher()
+
+outbox_relay = OutboxRelay(
+    AsyncSessionLocal,
+    domain_events,
+    batch_size=get_settings().OUTBOX_BATCH_SIZE,
+    interval=get_settings().OUTBOX_RELAY_INTERVAL_SECONDS,
+    max_attempts=get_settings().OUTBOX_MAX_ATTEMPTS,
+    retry_base=get_settings().OUTBOX_RETRY_BASE_SECONDS,
+    retry_max=get_settings().OUTBOX_RETRY_MAX_SECONDS,
+)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -7,15 +9,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
+from app.api.dependencies.auth import admin_action_writer, principal_cache
+from app.api.dependencies.cache import get_redis
+from app.api.dependencies.events import outbox_relay
+from app.api.middleware.consistency import ConsistencyTokenMiddleware
 from app.api.middleware.error_handler import DomainErrorMiddleware
 from app.api.routers import (
     auth_router,
     categories_router,
     customers_router,
+    dashboard_router,
     employees_router,
     inventory_router,
+    metrics_router,
     products_router,
     purchases_router,
+    reports_router,
     returns_router,
     sales_router,
     suppliers_router,
@@ -23,17 +32,45 @@ from app.api.routers import (
 )
 from app.core.logging import configure_logging
 from app.core.settings import get_settings
+from app.infrastructure.cache.principal_invalidation import RedisPrincipalInvalidationBus
+from app.infrastructure.db.maintenance import run_refresh_token_purger
 
 configure_logging()
 settings = get_settings()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # pragma: no cover - minimal hook
-    # Place future startup/shutdown logic here (e.g., warm caches, close resources)
+    # Without Redis each worker only sees its own invalidations; the short TTL covers the rest.
+    redis = await get_redis()
+    listener: asyncio.Task[None] | None = None
+    if redis is not None:
+        bus = RedisPrincipalInvalidationBus(redis, principal_cache)
+        principal_cache.set_broadcaster(bus.publish)
+        listener = asyncio.create_task(bus.listen())
+    await admin_action_writer.start()
+    purger: asyncio.Task[None] | None = None
+    if settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS > 0:
+        purger = asyncio.create_task(run_refresh_token_purger(settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS))
+    if settings.OUTBOX_RELAY_INTERVAL_SECONDS > 0:
+        await outbox_relay.start()
     yield
+    await outbox_relay.stop()
+    await admin_action_writer.stop()
+    if purger is not None:
+        purger.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await purger
+    if listener is not None:
+        principal_cache.set_broadcaster(None)
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+    if redis is not None:
+        await redis.aclose()
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 app.add_middleware(DomainErrorMiddleware)
+app.add_middleware(ConsistencyTokenMiddleware)
 
 if settings.ALLOWED_HOSTS:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
@@ -55,6 +92,7 @@ async def health() -> dict[str, str]:  # pragma: no cover - trivial
 
 app.include_router(products_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(inventory_router.router, prefix=settings.API_V1_PREFIX)
+app.include_router(metrics_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(auth_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(categories_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(sales_router.router, prefix=settings.API_V1_PREFIX)
@@ -62,5 +100,7 @@ app.include_router(customers_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(returns_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(suppliers_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(purchases_router.router, prefix=settings.API_V1_PREFIX)
+app.include_router(reports_router.router, prefix=settings.API_V1_PREFIX)
+app.include_router(dashboard_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(employees_router.router, prefix=settings.API_V1_PREFIX)
 app.include_router(tenants_router.router, prefix=settings.API_V1_PREFIX)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.responses import Response
+
+from app.infrastructure.db.routing import CONSISTENCY_TOKEN_HEADER, start_write_tracking
+
+
+class ConsistencyTokenMiddleware(BaseHTTPMiddleware):
+    """Returns the consistency token of a request's committed write for read-your-writes on replicas."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        tracker = start_write_tracking()
+        response = await call_next(request)
+        if tracker.token is not None:
+            response.headers[CONSISTENCY_TOKEN_HEADER] = tracker.token
+        return response
@@ -6,7 +6,8 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.responses import JSONResponse, Response
 
 from app.core.logging import bind_trace_id, reset_context
-from app.domain.common.errors import DomainError
+from app.domain.common.errors import DomainError, TooManyRequestsError
+from app.infrastructure.db.instrumentation import start_request_timer
 
 logger = structlog.get_logger(__name__)
 
@@ -15,6 +16,7 @@ class DomainErrorMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         trace_id = bind_trace_id()
         request.state.trace_id = trace_id
+        db_timer = start_request_timer()
         try:
             response = await call_next(request)
         except HTTPException:
@@ -23,19 +25,25 @@ class DomainErrorMiddleware(BaseHTTPMiddleware):
         except DomainError as exc:
             logger.warning(
                 "domain_error",
+                **db_timer.log_fields(),
                 trace_id=trace_id,
                 error_code=exc.error_code,
                 message=exc.message,
                 status_code=exc.status_code,
             )
             reset_context()
+            headers = {"X-Trace-Id": trace_id}
+            if isinstance(exc, TooManyRequestsError):
+                headers["Retry-After"] = str(exc.retry_after)
             return JSONResponse(
                 status_code=exc.status_code,
                 content={"detail": exc.message, "code": exc.error_code, "trace_id": trace_id},
-                headers={"X-Trace-Id": trace_id},
+                headers=headers,
             )
         except Exception:  # pragma: no cover - log unexpected
-            logger.exception("unhandled_exception", trace_id=trace_id, path=request.url.path)
+            logger.exception(
+                "unhandled_exception", **db_timer.log_fields(), trace_id=trace_id, path=request.url.path
+            )
             reset_context()
             return JSONResponse(
                 status_code=500,
@@ -43,5 +51,8 @@ class DomainErrorMiddleware(BaseHTTPMiddleware):
                 headers={"X-Trace-Id": trace_id},
             )
         response.headers.setdefault("X-Trace-Id", trace_id)
+        response.headers["Server-Timing"] = (
+            f"db;dur={db_timer.query_seconds * 1000:.2f}, db-wait;dur={db_timer.wait_seconds * 1000:.2f}"
+        )
         reset_context()
         return response
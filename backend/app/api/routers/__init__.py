@@ -2,10 +2,13 @@ from . import (
     auth_router,
     categories_router,
     customers_router,
+    dashboard_router,
     employees_router,
     inventory_router,
+    metrics_router,
     products_router,
     purchases_router,
+    reports_router,
     returns_router,
     sales_router,
     suppliers_router,
@@ -8,8 +8,22 @@ from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies.auth import get_current_user, require_roles
-from app.application.auth.ports import PasswordHasherPort, TokenProviderPort
+from app.api.dependencies.auth import (
+    get_admin_action_sink,
+    get_admin_action_writer,
+    get_current_user,
+    get_login_throttle,
+    get_principal_invalidator,
+    require_roles,
+)
+from app.api.dependencies.database import get_primary_read_session
+from app.application.auth.ports import (
+    AdminActionSinkPort,
+    LoginThrottlePort,
+    PasswordHasherPort,
+    PrincipalCachePort,
+    TokenProviderPort,
+)
 from app.application.auth.use_cases.activate_user import ActivateUserInput, ActivateUserUseCase
 from app.application.auth.use_cases.change_user_role import ChangeUserRoleInput, ChangeUserRoleUseCase
 from app.application.auth.use_cases.create_user import CreateUserInput, CreateUserUseCase
@@ -105,6 +119,10 @@ def get_token_provider() -> TokenProviderPort:
     return TokenProvider(secret=s.JWT_SECRET_KEY, issuer=getattr(s, "JWT_ISSUER", "pos-backend"))
 
 
+def _client_address(request: Request) -> str | None:
+    return request.client.host if request.client else None
+
+
 def _user_to_out(user: User) -> UserOut:
     return UserOut(
         id=user.id,
@@ -136,7 +154,7 @@ def _log_to_out(log: AdminActionLog) -> AdminActionLogOut:
 
 
 async def _record_admin_action(
-    session: AsyncSession,
+    audit: AdminActionSinkPort,
     *,
     actor_user_id: str,
     target_user_id: str | None,
@@ -144,7 +162,7 @@ async def _record_admin_action(
     details: dict[str, Any] | None,
     trace_id: str | None,
 ) -> None:
-    use_case = RecordAdminActionUseCase(AdminActionLogRepository(session))
+    use_case = RecordAdminActionUseCase(audit)
     await use_case.execute(
         RecordAdminActionInput(
             actor_user_id=actor_user_id,
@@ -165,8 +183,10 @@ async def register(req: RegisterRequest, session: AsyncSession = Depends(get_ses
 
 @router.post("/token", response_model=LoginOutput)
 async def login_for_access_token(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     session: AsyncSession = Depends(get_session),
+    throttle: LoginThrottlePort = Depends(get_login_throttle),
 ) -> LoginOutput:
     """
     OAuth2 compatible token login, get an access token for future requests.
@@ -175,21 +195,29 @@ async def login_for_access_token(
     hasher = get_password_hasher()
     token_provider = get_token_provider()
     refresh_repo = RefreshTokenRepository(session)
-    use_case = LoginUseCase(repo, hasher, token_provider, refresh_repo)
+    use_case = LoginUseCase(repo, hasher, token_provider, refresh_repo, throttle)
     
     # Map username to email as our system uses email for login
-    return await use_case.execute(LoginInput(email=form_data.username, password=form_data.password))
+    return await use_case.execute(
+        LoginInput(email=form_data.username, password=form_data.password, client=_client_address(request))
+    )
 
 
 @router.post("/login", response_model=LoginOutput)
-async def login(req: LoginRequest, session: AsyncSession = Depends(get_session)) -> LoginOutput:
+async def login(
+    req: LoginRequest,
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    throttle: LoginThrottlePort = Depends(get_login_throttle),
+) -> LoginOutput:
     use_case = LoginUseCase(
         UserRepository(session),
         get_password_hasher(),
         get_token_provider(),
         RefreshTokenRepository(session),
+        throttle,
     )
-    return await use_case.execute(LoginInput(email=req.email, password=req.password))
+    return await use_case.execute(LoginInput(email=req.email, password=req.password, client=_client_address(request)))
 
 
 @router.post("/refresh", response_model=LoginOutput)
@@ -230,14 +258,16 @@ async def deactivate_user(
     payload: UserVersionRequest,
     request: Request,
     session: AsyncSession = Depends(get_session),
+    principals: PrincipalCachePort = Depends(get_principal_invalidator),
     current_admin: User = Depends(require_roles(*ADMIN_ROLES)),
+    audit: AdminActionSinkPort = Depends(get_admin_action_sink),
 ) -> UserOut:
-    use_case = DeactivateUserUseCase(UserRepository(session))
+    use_case = DeactivateUserUseCase(UserRepository(session), principals)
     user = await use_case.execute(
         DeactivateUserInput(user_id=user_id, expected_version=payload.expected_version)
     )
     await _record_admin_action(
-        session,
+        audit,
         actor_user_id=current_admin.id,
         target_user_id=user.id,
         action="user.deactivate",
@@ -256,14 +286,16 @@ async def activate_user(
     payload: UserVersionRequest,
     request: Request,
     session: AsyncSession = Depends(get_session),
+    principals: PrincipalCachePort = Depends(get_principal_invalidator),
     current_admin: User = Depends(require_roles(*ADMIN_ROLES)),
+    audit: AdminActionSinkPort = Depends(get_admin_action_sink),
 ) -> UserOut:
-    use_case = ActivateUserUseCase(UserRepository(session))
+    use_case = ActivateUserUseCase(UserRepository(session), principals)
     user = await use_case.execute(
         ActivateUserInput(user_id=user_id, expected_version=payload.expected_version)
     )
     await _record_admin_action(
-        session,
+        audit,
         actor_user_id=current_admin.id,
         target_user_id=user.id,
         action="user.activate",
@@ -282,9 +314,11 @@ async def change_user_role(
     payload: ChangeRoleRequest,
     request: Request,
     session: AsyncSession = Depends(get_session),
+    principals: PrincipalCachePort = Depends(get_principal_invalidator),
     current_admin: User = Depends(require_roles(*ADMIN_ROLES)),
+    audit: AdminActionSinkPort = Depends(get_admin_action_sink),
 ) -> UserOut:
-    use_case = ChangeUserRoleUseCase(UserRepository(session))
+    use_case = ChangeUserRoleUseCase(UserRepository(session), principals)
     user = await use_case.execute(
         ChangeUserRoleInput(
             user_id=user_id,
@@ -293,7 +327,7 @@ async def change_user_role(
         )
     )
     await _record_admin_action(
-        session,
+        audit,
         actor_user_id=current_admin.id,
         target_user_id=user.id,
         action="user.change_role",
@@ -312,9 +346,11 @@ async def reset_user_password(
     payload: ResetPasswordRequest,
     request: Request,
     session: AsyncSession = Depends(get_session),
+    principals: PrincipalCachePort = Depends(get_principal_invalidator),
     current_admin: User = Depends(require_roles(*ADMIN_ROLES)),
+    audit: AdminActionSinkPort = Depends(get_admin_action_sink),
 ) -> UserOut:
-    use_case = ResetUserPasswordUseCase(UserRepository(session), get_password_hasher())
+    use_case = ResetUserPasswordUseCase(UserRepository(session), get_password_hasher(), principals)
     user = await use_case.execute(
         ResetUserPasswordInput(
             user_id=user_id,
@@ -323,7 +359,7 @@ async def reset_user_password(
         )
     )
     await _record_admin_action(
-        session,
+        audit,
         actor_user_id=current_admin.id,
         target_user_id=user.id,
         action="user.reset_password",
@@ -338,7 +374,7 @@ async def reset_user_password(
 
 @router.get("/users", response_model=Page)
 async def list_users(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     _: User = Depends(require_roles(*ADMIN_ROLES)),
     page: int = Query(1, ge=1),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
@@ -362,7 +398,8 @@ async def list_users(
 
 @router.get("/admin-actions", response_model=Page)
 async def list_admin_actions(
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
+    audit: AdminActionSinkPort = Depends(get_admin_action_writer),
     _: User = Depends(require_roles(*ADMIN_ROLES)),
     page: int = Query(1, ge=1),
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
@@ -373,7 +410,7 @@ async def list_admin_actions(
     end: datetime | None = None,
 ) -> Page:
     params = PageParams(page=page, limit=limit)
-    use_case = ListAdminActionsUseCase(AdminActionLogRepository(session))
+    use_case = ListAdminActionsUseCase(AdminActionLogRepository(session), audit)
     normalized_start = _normalize_datetime(start)
     normalized_end = _normalize_datetime(end)
     result = await use_case.execute(
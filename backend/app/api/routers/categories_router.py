@@ -14,6 +14,7 @@ from app.application.catalog.use_cases.create_category import (
 from app.application.catalog.use_cases.list_categories import ListCategoriesInput, ListCategoriesUseCase
 from app.domain.auth.entities import User
 from app.infrastructure.db.repositories.category_repository import SqlAlchemyCategoryRepository
+from app.api.dependencies.database import get_primary_read_session
 from app.infrastructure.db.session import get_session
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -43,7 +44,7 @@ async def list_categories(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, min_length=1),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     cache: CacheService = Depends(get_cache_service),
     _: User = Depends(require_roles(*ALL_AUTHENTICATED_ROLES)),
 ) -> CategoryListOut:
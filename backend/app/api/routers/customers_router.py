@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import SALES_ROLES, require_roles
+from app.api.dependencies.database import get_read_session
 from app.api.schemas.customer import (
     CustomerCreate,
     CustomerDeactivate,
@@ -13,6 +14,8 @@ from app.api.schemas.customer import (
     CustomerPageMetaOut,
     CustomerSaleOut,
     CustomerSalesListOut,
+    CustomerSummaryListItemOut,
+    CustomerSummaryListOut,
     CustomerSummaryOut,
     CustomerUpdate,
 )
@@ -22,6 +25,10 @@ from app.application.customers.use_cases.deactivate_customer import (
 )
 from app.application.customers.use_cases.get_customer import GetCustomerInput, GetCustomerUseCase
 from app.application.customers.use_cases.get_customer_summary import GetCustomerSummaryUseCase
+from app.application.customers.use_cases.list_customer_summaries import (
+    ListCustomerSummariesInput,
+    ListCustomerSummariesUseCase,
+)
 from app.application.customers.use_cases.list_customers import (
     ListCustomersInput,
     ListCustomersUseCase,
@@ -40,6 +47,8 @@ from app.application.sales.use_cases.list_customer_sales import (
 )
 from app.domain.auth.entities import User, UserRole
 from app.domain.common.errors import ValidationError
+from app.infrastructure.db.queries.customer_summary_query_service import SqlAlchemyCustomerSummaryQueryService
+from app.infrastructure.db.queries.sales_query_service import SqlAlchemySalesQueryService
 from app.infrastructure.db.repositories.customer_repository import SqlAlchemyCustomerRepository
 from app.infrastructure.db.repositories.sales_repository import SqlAlchemySalesRepository
 from app.infrastructure.db.session import get_session
@@ -66,10 +75,28 @@ async def register_customer(
     return CustomerDetailOut.from_domain(customer)
 
 
+@router.get("/summaries", response_model=CustomerSummaryListOut)
+async def list_customer_summaries(
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    search: str | None = Query(None, min_length=1),
+    active: bool | None = Query(None),
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
+) -> CustomerSummaryListOut:
+    use_case = ListCustomerSummariesUseCase(SqlAlchemyCustomerSummaryQueryService(session))
+    result = await use_case.execute(
+        ListCustomerSummariesInput(page=page, limit=limit, search=search, active=active)
+    )
+    items = [CustomerSummaryListItemOut.from_entry(entry) for entry in result.items]
+    meta = CustomerPageMetaOut(page=result.page, limit=result.limit, total=result.total, pages=result.pages)
+    return CustomerSummaryListOut(items=items, meta=meta)
+
+
 @router.get("/{customer_id}", response_model=CustomerDetailOut)
 async def get_customer(
     customer_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> CustomerDetailOut:
     repo = SqlAlchemyCustomerRepository(session)
@@ -115,7 +142,7 @@ async def list_customers(
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, min_length=1),
     active: bool | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> CustomerListOut:
     repo = SqlAlchemyCustomerRepository(session)
@@ -158,16 +185,16 @@ async def list_customer_sales(
     customer_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> CustomerSalesListOut:
     customer_repo = SqlAlchemyCustomerRepository(session)
-    sales_repo = SqlAlchemySalesRepository(session)
-    use_case = ListCustomerSalesUseCase(sales_repo, customer_repo)
+    sales_queries = SqlAlchemySalesQueryService(session)
+    use_case = ListCustomerSalesUseCase(sales_queries, customer_repo)
     result = await use_case.execute(
         ListCustomerSalesInput(customer_id=customer_id, page=page, limit=limit)
     )
-    items = [CustomerSaleOut.from_domain(sale) for sale in result.sales]
+    items = [CustomerSaleOut.from_read_model(sale) for sale in result.sales]
     meta = CustomerPageMetaOut(page=result.page, limit=result.limit, total=result.total, pages=result.pages)
     return CustomerSalesListOut(items=items, meta=meta)
 
@@ -175,7 +202,7 @@ async def list_customer_sales(
 @router.get("/{customer_id}/summary", response_model=CustomerSummaryOut)
 async def get_customer_summary(
     customer_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> CustomerSummaryOut:
     customer_repo = SqlAlchemyCustomerRepository(session)
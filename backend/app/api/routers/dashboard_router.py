@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import SALES_ROLES, require_roles
+from app.api.dependencies.cache import get_cache_service
+from app.api.dependencies.database import get_read_session
+from app.api.schemas.dashboard import DashboardSummaryOut
+from app.application.common.cache import CacheService
+from app.application.dashboard.use_cases.get_dashboard_summary import (
+    GetDashboardSummaryInput,
+    GetDashboardSummaryUseCase,
+)
+from app.domain.auth.entities import User, UserRole
+from app.infrastructure.db.queries.dashboard_query_service import SqlAlchemyDashboardQueryService
+
+DASHBOARD_CACHE_TTL_SECONDS = 30
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("/summary", response_model=DashboardSummaryOut)
+async def get_dashboard_summary(
+    days: int = Query(30, ge=1, le=366),
+    recent_limit: int = Query(5, ge=0, le=20),
+    session: AsyncSession = Depends(get_read_session),
+    cache: CacheService = Depends(get_cache_service),
+    _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
+) -> Any:
+    # Business data is not partitioned by tenant in this schema, so one entry per
+    # (day, window) serves every user of the deployment; the date rolls the key at midnight UTC.
+    cache_key = f"dashboard:summary:{datetime.now(UTC).date()}:{days}:{recent_limit}"
+    cached = await cache.get(cache_key)
+    if cached:
+        return cached
+
+    dashboard_queries = SqlAlchemyDashboardQueryService(session)
+    use_case = GetDashboardSummaryUseCase(dashboard_queries)
+    summary = await use_case.execute(GetDashboardSummaryInput(days=days, recent_limit=recent_limit))
+    payload = DashboardSummaryOut.from_read_model(summary).model_dump(mode="json")
+    await cache.set(cache_key, payload, ttl=DASHBOARD_CACHE_TTL_SECONDS)
+    return payload
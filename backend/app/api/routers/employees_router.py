@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import ADMIN_ROLE, MANAGEMENT_ROLES, require_roles
+from app.api.dependencies.database import get_read_session
 from app.infrastructure.db.session import get_session
 from app.shared.pagination import Page, PageParams
 from app.api.schemas.employee import (
@@ -85,7 +86,7 @@ async def list_employees(
     limit: int = Query(20, ge=1, le=100),
     active: bool | None = None,
     search: str | None = None,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*MANAGEMENT_ROLES)),
 ) -> Any:
     repo = SqlAlchemyEmployeeRepository(session)
@@ -98,7 +99,7 @@ async def list_employees(
 @router.get("/{employee_id}", response_model=EmployeeOut)
 async def get_employee(
     employee_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*MANAGEMENT_ROLES)),
 ) -> EmployeeOut:
     repo = SqlAlchemyEmployeeRepository(session)
@@ -198,7 +199,7 @@ async def give_bonus(
 @router.get("/{employee_id}/financial-history", response_model=dict[str, Any])
 async def get_financial_history(
     employee_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*MANAGEMENT_ROLES)),
 ) -> dict[str, Any]:
     repo = SqlAlchemyEmployeeRepository(session)
@@ -1,25 +1,44 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import INVENTORY_ROLES, require_roles
 from app.api.dependencies.cache import get_cache_service
 from app.application.common.cache import CacheService
 from app.api.schemas.inventory import InventoryMovementCreate, InventoryMovementRecordOut
+from app.application.inventory.services.stock_cache import StockLevelCache
 from app.application.inventory.use_cases.record_inventory_movement import (
     RecordInventoryMovementInput,
     RecordInventoryMovementUseCase,
 )
 from app.domain.auth.entities import User
+from app.domain.common.errors import ValidationError
+from app.infrastructure.db.queries.inventory_query_service import SqlAlchemyInventoryQueryService
 from app.infrastructure.db.repositories.inventory_movement_repository import (
     SqlAlchemyInventoryMovementRepository,
 )
 from app.infrastructure.db.repositories.inventory_repository import SqlAlchemyProductRepository
-from app.infrastructure.db.session import get_session
+from app.infrastructure.db.post_commit import call_after_commit
+from app.infrastructure.db.session import ReadSessionLocal, get_session
+from app.shared.export import EXPORT_MEDIA_TYPES, ExportFormat, encode_rows, export_headers, export_rows
 
 router = APIRouter(prefix="/inventory", tags=["inventory"])
 
+MOVEMENT_EXPORT_FIELDS = (
+    "id",
+    "product_id",
+    "direction",
+    "quantity",
+    "reason",
+    "reference",
+    "occurred_at",
+    "created_at",
+)
+
 @router.post("/products/{product_id}/movements", response_model=InventoryMovementRecordOut, status_code=status.HTTP_201_CREATED)
 async def record_movement(
     product_id: str,
@@ -42,8 +61,32 @@ async def record_movement(
             occurred_at=payload.occurred_at,
         )
     )
-    await cache.clear_prefix("products:list")
+    stock = StockLevelCache(cache, inventory_repo)
+    call_after_commit(session, lambda: stock.invalidate([product_id]))
     return InventoryMovementRecordOut(
         movement=result.movement,
         stock=result.stock_level
     )
+
+
+@router.get("/movements/export", response_class=StreamingResponse)
+async def export_movements(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    product_id: str | None = Query(None, min_length=1, max_length=26),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    _: User = Depends(require_roles(*INVENTORY_ROLES)),
+) -> StreamingResponse:
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise ValidationError("date_from must be before or equal to date_to")
+
+    rows = export_rows(
+        ReadSessionLocal,
+        SqlAlchemyInventoryQueryService,
+        lambda queries: queries.iter_movements(product_id=product_id, date_from=date_from, date_to=date_to),
+    )
+    return StreamingResponse(
+        encode_rows(rows, MOVEMENT_EXPORT_FIELDS, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("inventory-movements", export_format),
+    )
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies.auth import ADMIN_ROLE, require_roles
+from app.core.metrics import metrics
+from app.domain.auth.entities import User
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("")
+async def get_metrics(_: User = Depends(require_roles(*ADMIN_ROLE))) -> dict[str, Any]:
+    """Counters, gauges and timings collected by this worker process."""
+    return metrics.snapshot()
@@ -27,7 +27,15 @@ from app.api.schemas.inventory import (
     InventoryMovementRecordOut,
     StockLevelOut,
 )
-from app.api.schemas.product import ProductCreate, ProductDeactivate, ProductOut, ProductUpdate
+from app.api.schemas.product import (
+    ProductBulkUpdate,
+    ProductBulkUpdateErrorOut,
+    ProductBulkUpdateOut,
+    ProductCreate,
+    ProductDeactivate,
+    ProductOut,
+    ProductUpdate,
+)
 from app.api.schemas.product_import import (
     ProductImportItemOut,
     ProductImportJobDetailOut,
@@ -38,6 +46,10 @@ from app.api.schemas.product_import import (
     ProductImportJobStatusOut,
 )
 from app.application.catalog.services.import_scheduler import ImmediateImportScheduler
+from app.application.catalog.use_cases.bulk_update_products import (
+    BulkUpdateProductsInput,
+    BulkUpdateProductsUseCase,
+)
 from app.application.catalog.use_cases.create_product import (
     CreateProductInput,
     CreateProductUseCase,
@@ -80,6 +92,7 @@ from app.application.catalog.use_cases.update_product import (
     UpdateProductInput,
     UpdateProductUseCase,
 )
+from app.application.inventory.services.stock_cache import StockLevelCache
 from app.application.inventory.use_cases.get_product_stock import (
     GetProductStockInput,
     GetProductStockUseCase,
@@ -95,6 +108,7 @@ from app.application.inventory.use_cases.record_inventory_movement import (
 from app.domain.auth.entities import User
 from app.domain.catalog.import_job import ImportStatus
 from app.domain.common.errors import ValidationError
+from app.infrastructure.db.queries.product_query_service import SqlAlchemyProductQueryService
 from app.infrastructure.db.repositories.category_repository import SqlAlchemyCategoryRepository
 from app.infrastructure.db.repositories.inventory_movement_repository import (
     SqlAlchemyInventoryMovementRepository,
@@ -103,11 +117,25 @@ from app.infrastructure.db.repositories.inventory_repository import SqlAlchemyPr
 from app.infrastructure.db.repositories.product_import_repository import (
     SqlAlchemyProductImportJobRepository,
 )
-from app.infrastructure.db.session import get_session
+from app.api.dependencies.database import get_primary_read_session, get_read_session
+from app.infrastructure.db.post_commit import call_after_commit
+from app.infrastructure.db.session import ReadSessionLocal, get_session
+from app.shared.export import EXPORT_MEDIA_TYPES, ExportFormat, encode_rows, export_headers, export_rows
 from app.shared.pagination import Page, PageParams
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+PRODUCT_EXPORT_FIELDS = (
+    "id",
+    "sku",
+    "name",
+    "retail_price",
+    "purchase_price",
+    "category_id",
+    "active",
+    "version",
+)
+
 
 @router.post("", response_model=ProductOut, status_code=status.HTTP_201_CREATED)
 async def create_product(
@@ -188,6 +216,55 @@ async def update_product(
     )
 
 
+@router.post("/bulk-update", response_model=ProductBulkUpdateOut)
+async def bulk_update_products(
+    payload: ProductBulkUpdate,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache_service),
+    _: User = Depends(require_roles(*MANAGEMENT_ROLES)),
+) -> ProductBulkUpdateOut:
+    items: list[UpdateProductInput] = []
+    for item in payload.items:
+        provided = _field_set(item)
+        items.append(
+            UpdateProductInput(
+                product_id=item.id,
+                expected_version=item.expected_version,
+                name=item.name if "name" in provided else None,
+                retail_price=item.retail_price if "retail_price" in provided else None,
+                purchase_price=item.purchase_price if "purchase_price" in provided else None,
+                category_id=item.category_id if "category_id" in provided else None,
+                category_id_provided="category_id" in provided,
+            )
+        )
+
+    repo = SqlAlchemyProductRepository(session)
+    use_case = BulkUpdateProductsUseCase(repo)
+    result = await use_case.execute(BulkUpdateProductsInput(items=items))
+    if result.updated:
+        await cache.clear_prefix("products:list")
+    return ProductBulkUpdateOut(
+        updated=[
+            ProductOut(
+                id=product.id,
+                name=product.name,
+                sku=product.sku,
+                retail_price=product.price_retail.amount,
+                purchase_price=product.purchase_price.amount,
+                category_id=product.category_id,
+                active=product.active,
+                version=product.version,
+            )
+            for product in result.updated
+        ],
+        unchanged=result.unchanged,
+        errors=[
+            ProductBulkUpdateErrorOut(product_id=error.product_id, code=error.code, detail=error.message)
+            for error in result.errors
+        ],
+    )
+
+
 @router.post("/{product_id}/deactivate", response_model=ProductOut)
 async def deactivate_product(
     product_id: str,
@@ -228,55 +305,76 @@ async def list_products(
     max_price: Decimal | None = Query(None, ge=0),
     sort_by: str = Query("created_at"),
     sort_direction: str = Query("desc"),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     cache: CacheService = Depends(get_cache_service),
     _: User = Depends(require_roles(*SALES_ROLES)),
 ) -> dict[str, Any]:
     cache_key = f"products:list:{page}:{limit}:{search}:{category_id}:{active}:{min_price}:{max_price}:{sort_by}:{sort_direction}"
-    cached = await cache.get(cache_key)
-    if cached:
-        return cached
-
-    params = PageParams(page=page, limit=limit)
-    repo = SqlAlchemyProductRepository(session)
-    use_case = ListProductsUseCase(repo)
-    result = await use_case.execute(
-        ListProductsInput(
-            page=params.page,
-            limit=params.limit,
-            search=search,
-            category_id=category_id,
-            active=active,
-            min_price=min_price,
-            max_price=max_price,
-            sort_by=sort_by,
-            sort_direction=sort_direction,
+    catalog_page = await cache.get(cache_key)
+    if not catalog_page:
+        params = PageParams(page=page, limit=limit)
+        queries = SqlAlchemyProductQueryService(session)
+        use_case = ListProductsUseCase(queries)
+        result = await use_case.execute(
+            ListProductsInput(
+                page=params.page,
+                limit=params.limit,
+                search=search,
+                category_id=category_id,
+                active=active,
+                min_price=min_price,
+                max_price=max_price,
+                sort_by=sort_by,
+                sort_direction=sort_direction,
+            )
         )
-    )
+        items = [
+            {
+                "id": p.id,
+                "name": p.name,
+                "sku": p.sku,
+                "retail_price": str(p.retail_price),
+                "purchase_price": str(p.purchase_price),
+                "category_id": p.category_id,
+                "active": p.active,
+                "version": p.version,
+            }
+            for p in result.products
+        ]
+        page_obj = Page.build(items, result.total, params)
+        catalog_page = {"items": page_obj.items, "meta": page_obj.meta.model_dump()}
+        await cache.set(cache_key, catalog_page, ttl=300)
+
+    # Stock changes on every sale, so it is overlaid per product instead of living in the page entry.
+    stock_cache = StockLevelCache(cache, SqlAlchemyInventoryMovementRepository(session))
+    stock_levels = await stock_cache.get_levels([item["id"] for item in catalog_page["items"]])
+    return {
+        "items": [
+            {**item, "stock_quantity": stock_levels.get(item["id"], 0)}
+            for item in catalog_page["items"]
+        ],
+        "meta": catalog_page["meta"],
+    }
 
-    # Fetch stock levels
-    inventory_repo = SqlAlchemyInventoryMovementRepository(session)
-    product_ids = [p.id for p in result.products]
-    stock_levels = await inventory_repo.get_stock_levels(product_ids)
-
-    items = [
-        {
-            "id": p.id,
-            "name": p.name,
-            "sku": p.sku,
-            "retail_price": str(p.price_retail.amount),
-            "purchase_price": str(p.purchase_price.amount),
-            "category_id": p.category_id,
-            "active": p.active,
-            "version": p.version,
-            "stock_quantity": stock_levels.get(p.id, 0),
-        }
-        for p in result.products
-    ]
-    page_obj = Page.build(items, result.total, params)
-    response = {"items": page_obj.items, "meta": page_obj.meta.model_dump()}
-    await cache.set(cache_key, response, ttl=300)
-    return response
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_products(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    search: str | None = None,
+    category_id: str | None = None,
+    active: bool | None = None,
+    _: User = Depends(require_roles(*INVENTORY_ROLES)),
+) -> StreamingResponse:
+    rows = export_rows(
+        ReadSessionLocal,
+        SqlAlchemyProductQueryService,
+        lambda queries: queries.iter_products(search=search, category_id=category_id, active=active),
+    )
+    return StreamingResponse(
+        encode_rows(rows, PRODUCT_EXPORT_FIELDS, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("products", export_format),
+    )
 
 
 @router.post("/import", response_model=ProductImportJobOut, status_code=status.HTTP_202_ACCEPTED)
@@ -310,6 +408,7 @@ async def record_inventory_movement(
     product_id: str,
     payload: InventoryMovementCreate,
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache_service),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> InventoryMovementRecordOut:
     product_repo = SqlAlchemyProductRepository(session)
@@ -325,6 +424,8 @@ async def record_inventory_movement(
             occurred_at=payload.occurred_at,
         )
     )
+    stock = StockLevelCache(cache, inventory_repo)
+    call_after_commit(session, lambda: stock.invalidate([product_id]))
     movement_out = InventoryMovementOut.model_validate(result.movement)
     stock_out = StockLevelOut.model_validate(result.stock_level)
     return InventoryMovementRecordOut(movement=movement_out, stock=stock_out)
@@ -335,7 +436,7 @@ async def list_inventory_movements(
     product_id: str,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> InventoryMovementListOut:
     params = PageParams(page=page, limit=limit)
@@ -363,7 +464,7 @@ async def list_inventory_movements(
 async def get_product_stock(
     product_id: str,
     as_of: datetime | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*SALES_ROLES)),
 ) -> StockLevelOut:
     product_repo = SqlAlchemyProductRepository(session)
@@ -378,7 +479,7 @@ async def list_product_import_jobs(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status: ImportStatus | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> ProductImportJobListOut:
     params = PageParams(page=page, limit=limit)
@@ -396,7 +497,7 @@ async def list_product_import_jobs(
 @router.get("/import/status", response_model=ProductImportJobStatusOut)
 async def get_product_import_status(
     limit: int = Query(5, ge=0, le=50),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> ProductImportJobStatusOut:
     repo = SqlAlchemyProductImportJobRepository(session)
@@ -455,7 +556,7 @@ async def stream_product_import_status(
 @router.get("/import/{job_id}", response_model=ProductImportJobOut)
 async def get_product_import_job(
     job_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> ProductImportJobOut:
     repo = SqlAlchemyProductImportJobRepository(session)
@@ -470,7 +571,7 @@ async def get_product_import_job_items(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status: ImportStatus | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_primary_read_session),
     _: User = Depends(require_roles(*INVENTORY_ROLES)),
 ) -> ProductImportJobDetailOut:
     repo = SqlAlchemyProductImportJobRepository(session)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import AUDIT_ROLES, PURCHASING_ROLES, require_roles
+from app.api.dependencies.cache import get_cache_service
+from app.api.dependencies.database import get_read_session
 from app.api.schemas.purchases import (
     PurchaseCreate,
     PurchaseListOut,
@@ -11,6 +15,8 @@ from app.api.schemas.purchases import (
     PurchasePageMetaOut,
     PurchaseRecordOut,
 )
+from app.application.common.cache import CacheService
+from app.application.inventory.services.stock_cache import StockLevelCache
 from app.application.purchases.use_cases.get_purchase import GetPurchaseInput, GetPurchaseUseCase
 from app.application.purchases.use_cases.list_purchases import (
     ListPurchasesInput,
@@ -22,12 +28,14 @@ from app.application.purchases.use_cases.record_purchase import (
     RecordPurchaseUseCase,
 )
 from app.domain.auth.entities import User, UserRole
+from app.infrastructure.db.queries.purchases_query_service import SqlAlchemyPurchasesQueryService
 from app.infrastructure.db.repositories.inventory_movement_repository import (
     SqlAlchemyInventoryMovementRepository,
 )
 from app.infrastructure.db.repositories.inventory_repository import SqlAlchemyProductRepository
 from app.infrastructure.db.repositories.purchase_repository import SqlAlchemyPurchaseRepository
 from app.infrastructure.db.repositories.supplier_repository import SqlAlchemySupplierRepository
+from app.infrastructure.db.retry import run_transaction
 from app.infrastructure.db.session import get_session
 from app.shared.pagination import PageParams
 
@@ -40,6 +48,7 @@ router = APIRouter(prefix="/purchases", tags=["purchases"])
 async def record_purchase(
     payload: PurchaseCreate,
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache_service),
     _: User = Depends(require_roles(*PURCHASING_ROLES)),
 ) -> PurchaseRecordOut:
     supplier_repo = SqlAlchemySupplierRepository(session)
@@ -47,20 +56,20 @@ async def record_purchase(
     purchase_repo = SqlAlchemyPurchaseRepository(session)
     inventory_repo = SqlAlchemyInventoryMovementRepository(session)
     use_case = RecordPurchaseUseCase(supplier_repo, product_repo, purchase_repo, inventory_repo)
-    result = await use_case.execute(
-        RecordPurchaseInput(
-            supplier_id=payload.supplier_id,
-            currency=payload.currency,
-            lines=[
-                PurchaseLineInput(
-                    product_id=line.product_id,
-                    quantity=line.quantity,
-                    unit_cost=line.unit_cost,
-                )
-                for line in payload.lines
-            ],
-        )
+    data = RecordPurchaseInput(
+        supplier_id=payload.supplier_id,
+        currency=payload.currency,
+        lines=[
+            PurchaseLineInput(
+                product_id=line.product_id,
+                quantity=line.quantity,
+                unit_cost=line.unit_cost,
+            )
+            for line in payload.lines
+        ],
     )
+    result = await run_transaction(session, lambda: use_case.execute(data), operation="purchase")
+    await StockLevelCache(cache, inventory_repo).invalidate(movement.product_id for movement in result.movements)
     return PurchaseRecordOut.build(result.purchase, result.movements)
 
 
@@ -69,20 +78,22 @@ async def list_purchases(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     supplier_id: str | None = Query(None, min_length=1, max_length=26),
-    session: AsyncSession = Depends(get_session),
+    include: Literal["items"] | None = Query(None),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*READ_PURCHASING_ROLES)),
 ) -> PurchaseListOut:
     params = PageParams(page=page, limit=limit)
-    purchase_repo = SqlAlchemyPurchaseRepository(session)
-    use_case = ListPurchasesUseCase(purchase_repo)
+    purchase_queries = SqlAlchemyPurchasesQueryService(session)
+    use_case = ListPurchasesUseCase(purchase_queries)
     result = await use_case.execute(
         ListPurchasesInput(
             page=params.page,
             limit=params.limit,
             supplier_id=supplier_id,
+            include_items=include == "items",
         )
     )
-    items = [PurchaseOut.from_domain(purchase) for purchase in result.purchases]
+    items = [PurchaseOut.from_read_model(purchase) for purchase in result.purchases]
     meta = PurchasePageMetaOut(
         page=result.page,
         limit=result.limit,
@@ -95,7 +106,7 @@ async def list_purchases(
 @router.get("/{purchase_id}", response_model=PurchaseOut)
 async def get_purchase(
     purchase_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*READ_PURCHASING_ROLES)),
 ) -> PurchaseOut:
     purchase_repo = SqlAlchemyPurchaseRepository(session)
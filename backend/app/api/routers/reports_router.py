@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies.auth import AUDIT_ROLES, require_roles
+from app.api.dependencies.database import get_read_session
+from app.api.schemas.reports import DailySalesOut, DailySalesReportOut
+from app.application.sales.use_cases.get_daily_sales_report import (
+    GetDailySalesReportInput,
+    GetDailySalesReportUseCase,
+)
+from app.domain.auth.entities import User
+from app.infrastructure.db.queries.sales_report_query_service import SqlAlchemySalesReportQueryService
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/sales/daily", response_model=DailySalesReportOut)
+async def get_daily_sales_report(
+    date_from: date = Query(...),
+    date_to: date = Query(...),
+    product_id: str | None = Query(None, min_length=1, max_length=26),
+    customer_id: str | None = Query(None, min_length=1, max_length=26),
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(require_roles(*AUDIT_ROLES)),
+) -> DailySalesReportOut:
+    report_queries = SqlAlchemySalesReportQueryService(session)
+    use_case = GetDailySalesReportUseCase(report_queries)
+    rows = await use_case.execute(
+        GetDailySalesReportInput(
+            date_from=date_from,
+            date_to=date_to,
+            product_id=product_id,
+            customer_id=customer_id,
+        )
+    )
+    return DailySalesReportOut(
+        date_from=date_from,
+        date_to=date_to,
+        items=[DailySalesOut.from_read_model(row) for row in rows],
+    )
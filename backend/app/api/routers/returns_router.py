@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import RETURNS_ROLES, require_roles
+from app.api.dependencies.cache import get_cache_service
+from app.api.dependencies.database import get_read_session
 from app.api.schemas.returns import (
     ReturnCreate,
     ReturnListOut,
@@ -14,6 +17,8 @@ from app.api.schemas.returns import (
     ReturnRecordOut,
     ReturnSummaryOut,
 )
+from app.application.common.cache import CacheService
+from app.application.inventory.services.stock_cache import StockLevelCache
 from app.application.returns.use_cases.get_return import GetReturnInput, GetReturnUseCase
 from app.application.returns.use_cases.list_returns import ListReturnsInput, ListReturnsUseCase
 from app.application.returns.use_cases.record_return import (
@@ -22,11 +27,13 @@ from app.application.returns.use_cases.record_return import (
     ReturnLineInput,
 )
 from app.domain.auth.entities import User
+from app.infrastructure.db.queries.returns_query_service import SqlAlchemyReturnsQueryService
 from app.infrastructure.db.repositories.inventory_movement_repository import (
     SqlAlchemyInventoryMovementRepository,
 )
 from app.infrastructure.db.repositories.returns_repository import SqlAlchemyReturnsRepository
 from app.infrastructure.db.repositories.sales_repository import SqlAlchemySalesRepository
+from app.infrastructure.db.retry import run_transaction
 from app.infrastructure.db.session import get_session
 
 router = APIRouter(prefix="/returns", tags=["returns"])
@@ -39,11 +46,12 @@ async def list_returns(
     sale_id: str | None = Query(None, min_length=1, max_length=26),
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    include: Literal["items"] | None = Query(None),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*RETURNS_ROLES)),
 ) -> ReturnListOut:
-    returns_repo = SqlAlchemyReturnsRepository(session)
-    use_case = ListReturnsUseCase(returns_repo)
+    returns_queries = SqlAlchemyReturnsQueryService(session)
+    use_case = ListReturnsUseCase(returns_queries)
     result = await use_case.execute(
         ListReturnsInput(
             page=page,
@@ -51,9 +59,10 @@ async def list_returns(
             sale_id=sale_id,
             date_from=date_from,
             date_to=date_to,
+            include_items=include == "items",
         )
     )
-    items = [ReturnSummaryOut.from_domain(return_) for return_ in result.returns]
+    items = [ReturnSummaryOut.from_read_model(return_) for return_ in result.returns]
     meta = ReturnPageMetaOut(page=result.page, limit=result.limit, total=result.total, pages=result.pages)
     return ReturnListOut(items=items, meta=meta)
 
@@ -62,31 +71,32 @@ async def list_returns(
 async def record_return(
     payload: ReturnCreate,
     session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache_service),
     _: User = Depends(require_roles(*RETURNS_ROLES)),
 ) -> ReturnRecordOut:
     sales_repo = SqlAlchemySalesRepository(session)
     returns_repo = SqlAlchemyReturnsRepository(session)
     inventory_repo = SqlAlchemyInventoryMovementRepository(session)
     use_case = RecordReturnUseCase(sales_repo, returns_repo, inventory_repo)
-    result = await use_case.execute(
-        RecordReturnInput(
-            sale_id=payload.sale_id,
-            lines=[
-                ReturnLineInput(
-                    sale_item_id=line.sale_item_id,
-                    quantity=line.quantity,
-                )
-                for line in payload.lines
-            ],
-        )
+    data = RecordReturnInput(
+        sale_id=payload.sale_id,
+        lines=[
+            ReturnLineInput(
+                sale_item_id=line.sale_item_id,
+                quantity=line.quantity,
+            )
+            for line in payload.lines
+        ],
     )
+    result = await run_transaction(session, lambda: use_case.execute(data), operation="return")
+    await StockLevelCache(cache, inventory_repo).invalidate(movement.product_id for movement in result.movements)
     return ReturnRecordOut.build(result.return_, result.movements)
 
 
 @router.get("/{return_id}", response_model=ReturnOut)
 async def get_return(
     return_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*RETURNS_ROLES)),
 ) -> ReturnOut:
     returns_repo = SqlAlchemyReturnsRepository(session)
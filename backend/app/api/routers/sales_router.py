@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import SALES_ROLES, require_roles
 from app.api.dependencies.cache import get_cache_service
 from app.application.common.cache import CacheService
-from app.api.schemas.sale import SaleCreate, SaleListOut, SaleOut, SalePageMetaOut, SaleRecordOut
+from app.api.schemas.sale import (
+    SaleBatchCreate,
+    SaleBatchOut,
+    SaleCreate,
+    SaleListOut,
+    SaleOut,
+    SalePageMetaOut,
+    SaleRecordOut,
+)
+from app.application.inventory.services.stock_cache import StockLevelCache
 from app.application.sales.use_cases.get_sale import GetSaleInput, GetSaleUseCase
 from app.application.sales.use_cases.list_sales import ListSalesInput, ListSalesUseCase
 from app.application.sales.use_cases.record_sale import (
@@ -17,17 +28,32 @@ from app.application.sales.use_cases.record_sale import (
     SaleLineInput,
 )
 from app.domain.auth.entities import User, UserRole
+from app.domain.common.errors import ValidationError
+from app.infrastructure.db.queries.sales_query_service import SqlAlchemySalesQueryService
 from app.infrastructure.db.repositories.customer_repository import SqlAlchemyCustomerRepository
 from app.infrastructure.db.repositories.inventory_movement_repository import (
     SqlAlchemyInventoryMovementRepository,
 )
 from app.infrastructure.db.repositories.inventory_repository import SqlAlchemyProductRepository
+from app.infrastructure.db.repositories.outbox_repository import SqlAlchemyOutboxRepository
 from app.infrastructure.db.repositories.sales_repository import SqlAlchemySalesRepository
-from app.infrastructure.db.repositories.returns_repository import SqlAlchemyReturnsRepository
-from app.infrastructure.db.session import get_session
+from app.api.dependencies.database import get_read_session
+from app.infrastructure.db.retry import run_transaction
+from app.infrastructure.db.session import ReadSessionLocal, get_session
+from app.shared.export import EXPORT_MEDIA_TYPES, ExportFormat, encode_rows, export_headers, export_rows
 
 router = APIRouter(prefix="/sales", tags=["sales"])
 
+SALE_EXPORT_FIELDS = (
+    "id",
+    "created_at",
+    "closed_at",
+    "customer_id",
+    "currency",
+    "total_quantity",
+    "total_amount",
+)
+
 
 @router.post("", response_model=SaleRecordOut, status_code=status.HTTP_201_CREATED)
 async def record_sale(
@@ -40,40 +66,93 @@ async def record_sale(
     sales_repo = SqlAlchemySalesRepository(session)
     inventory_repo = SqlAlchemyInventoryMovementRepository(session)
     customer_repo = SqlAlchemyCustomerRepository(session)
-    use_case = RecordSaleUseCase(product_repo, sales_repo, inventory_repo, customer_repo)
-    result = await use_case.execute(
+    use_case = RecordSaleUseCase(
+        product_repo, sales_repo, inventory_repo, customer_repo, outbox=SqlAlchemyOutboxRepository(session)
+    )
+    data = RecordSaleInput(
+        currency=payload.currency,
+        customer_id=payload.customer_id,
+        lines=[
+            SaleLineInput(
+                product_id=line.product_id,
+                quantity=line.quantity,
+                unit_price=line.unit_price,
+            )
+            for line in payload.lines
+        ],
+    )
+    result = await run_transaction(session, lambda: use_case.execute(data), operation="sale")
+    await StockLevelCache(cache, inventory_repo).invalidate(item.product_id for item in result.sale.iter_items())
+    return SaleRecordOut.build(result.sale, result.movements)
+
+
+@router.post("/batch", response_model=SaleBatchOut)
+async def record_sales_batch(
+    payload: SaleBatchCreate,
+    session: AsyncSession = Depends(get_session),
+    cache: CacheService = Depends(get_cache_service),
+    _: User = Depends(require_roles(*SALES_ROLES)),
+) -> SaleBatchOut:
+    inventory_repo = SqlAlchemyInventoryMovementRepository(session)
+    use_case = RecordSaleUseCase(
+        SqlAlchemyProductRepository(session),
+        SqlAlchemySalesRepository(session),
+        inventory_repo,
+        SqlAlchemyCustomerRepository(session),
+        outbox=SqlAlchemyOutboxRepository(session),
+    )
+    inputs = [
         RecordSaleInput(
-            currency=payload.currency,
-            customer_id=payload.customer_id,
+            sale_id=item.id,
+            occurred_at=item.occurred_at,
+            currency=item.currency,
+            customer_id=item.customer_id,
             lines=[
-                SaleLineInput(
-                    product_id=line.product_id,
-                    quantity=line.quantity,
-                    unit_price=line.unit_price,
-                )
-                for line in payload.lines
+                SaleLineInput(product_id=line.product_id, quantity=line.quantity, unit_price=line.unit_price)
+                for line in item.lines
             ],
         )
+        for item in payload.sales
+    ]
+    result = await run_transaction(session, lambda: use_case.execute_batch(inputs), operation="sale_batch")
+    if result.movements:
+        await StockLevelCache(cache, inventory_repo).invalidate(result.product_ids)
+    return SaleBatchOut.build(result)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_sales(
+    export_format: ExportFormat = Query("csv", alias="format"),
+    customer_id: str | None = Query(None, min_length=1, max_length=26),
+    date_from: datetime | None = Query(None),
+    date_to: datetime | None = Query(None),
+    _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
+) -> StreamingResponse:
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise ValidationError("date_from must be before or equal to date_to")
+
+    rows = export_rows(
+        ReadSessionLocal,
+        SqlAlchemySalesQueryService,
+        lambda queries: queries.iter_sales(customer_id=customer_id, date_from=date_from, date_to=date_to),
+    )
+    return StreamingResponse(
+        encode_rows(rows, SALE_EXPORT_FIELDS, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers=export_headers("sales", export_format),
     )
-    await cache.clear_prefix("products:list")
-    return SaleRecordOut.build(result.sale, result.movements)
 
 
 @router.get("/{sale_id}", response_model=SaleOut)
 async def get_sale(
     sale_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> SaleOut:
     sales_repo = SqlAlchemySalesRepository(session)
-    returns_repo = SqlAlchemyReturnsRepository(session)
     use_case = GetSaleUseCase(sales_repo)
     sale = await use_case.execute(GetSaleInput(sale_id=sale_id))
-    
-    item_ids = [item.id for item in sale.iter_items()]
-    returned_quantities = await returns_repo.get_returned_quantities(item_ids)
-    
-    return SaleOut.from_domain(sale, returned_quantities)
+    return SaleOut.from_domain(sale)
 
 
 @router.get("", response_model=SaleListOut)
@@ -83,11 +162,12 @@ async def list_sales(
     customer_id: str | None = Query(None, min_length=1, max_length=26),
     date_from: datetime | None = Query(None),
     date_to: datetime | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    include: Literal["items"] | None = Query(None),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*(SALES_ROLES + (UserRole.AUDITOR,)))),
 ) -> SaleListOut:
-    sales_repo = SqlAlchemySalesRepository(session)
-    use_case = ListSalesUseCase(sales_repo)
+    sales_queries = SqlAlchemySalesQueryService(session)
+    use_case = ListSalesUseCase(sales_queries)
     result = await use_case.execute(
         ListSalesInput(
             page=page,
@@ -95,8 +175,9 @@ async def list_sales(
             customer_id=customer_id,
             date_from=date_from,
             date_to=date_to,
+            include_items=include == "items",
         )
     )
-    items = [SaleOut.from_domain(sale) for sale in result.sales]
+    items = [SaleOut.from_read_model(sale) for sale in result.sales]
     meta = SalePageMetaOut(page=result.page, limit=result.limit, total=result.total, pages=result.pages)
     return SaleListOut(items=items, meta=meta)
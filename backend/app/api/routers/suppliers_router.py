@@ -4,16 +4,23 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies.auth import AUDIT_ROLES, PURCHASING_ROLES, require_roles
+from app.api.dependencies.database import get_read_session
 from app.api.schemas.suppliers import (
     SupplierCreate,
     SupplierDetailOut,
     SupplierListOut,
     SupplierOut,
     SupplierPageMetaOut,
+    SupplierSummaryListItemOut,
+    SupplierSummaryListOut,
     SupplierSummaryOut,
 )
 from app.application.suppliers.use_cases.get_supplier import GetSupplierInput, GetSupplierUseCase
 from app.application.suppliers.use_cases.get_supplier_summary import GetSupplierSummaryUseCase
+from app.application.suppliers.use_cases.list_supplier_summaries import (
+    ListSupplierSummariesInput,
+    ListSupplierSummariesUseCase,
+)
 from app.application.suppliers.use_cases.list_suppliers import (
     ListSuppliersInput,
     ListSuppliersUseCase,
@@ -57,7 +64,7 @@ async def list_suppliers(
     limit: int = Query(20, ge=1, le=100),
     search: str | None = Query(None, min_length=1),
     active: bool | None = Query(None),
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*READ_SUPPLIER_ROLES)),
 ) -> SupplierListOut:
     params = PageParams(page=page, limit=limit)
@@ -81,10 +88,31 @@ async def list_suppliers(
     return SupplierListOut(items=items, meta=meta)
 
 
+@router.get("/summaries", response_model=SupplierSummaryListOut)
+async def list_supplier_summaries(
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    search: str | None = Query(None, min_length=1),
+    active: bool | None = Query(None),
+    session: AsyncSession = Depends(get_read_session),
+    _: User = Depends(require_roles(*READ_SUPPLIER_ROLES)),
+) -> SupplierSummaryListOut:
+    use_case = ListSupplierSummariesUseCase(
+        SqlAlchemySupplierRepository(session),
+        SqlAlchemyPurchaseRepository(session),
+    )
+    result = await use_case.execute(
+        ListSupplierSummariesInput(page=page, limit=limit, search=search, active=active)
+    )
+    items = [SupplierSummaryListItemOut.from_entry(entry) for entry in result.items]
+    meta = SupplierPageMetaOut(page=result.page, limit=result.limit, total=result.total, pages=result.pages)
+    return SupplierSummaryListOut(items=items, meta=meta)
+
+
 @router.get("/{supplier_id}", response_model=SupplierDetailOut)
 async def get_supplier(
     supplier_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*READ_SUPPLIER_ROLES)),
 ) -> SupplierDetailOut:
     repo = SqlAlchemySupplierRepository(session)
@@ -96,7 +124,7 @@ async def get_supplier(
 @router.get("/{supplier_id}/summary", response_model=SupplierSummaryOut)
 async def get_supplier_summary(
     supplier_id: str,
-    session: AsyncSession = Depends(get_session),
+    session: AsyncSession = Depends(get_read_session),
     _: User = Depends(require_roles(*READ_SUPPLIER_ROLES)),
 ) -> SupplierSummaryOut:
     supplier_repo = SqlAlchemySupplierRepository(session)
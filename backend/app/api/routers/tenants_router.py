@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.api.dependencies.database import get_read_session
 from app.infrastructure.db.session import get_session
 from app.api.dependencies.auth import get_current_user
 from app.domain.auth.entities import UserRole, User
@@ -14,7 +15,7 @@ router = APIRouter(prefix="/tenants", tags=["Tenants"])
 @router.get("/plans")
 async def get_subscription_plans(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_read_session)
 ):
     stmt = select(SubscriptionPlanModel)
     result = await db.execute(stmt)
@@ -24,7 +25,7 @@ async def get_subscription_plans(
 @router.get("/")
 async def get_tenants(
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_session)
+    db: AsyncSession = Depends(get_read_session)
 ):
     if current_user.role != UserRole.SUPER_ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
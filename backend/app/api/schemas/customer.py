@@ -6,8 +6,9 @@ from decimal import Decimal
 from pydantic import BaseModel, EmailStr, Field
 
 from app.application.customers.use_cases.get_customer_summary import CustomerSummaryResult
+from app.application.customers.use_cases.list_customer_summaries import CustomerSummaryEntry
+from app.application.sales.ports import SaleListItem, SaleListLine
 from app.domain.customers import Customer
-from app.domain.sales import Sale, SaleItem
 
 
 class CustomerCreate(BaseModel):
@@ -85,12 +86,12 @@ class CustomerSaleItemOut(BaseModel):
     line_total: str
 
     @classmethod
-    def from_domain(cls, item: SaleItem) -> CustomerSaleItemOut:
+    def from_read_model(cls, item: SaleListLine) -> CustomerSaleItemOut:
         return cls(
             product_id=item.product_id,
             quantity=item.quantity,
-            unit_price=str(item.unit_price.amount),
-            line_total=str(item.line_total.amount),
+            unit_price=str(item.unit_price),
+            line_total=str(item.line_total),
         )
 
 
@@ -104,15 +105,15 @@ class CustomerSaleOut(BaseModel):
     items: list[CustomerSaleItemOut]
 
     @classmethod
-    def from_domain(cls, sale: Sale) -> CustomerSaleOut:
+    def from_read_model(cls, sale: SaleListItem) -> CustomerSaleOut:
         return cls(
             id=sale.id,
             currency=sale.currency,
-            total_amount=str(sale.total_amount.amount),
+            total_amount=str(sale.total_amount),
             total_quantity=sale.total_quantity,
             created_at=sale.created_at,
             closed_at=sale.closed_at,
-            items=[CustomerSaleItemOut.from_domain(item) for item in sale.iter_items()],
+            items=[CustomerSaleItemOut.from_read_model(item) for item in sale.items],
         )
 
 
@@ -132,6 +133,7 @@ class CustomerSummaryOut(BaseModel):
     last_purchase_at: datetime | None
     last_sale_id: str | None
     last_sale_amount: str | None
+    returned_amount: str
 
     @classmethod
     def from_result(cls, result: CustomerSummaryResult) -> CustomerSummaryOut:
@@ -151,4 +153,28 @@ class CustomerSummaryOut(BaseModel):
             last_purchase_at=result.last_purchase_at,
             last_sale_id=result.last_sale_id,
             last_sale_amount=_fmt(result.last_sale_amount),
+            returned_amount=format(result.returned_amount, "0.2f"),
         )
+
+
+class CustomerSummaryListItemOut(CustomerSummaryOut):
+    first_name: str
+    last_name: str
+    email: str
+    active: bool
+
+    @classmethod
+    def from_entry(cls, entry: CustomerSummaryEntry) -> CustomerSummaryListItemOut:
+        base = CustomerSummaryOut.from_result(entry.summary)
+        return cls(
+            **base.model_dump(),
+            first_name=entry.first_name,
+            last_name=entry.last_name,
+            email=entry.email,
+            active=entry.active,
+        )
+
+
+class CustomerSummaryListOut(BaseModel):
+    items: list[CustomerSummaryListItemOut]
+    meta: CustomerPageMetaOut
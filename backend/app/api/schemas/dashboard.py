@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.api.schemas.sale import SaleOut
+from app.application.dashboard.ports import CurrencyTotals, DashboardSummary
+
+
+class CurrencyTotalsOut(BaseModel):
+    currency: str
+    orders: int
+    items_sold: int
+    revenue: Decimal
+    returned_amount: Decimal
+    net_revenue: Decimal
+
+    @classmethod
+    def from_read_model(cls, totals: CurrencyTotals) -> CurrencyTotalsOut:
+        return cls(
+            currency=totals.currency,
+            orders=totals.orders,
+            items_sold=totals.items_sold,
+            revenue=totals.revenue,
+            returned_amount=totals.returned_amount,
+            net_revenue=totals.net_revenue,
+        )
+
+
+class DashboardSummaryOut(BaseModel):
+    date_from: date
+    date_to: date
+    catalog_size: int
+    customer_count: int
+    orders: int
+    totals: list[CurrencyTotalsOut]
+    recent_sales: list[SaleOut]
+
+    @classmethod
+    def from_read_model(cls, summary: DashboardSummary) -> DashboardSummaryOut:
+        return cls(
+            date_from=summary.date_from,
+            date_to=summary.date_to,
+            catalog_size=summary.catalog_size,
+            customer_count=summary.customer_count,
+            orders=summary.orders,
+            totals=[CurrencyTotalsOut.from_read_model(totals) for totals in summary.totals],
+            recent_sales=[SaleOut.from_read_model(sale) for sale in summary.recent_sales],
+        )
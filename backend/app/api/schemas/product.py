@@ -38,3 +38,23 @@ class ProductUpdate(BaseModel):
 
 class ProductDeactivate(BaseModel):
     expected_version: int = Field(ge=0)
+
+
+class ProductBulkUpdateItem(ProductUpdate):
+    id: str = Field(min_length=1, max_length=26)
+
+
+class ProductBulkUpdate(BaseModel):
+    items: list[ProductBulkUpdateItem] = Field(min_length=1, max_length=5000)
+
+
+class ProductBulkUpdateErrorOut(BaseModel):
+    product_id: str
+    code: str
+    detail: str
+
+
+class ProductBulkUpdateOut(BaseModel):
+    updated: list[ProductOut]
+    unchanged: list[str]
+    errors: list[ProductBulkUpdateErrorOut]
@@ -7,6 +7,7 @@ from typing import Sequence
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.api.schemas.inventory import InventoryMovementOut
+from app.application.purchases.ports import PurchaseListItem, PurchaseListLine
 from app.domain.inventory import InventoryMovement
 from app.domain.purchases import PurchaseOrder, PurchaseOrderItem
 
@@ -47,6 +48,16 @@ class PurchaseItemOut(BaseModel):
             line_total=str(item.line_total.amount),
         )
 
+    @classmethod
+    def from_read_model(cls, item: PurchaseListLine) -> PurchaseItemOut:
+        return cls(
+            id=item.id,
+            product_id=item.product_id,
+            quantity=item.quantity,
+            unit_cost=str(item.unit_cost),
+            line_total=str(item.line_total),
+        )
+
 
 class PurchaseOut(BaseModel):
     id: str
@@ -60,17 +71,31 @@ class PurchaseOut(BaseModel):
 
     @classmethod
     def from_domain(cls, purchase: PurchaseOrder) -> PurchaseOut:
+        totals = purchase.totals()
         return cls(
             id=purchase.id,
             supplier_id=purchase.supplier_id,
             currency=purchase.currency,
-            total_amount=str(purchase.total_amount.amount),
-            total_quantity=purchase.total_quantity,
+            total_amount=str(totals.amount.amount),
+            total_quantity=totals.quantity,
             created_at=purchase.created_at,
             received_at=purchase.received_at,
             items=[PurchaseItemOut.from_domain(item) for item in purchase.iter_items()],
         )
 
+    @classmethod
+    def from_read_model(cls, purchase: PurchaseListItem) -> PurchaseOut:
+        return cls(
+            id=purchase.id,
+            supplier_id=purchase.supplier_id,
+            currency=purchase.currency,
+            total_amount=str(purchase.total_amount),
+            total_quantity=purchase.total_quantity,
+            created_at=purchase.created_at,
+            received_at=purchase.received_at,
+            items=[PurchaseItemOut.from_read_model(item) for item in purchase.items],
+        )
+
 
 class PurchaseRecordOut(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
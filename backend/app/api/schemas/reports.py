@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.application.sales.ports import DailySalesRollup
+
+
+class DailySalesOut(BaseModel):
+    day: date
+    currency: str
+    sales_count: int
+    quantity: int
+    revenue: Decimal
+    returned_quantity: int
+    returned_amount: Decimal
+    net_revenue: Decimal
+
+    @classmethod
+    def from_read_model(cls, row: DailySalesRollup) -> DailySalesOut:
+        return cls(
+            day=row.day,
+            currency=row.currency,
+            sales_count=row.sales_count,
+            quantity=row.quantity,
+            revenue=row.revenue,
+            returned_quantity=row.returned_quantity,
+            returned_amount=row.returned_amount,
+            net_revenue=row.net_revenue,
+        )
+
+
+class DailySalesReportOut(BaseModel):
+    date_from: date
+    date_to: date
+    items: list[DailySalesOut]
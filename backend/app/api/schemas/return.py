@@ -58,12 +58,13 @@ class ReturnOut(BaseModel):
 
     @classmethod
     def from_domain(cls, return_: Return) -> ReturnOut:
+        totals = return_.totals()
         return cls(
             id=return_.id,
             sale_id=return_.sale_id,
             currency=return_.currency,
-            total_amount=str(return_.total_amount.amount),
-            total_quantity=return_.total_quantity,
+            total_amount=str(totals.amount.amount),
+            total_quantity=totals.quantity,
             created_at=return_.created_at,
             items=[ReturnItemOut.from_domain(item) for item in return_.iter_items()],
         )
@@ -6,6 +6,7 @@ from typing import Sequence
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from app.api.schemas.inventory import InventoryMovementOut
+from app.application.returns.ports import ReturnListItem, ReturnListLine
 from app.domain.inventory import InventoryMovement
 from app.domain.returns import Return, ReturnItem
 
@@ -46,6 +47,17 @@ class ReturnItemOut(BaseModel):
             line_total=str(item.line_total.amount),
         )
 
+    @classmethod
+    def from_read_model(cls, item: ReturnListLine) -> ReturnItemOut:
+        return cls(
+            id=item.id,
+            sale_item_id=item.sale_item_id,
+            product_id=item.product_id,
+            quantity=item.quantity,
+            unit_price=str(item.unit_price),
+            line_total=str(item.line_total),
+        )
+
 
 class ReturnOut(BaseModel):
     id: str
@@ -58,12 +70,13 @@ class ReturnOut(BaseModel):
 
     @classmethod
     def from_domain(cls, return_: Return) -> ReturnOut:
+        totals = return_.totals()
         return cls(
             id=return_.id,
             sale_id=return_.sale_id,
             currency=return_.currency,
-            total_amount=str(return_.total_amount.amount),
-            total_quantity=return_.total_quantity,
+            total_amount=str(totals.amount.amount),
+            total_quantity=totals.quantity,
             created_at=return_.created_at,
             items=[ReturnItemOut.from_domain(item) for item in return_.iter_items()],
         )
@@ -92,16 +105,18 @@ class ReturnSummaryOut(BaseModel):
     total_amount: str
     total_quantity: int
     created_at: datetime
+    items: list[ReturnItemOut] = Field(default_factory=list)
 
     @classmethod
-    def from_domain(cls, return_: Return) -> ReturnSummaryOut:
+    def from_read_model(cls, return_: ReturnListItem) -> ReturnSummaryOut:
         return cls(
             id=return_.id,
             sale_id=return_.sale_id,
             currency=return_.currency,
-            total_amount=str(return_.total_amount.amount),
+            total_amount=str(return_.total_amount),
             total_quantity=return_.total_quantity,
             created_at=return_.created_at,
+            items=[ReturnItemOut.from_read_model(item) for item in return_.items],
         )
 
 
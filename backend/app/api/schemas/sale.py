@@ -4,9 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Sequence
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AwareDatetime, BaseModel, Field, field_validator
 
 from app.api.schemas.inventory import InventoryMovementOut
+from app.application.sales.ports import SaleListItem, SaleListLine
+from app.application.sales.use_cases.record_sale import (
+    MAX_BATCH_SALES,
+    BatchSaleOutcome,
+    BatchSaleStatus,
+    RecordSaleBatchResult,
+)
 from app.domain.inventory import InventoryMovement
 from app.domain.sales import Sale, SaleItem
 
@@ -39,16 +46,27 @@ class SaleItemOut(BaseModel):
     line_total: str
 
     @classmethod
-    def from_domain(cls, item: SaleItem, returned_quantity: int = 0) -> SaleItemOut:
+    def from_domain(cls, item: SaleItem) -> SaleItemOut:
         return cls(
             id=item.id,
             product_id=item.product_id,
             quantity=item.quantity,
-            returned_quantity=returned_quantity,
+            returned_quantity=item.returned_quantity,
             unit_price=str(item.unit_price.amount),
             line_total=str(item.line_total.amount),
         )
 
+    @classmethod
+    def from_read_model(cls, item: SaleListLine) -> SaleItemOut:
+        return cls(
+            id=item.id,
+            product_id=item.product_id,
+            quantity=item.quantity,
+            returned_quantity=item.returned_quantity,
+            unit_price=str(item.unit_price),
+            line_total=str(item.line_total),
+        )
+
 
 class SaleOut(BaseModel):
     id: str
@@ -61,19 +79,29 @@ class SaleOut(BaseModel):
     customer_id: str | None
 
     @classmethod
-    def from_domain(cls, sale: Sale, returned_quantities: dict[str, int] | None = None) -> SaleOut:
-        returned_quantities = returned_quantities or {}
+    def from_domain(cls, sale: Sale) -> SaleOut:
+        totals = sale.totals()
         return cls(
             id=sale.id,
             currency=sale.currency,
-            total_amount=str(sale.total_amount.amount),
+            total_amount=str(totals.amount.amount),
+            total_quantity=totals.quantity,
+            created_at=sale.created_at,
+            closed_at=sale.closed_at,
+            items=[SaleItemOut.from_domain(item) for item in sale.iter_items()],
+            customer_id=sale.customer_id,
+        )
+
+    @classmethod
+    def from_read_model(cls, sale: SaleListItem) -> SaleOut:
+        return cls(
+            id=sale.id,
+            currency=sale.currency,
+            total_amount=str(sale.total_amount),
             total_quantity=sale.total_quantity,
             created_at=sale.created_at,
             closed_at=sale.closed_at,
-            items=[
-                SaleItemOut.from_domain(item, returned_quantities.get(item.id, 0))
-                for item in sale.iter_items()
-            ],
+            items=[SaleItemOut.from_read_model(item) for item in sale.items],
             customer_id=sale.customer_id,
         )
 
@@ -98,3 +126,47 @@ class SalePageMetaOut(BaseModel):
 class SaleListOut(BaseModel):
     items: list[SaleOut]
     meta: SalePageMetaOut
+
+
+class SaleBatchItem(SaleCreate):
+    id: str = Field(pattern=r"^[0-9A-HJKMNP-TV-Z]{26}$", description="Client-generated ULID; replaying it is a no-op")
+    occurred_at: AwareDatetime | None = None
+
+
+class SaleBatchCreate(BaseModel):
+    sales: list[SaleBatchItem] = Field(min_length=1, max_length=MAX_BATCH_SALES)
+
+
+class SaleBatchResultOut(BaseModel):
+    id: str
+    status: BatchSaleStatus
+    sale: SaleOut | None = None
+    code: str | None = None
+    detail: str | None = None
+
+    @classmethod
+    def from_outcome(cls, outcome: BatchSaleOutcome) -> SaleBatchResultOut:
+        return cls(
+            id=outcome.sale_id,
+            status=outcome.status,
+            sale=SaleOut.from_domain(outcome.sale) if outcome.sale is not None else None,
+            code=outcome.error_code,
+            detail=outcome.error,
+        )
+
+
+class SaleBatchOut(BaseModel):
+    recorded: int
+    duplicates: int
+    rejected: int
+    results: list[SaleBatchResultOut]
+
+    @classmethod
+    def build(cls, result: RecordSaleBatchResult) -> SaleBatchOut:
+        statuses = [outcome.status for outcome in result.outcomes]
+        return cls(
+            recorded=statuses.count(BatchSaleStatus.RECORDED),
+            duplicates=statuses.count(BatchSaleStatus.DUPLICATE),
+            rejected=statuses.count(BatchSaleStatus.REJECTED),
+            results=[SaleBatchResultOut.from_outcome(outcome) for outcome in result.outcomes],
+        )
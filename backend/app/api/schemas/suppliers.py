@@ -6,6 +6,7 @@ from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator
 
 from app.application.suppliers.use_cases.get_supplier_summary import SupplierSummaryResult
+from app.application.suppliers.use_cases.list_supplier_summaries import SupplierSummaryEntry
 from app.domain.suppliers import Supplier
 
 
@@ -72,6 +73,8 @@ class SupplierSummaryOut(BaseModel):
     total_amount: str
     average_order_value: str | None
     average_lead_time_hours: str | None
+    p50_lead_time_hours: str | None
+    p90_lead_time_hours: str | None
     first_order_at: datetime | None
     last_order_at: datetime | None
     last_order_id: str | None
@@ -93,9 +96,26 @@ class SupplierSummaryOut(BaseModel):
             total_amount=format(result.total_amount, "0.2f"),
             average_order_value=_fmt(result.average_order_value),
             average_lead_time_hours=_fmt(result.average_lead_time_hours),
+            p50_lead_time_hours=_fmt(result.p50_lead_time_hours),
+            p90_lead_time_hours=_fmt(result.p90_lead_time_hours),
             first_order_at=result.first_order_at,
             last_order_at=result.last_order_at,
             last_order_id=result.last_order_id,
             last_order_amount=_fmt(result.last_order_amount),
             open_orders=result.open_orders,
         )
+
+
+class SupplierSummaryListItemOut(SupplierSummaryOut):
+    name: str
+    active: bool
+
+    @classmethod
+    def from_entry(cls, entry: SupplierSummaryEntry) -> SupplierSummaryListItemOut:
+        base = SupplierSummaryOut.from_result(entry.summary)
+        return cls(**base.model_dump(), name=entry.name, active=entry.active)
+
+
+class SupplierSummaryListOut(BaseModel):
+    items: list[SupplierSummaryListItemOut]
+    meta: SupplierPageMetaOut
@@ -35,9 +35,28 @@ class RefreshTokenRepositoryPort(Protocol):
     async def revoke_all_for_user(self, user_id: str) -> int: ...  # noqa: E701
 
 
+class PrincipalCachePort(Protocol):
+    async def invalidate(self, user_id: str) -> None: ...  # noqa: E701
+
+
+class LoginThrottlePort(Protocol):
+    async def retry_after(self, *, email: str, client: str | None) -> int | None: ...  # noqa: E701
+    async def record_failure(self, *, email: str, client: str | None) -> None: ...  # noqa: E701
+    async def record_success(self, *, email: str, client: str | None) -> None: ...  # noqa: E701
+
+
+class SlidingWindowStorePort(Protocol):
+    async def hit(self, key: str, *, now: float, window: float) -> int: ...  # noqa: E701
+    async def strike(self, key: str, *, now: float, ttl: float) -> int: ...  # noqa: E701
+    async def lock(self, key: str, *, until: float, now: float) -> None: ...  # noqa: E701
+    async def locked_until(self, key: str, *, now: float) -> float | None: ...  # noqa: E701
+    async def clear(self, key: str) -> None: ...  # noqa: E701
+
+
 class PasswordHasherPort(Protocol):
-    def hash(self, raw: str) -> str: ...  # noqa: E701
-    def verify(self, raw: str, hashed: str) -> bool: ...  # noqa: E701
+    async def hash(self, raw: str) -> str: ...  # noqa: E701
+    async def verify(self, raw: str, hashed: str) -> bool: ...  # noqa: E701
+    def needs_rehash(self, hashed: str) -> bool: ...  # noqa: E701
 
 
 class TokenProviderPort(Protocol):
@@ -47,6 +66,11 @@ class TokenProviderPort(Protocol):
     def decode_token(self, token: str) -> dict[str, Any]: ...  # noqa: E701
 
 
+class AdminActionSinkPort(Protocol):
+    async def add(self, log: AdminActionLog) -> None: ...  # noqa: E701
+    async def flush(self) -> None: ...  # noqa: E701
+
+
 class AdminActionLogRepositoryPort(Protocol):
     async def add(self, log: AdminActionLog) -> None: ...  # noqa: E701
     async def search(
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.application.auth.ports import SlidingWindowStorePort
+
+EMAIL_KEY_PREFIX = "login:email:"
+CLIENT_KEY_PREFIX = "login:client:"
+
+
+@dataclass(frozen=True, slots=True)
+class LoginThrottlePolicy:
+    max_failures_per_email: int = 5
+    # Tills behind one shop NAT share an address, so the client bucket is looser.
+    max_failures_per_client: int = 30
+    window_seconds: float = 300.0
+    lockout_base_seconds: float = 30.0
+    lockout_max_seconds: float = 3600.0
+
+
+class LoginThrottle:
+    """Sliding-window failure counting per email and per client, with exponential lockout.
+
+    Once a bucket reaches its limit inside the window, every further failure locks it for
+    ``base * 2**(strikes - 1)`` seconds (capped). A locked bucket is rejected before any
+    user lookup or password hashing happens. Success clears the email bucket only, so one
+    valid account cannot reset a spraying client's counter.
+    """
+
+    def __init__(
+        self,
+        store: SlidingWindowStorePort,
+        policy: LoginThrottlePolicy | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+        on_event: Callable[[str], None] | None = None,
+    ) -> None:
+        self._store = store
+        self._policy = policy or LoginThrottlePolicy()
+        self._clock = clock
+        self._on_event = on_event
+
+    async def retry_after(self, *, email: str, client: str | None) -> int | None:
+        now = self._clock()
+        wait = 0.0
+        for key, _ in self._buckets(email, client):
+            until = await self._store.locked_until(key, now=now)
+            if until is not None and until > now:
+                wait = max(wait, until - now)
+        if not wait:
+            return None
+        self._emit("throttled")
+        return math.ceil(wait)
+
+    async def record_failure(self, *, email: str, client: str | None) -> None:
+        policy = self._policy
+        now = self._clock()
+        self._emit("failure")
+        for key, limit in self._buckets(email, client):
+            failures = await self._store.hit(key, now=now, window=policy.window_seconds)
+            if failures < limit:
+                continue
+            strikes = await self._store.strike(key, now=now, ttl=policy.lockout_max_seconds + policy.window_seconds)
+            duration = min(policy.lockout_base_seconds * 2 ** (strikes - 1), policy.lockout_max_seconds)
+            await self._store.lock(key, until=now + duration, now=now)
+            self._emit("lockout")
+
+    async def record_success(self, *, email: str, client: str | None) -> None:
+        await self._store.clear(EMAIL_KEY_PREFIX + _normalize(email))
+
+    def _buckets(self, email: str, client: str | None) -> list[tuple[str, int]]:
+        buckets = [(EMAIL_KEY_PREFIX + _normalize(email), self._policy.max_failures_per_email)]
+        if client:
+            buckets.append((CLIENT_KEY_PREFIX + client, self._policy.max_failures_per_client))
+        return buckets
+
+    def _emit(self, event: str) -> None:
+        if self._on_event is not None:
+            self._on_event(event)
+
+
+def _normalize(email: str) -> str:
+    return email.strip().lower()
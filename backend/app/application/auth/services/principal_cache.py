@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from app.domain.auth.entities import User
+
+DEFAULT_PRINCIPAL_TTL_SECONDS = 5.0
+DEFAULT_PRINCIPAL_MAX_ENTRIES = 10_000
+
+
+class PrincipalCache:
+    """Process-local cache of authenticated users keyed by id.
+
+    Lets ``get_current_user`` skip the per-request user lookup. Entries live a few
+    seconds; user-admin endpoints call ``invalidate`` once their transaction commits
+    (see ``PostCommitPrincipalInvalidator``) so deactivations and role changes apply
+    immediately in this process, and the optional broadcaster fans the id out to other
+    workers (see ``RedisPrincipalInvalidationBus``).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_PRINCIPAL_TTL_SECONDS,
+        max_entries: int = DEFAULT_PRINCIPAL_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[str, tuple[float, User]] = {}
+        self._broadcast: Callable[[str], Awaitable[None]] | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def set_broadcaster(self, broadcast: Callable[[str], Awaitable[None]] | None) -> None:
+        self._broadcast = broadcast
+
+    def get(self, user_id: str) -> User | None:
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            # Callers get their own copy so nothing mutates the shared entry.
+            return replace(entry[1])
+        if entry is not None:
+            del self._entries[user_id]
+        self.misses += 1
+        return None
+
+    def put(self, user: User) -> None:
+        if not self.enabled:
+            return
+        if len(self._entries) >= self._max_entries:
+            self._evict_expired()
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+        self._entries[user.id] = (self._clock() + self._ttl, replace(user))
+
+    def drop(self, user_id: str) -> None:
+        """Forget ``user_id`` in this process only (used by the pub/sub listener)."""
+        self._entries.pop(user_id, None)
+
+    async def invalidate(self, user_id: str) -> None:
+        self.drop(user_id)
+        if self._broadcast is not None:
+            await self._broadcast(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict_expired(self) -> None:
+        now = self._clock()
+        for user_id in [uid for uid, (expires_at, _) in self._entries.items() if expires_at <= now]:
+            del self._entries[user_id]
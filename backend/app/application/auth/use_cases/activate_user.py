@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from app.application.auth.ports import UserRepositoryPort
+from app.application.auth.ports import PrincipalCachePort, UserRepositoryPort
 from app.domain.auth.entities import User
 from app.domain.common.errors import ConflictError, NotFoundError, ValidationError
 
@@ -14,8 +14,9 @@ class ActivateUserInput:
 
 
 class ActivateUserUseCase:
-    def __init__(self, users: UserRepositoryPort):
+    def __init__(self, users: UserRepositoryPort, principals: PrincipalCachePort | None = None):
         self._users = users
+        self._principals = principals
 
     async def execute(self, data: ActivateUserInput) -> User:
         user = await self._users.get_by_id(data.user_id)
@@ -29,4 +30,6 @@ class ActivateUserUseCase:
         updated = await self._users.update(user, expected_version=data.expected_version)
         if not updated:
             raise ConflictError("user modified by another transaction")
+        if self._principals is not None:
+            await self._principals.invalidate(user.id)
         return user
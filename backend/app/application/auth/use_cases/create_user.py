@@ -22,7 +22,7 @@ class CreateUserUseCase:
     async def execute(self, data: CreateUserInput) -> User:
         if await self._repo.get_by_email(data.email):
             raise ConflictError("email already registered")
-        hashed = self._hasher.hash(data.password)
+        hashed = await self._hasher.hash(data.password)
         user = User.create(email=data.email, password_hash=hashed, role=data.role)
         await self._repo.add(user)
         return user
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from app.application.auth.ports import AdminActionLogRepositoryPort
+from app.application.auth.ports import AdminActionLogRepositoryPort, AdminActionSinkPort
 from app.domain.common.errors import ValidationError
 from app.shared.pagination import Page, PageParams
 
@@ -19,13 +19,17 @@ class ListAdminActionsInput:
 
 
 class ListAdminActionsUseCase:
-    def __init__(self, logs: AdminActionLogRepositoryPort):
+    def __init__(self, logs: AdminActionLogRepositoryPort, pending: AdminActionSinkPort | None = None):
         self._logs = logs
+        self._pending = pending
 
     async def execute(self, data: ListAdminActionsInput) -> Page:
         if data.start and data.end and data.start > data.end:
             raise ValidationError("start date must be before end date", code="invalid_date_range")
 
+        if self._pending is not None:
+            # Entries still buffered for bulk insert would otherwise be missing from the page.
+            await self._pending.flush()
         items, total = await self._logs.search(
             actor_user_id=data.actor_user_id,
             target_user_id=data.target_user_id,
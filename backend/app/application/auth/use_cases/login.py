@@ -3,19 +3,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from app.application.auth.ports import (
+    LoginThrottlePort,
     PasswordHasherPort,
     RefreshTokenRepositoryPort,
     TokenProviderPort,
     UserRepositoryPort,
 )
-from app.domain.auth.entities import RefreshToken
-from app.domain.common.errors import UnauthorizedError
+from app.domain.auth.entities import RefreshToken, User
+from app.domain.common.errors import TooManyRequestsError, UnauthorizedError
 
 
 @dataclass
 class LoginInput:
     email: str
     password: str
+    client: str | None = None
 
 
 @dataclass
@@ -32,20 +34,39 @@ class LoginUseCase:
         hasher: PasswordHasherPort,
         tokens: TokenProviderPort,
         refresh_tokens: RefreshTokenRepositoryPort,
+        throttle: LoginThrottlePort | None = None,
     ):
         self._repo = repo
         self._hasher = hasher
         self._tokens = tokens
         self._refresh_repo = refresh_tokens
+        self._throttle = throttle
 
     async def execute(self, data: LoginInput) -> LoginOutput:
+        if self._throttle is not None:
+            # Checked before the lookup and the hash so a locked-out caller costs almost nothing.
+            retry_after = await self._throttle.retry_after(email=data.email, client=data.client)
+            if retry_after is not None:
+                raise TooManyRequestsError(
+                    "too many failed login attempts", retry_after=retry_after, code="too_many_login_attempts"
+                )
         user = await self._repo.get_by_email(data.email)
-        if not user:
-            raise UnauthorizedError("invalid credentials")
-        if not self._hasher.verify(data.password, user.password_hash):
+        if not user or not await self._hasher.verify(data.password, user.password_hash):
+            if self._throttle is not None:
+                await self._throttle.record_failure(email=data.email, client=data.client)
             raise UnauthorizedError("invalid credentials")
+        if self._throttle is not None:
+            await self._throttle.record_success(email=data.email, client=data.client)
+        if self._hasher.needs_rehash(user.password_hash):
+            await self._upgrade_hash(user, data.password)
         access = self._tokens.create_access_token(subject=user.id, extra={"role": user.role})
         refresh_token, refresh_id, refresh_expires = self._tokens.create_refresh_token_with_id(subject=user.id)
         entity = RefreshToken.issue(user_id=user.id, expires_at=refresh_expires, token_id=refresh_id)
         await self._refresh_repo.add(entity)
-        return LoginOutput(access_token=access, refresh_token=refresh_token)
\ No newline at end of file
+        return LoginOutput(access_token=access, refresh_token=refresh_token)
+
+    async def _upgrade_hash(self, user: User, password: str) -> None:
+        """Re-hash with the current cost parameters; a concurrent edit just defers it to the next login."""
+        expected_version = user.version
+        user.set_password_hash(await self._hasher.hash(password))
+        await self._repo.update(user, expected_version=expected_version)
\ No newline at end of file
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from app.application.auth.ports import AdminActionLogRepositoryPort
+from app.application.auth.ports import AdminActionLogRepositoryPort, AdminActionSinkPort
 from app.domain.auth.admin_action_log import AdminActionLog
 
 
@@ -17,7 +17,7 @@ class RecordAdminActionInput:
 
 
 class RecordAdminActionUseCase:
-    def __init__(self, logs: AdminActionLogRepositoryPort):
+    def __init__(self, logs: AdminActionLogRepositoryPort | AdminActionSinkPort):
         self._logs = logs
 
     async def execute(self, data: RecordAdminActionInput) -> AdminActionLog:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from app.application.auth.ports import PasswordHasherPort, UserRepositoryPort
+from app.application.auth.ports import PasswordHasherPort, PrincipalCachePort, UserRepositoryPort
 from app.domain.auth.entities import User
 from app.domain.common.errors import ConflictError, NotFoundError, ValidationError
 
@@ -15,9 +15,15 @@ class ResetUserPasswordInput:
 
 
 class ResetUserPasswordUseCase:
-    def __init__(self, users: UserRepositoryPort, hasher: PasswordHasherPort):
+    def __init__(
+        self,
+        users: UserRepositoryPort,
+        hasher: PasswordHasherPort,
+        principals: PrincipalCachePort | None = None,
+    ):
         self._users = users
         self._hasher = hasher
+        self._principals = principals
 
     async def execute(self, data: ResetUserPasswordInput) -> User:
         user = await self._users.get_by_id(data.user_id)
@@ -25,11 +31,13 @@ class ResetUserPasswordUseCase:
             raise NotFoundError("user not found")
         if user.version != data.expected_version:
             raise ConflictError("user modified by another transaction")
-        if self._hasher.verify(data.new_password, user.password_hash):
+        if await self._hasher.verify(data.new_password, user.password_hash):
             raise ValidationError("new password must differ from the current password", code="password_unchanged")
-        hashed = self._hasher.hash(data.new_password)
+        hashed = await self._hasher.hash(data.new_password)
         user.set_password_hash(hashed)
         updated = await self._users.update(user, expected_version=data.expected_version)
         if not updated:
             raise ConflictError("user modified by another transaction")
+        if self._principals is not None:
+            await self._principals.invalidate(user.id)
         return user
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Protocol, Sequence
 
@@ -12,20 +14,56 @@ class ProductRepository(Protocol):
     async def get_by_sku(self, sku: str) -> Product | None: ...  # pragma: no cover
     async def get_by_id(self, product_id: str, *, lock: bool = False) -> Product | None: ...  # pragma: no cover
     async def update(self, product: Product, *, expected_version: int) -> bool: ...  # pragma: no cover
+    async def get_many(
+        self,
+        product_ids: Sequence[str],
+        *,
+        lock: bool = False,
+    ) -> list[Product]: ...  # pragma: no cover
+    async def update_many(
+        self,
+        updates: Sequence[tuple[Product, int]],
+    ) -> set[str]: ...  # pragma: no cover - returns ids whose expected version still matched
+    # Future: delete (soft) etc.
+
+
+@dataclass(slots=True)
+class ProductListItem:
+    """Read model for catalog listings; built from selected columns, never from ORM entities."""
+
+    id: str
+    name: str
+    sku: str
+    retail_price: Decimal
+    purchase_price: Decimal
+    category_id: str | None
+    active: bool
+    version: int
+
+
+class ProductQueryService(Protocol):
     async def list_products(
         self,
         *,
         search: str | None = None,
         category_id: str | None = None,
         active: bool | None = None,
-    min_price: Decimal | None = None,
-    max_price: Decimal | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
         sort_by: str = "created_at",
         sort_direction: str = "desc",
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[Sequence[Product], int]: ...  # pragma: no cover
-    # Future: delete (soft) etc.
+    ) -> tuple[Sequence[ProductListItem], int]: ...  # pragma: no cover
+
+    def iter_products(
+        self,
+        *,
+        search: str | None = None,
+        category_id: str | None = None,
+        active: bool | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ProductListItem]: ...  # pragma: no cover - streamed with a server-side cursor
 
 
 class CategoryRepository(Protocol):
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from app.application.catalog.ports import ProductRepository
+from app.application.catalog.use_cases.update_product import UpdateProductInput, apply_product_changes
+from app.domain.catalog.entities import Product
+from app.domain.common.errors import ConflictError, DomainError, NotFoundError, ValidationError
+
+
+@dataclass(slots=True)
+class BulkUpdateProductsInput:
+    items: list[UpdateProductInput]
+
+
+@dataclass(slots=True)
+class BulkUpdateRowError:
+    product_id: str
+    code: str
+    message: str
+
+
+@dataclass(slots=True)
+class BulkUpdateProductsResult:
+    updated: list[Product] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    errors: list[BulkUpdateRowError] = field(default_factory=list)
+
+
+class BulkUpdateProductsUseCase:
+    """Apply many optimistic-locked product edits with batched reads and writes.
+
+    Rows are independent: a stale ``expected_version`` or an invalid change is
+    reported for that row and the remaining rows are still applied.
+    """
+
+    def __init__(self, repo: ProductRepository):
+        self._repo = repo
+
+    async def execute(self, data: BulkUpdateProductsInput) -> BulkUpdateProductsResult:
+        if not data.items:
+            raise ValidationError("At least one product update is required")
+
+        result = BulkUpdateProductsResult()
+        requested: list[UpdateProductInput] = []
+        seen: set[str] = set()
+        for item in data.items:
+            if item.product_id in seen:
+                result.errors.append(
+                    _row_error(item.product_id, ValidationError("Duplicate product in request", code="duplicate"))
+                )
+                continue
+            seen.add(item.product_id)
+            requested.append(item)
+
+        products = {product.id: product for product in await self._repo.get_many([i.product_id for i in requested])}
+        pending: list[tuple[Product, int]] = []
+        for item in requested:
+            product = products.get(item.product_id)
+            if product is None:
+                result.errors.append(_row_error(item.product_id, NotFoundError("Product not found")))
+                continue
+            if product.version != item.expected_version:
+                result.errors.append(_row_error(item.product_id, _conflict()))
+                continue
+            try:
+                changed = apply_product_changes(product, item)
+            except DomainError as exc:
+                result.errors.append(_row_error(item.product_id, exc))
+                continue
+            if not changed:
+                result.unchanged.append(item.product_id)
+                continue
+            pending.append((product, item.expected_version))
+
+        if pending:
+            written = await self._repo.update_many(pending)
+            for product, _ in pending:
+                if product.id in written:
+                    result.updated.append(product)
+                else:
+                    result.errors.append(_row_error(product.id, _conflict()))
+        return result
+
+
+def _conflict() -> ConflictError:
+    return ConflictError("Product was modified by another transaction")
+
+
+def _row_error(product_id: str, error: DomainError) -> BulkUpdateRowError:
+    return BulkUpdateRowError(product_id=product_id, code=error.error_code, message=error.message)
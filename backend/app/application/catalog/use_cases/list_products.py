@@ -3,12 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import Decimal
 
-from app.application.catalog.ports import ProductRepository
-from app.domain.catalog.entities import Product
+from app.application.catalog.ports import ProductListItem, ProductQueryService
 from app.domain.common.errors import ValidationError
 from app.shared.pagination import PageParams
 
-VALID_SORT_FIELDS = {"created_at", "name", "sku", "retail_price"}
+VALID_SORT_FIELDS = {"created_at", "updated_at", "name", "sku", "retail_price"}
 VALID_SORT_DIRECTIONS = {"asc", "desc"}
 
 
@@ -27,7 +26,7 @@ class ListProductsInput:
 
 @dataclass(slots=True)
 class ListProductsOutput:
-    products: list[Product]
+    products: list[ProductListItem]
     total: int
     page: int
     limit: int
@@ -35,8 +34,8 @@ class ListProductsOutput:
 
 
 class ListProductsUseCase:
-    def __init__(self, repository: ProductRepository):
-        self._repository = repository
+    def __init__(self, queries: ProductQueryService):
+        self._queries = queries
 
     async def execute(self, data: ListProductsInput) -> ListProductsOutput:
         params = PageParams(page=data.page, limit=data.limit)
@@ -51,7 +50,7 @@ class ListProductsUseCase:
         if sort_direction not in VALID_SORT_DIRECTIONS:
             raise ValidationError("sort_direction must be 'asc' or 'desc'")
 
-        products, total = await self._repository.list_products(
+        products, total = await self._queries.list_products(
             search=data.search,
             category_id=data.category_id,
             active=data.active,
@@ -19,6 +19,28 @@ class UpdateProductInput:
     category_id_provided: bool = False
 
 
+def apply_product_changes(product: Product, data: UpdateProductInput) -> bool:
+    """Apply the requested field changes to ``product``; returns False when nothing differs."""
+    changed = False
+    if data.name is not None:
+        new_name = data.name.strip()
+        if new_name != product.name:
+            product.rename(new_name)
+            changed = True
+    if data.retail_price is not None and data.retail_price != product.price_retail.amount:
+        product.change_price(data.retail_price)
+        changed = True
+    if data.purchase_price is not None and data.purchase_price != product.purchase_price.amount:
+        product.update_purchase_price(data.purchase_price)
+        changed = True
+    if data.category_id_provided:
+        new_category = data.category_id
+        if new_category != product.category_id:
+            product.assign_category(new_category)
+            changed = True
+    return changed
+
+
 class UpdateProductUseCase:
     def __init__(self, repo: ProductRepository):
         self._repo = repo
@@ -30,25 +52,7 @@ class UpdateProductUseCase:
         if product.version != data.expected_version:
             raise ConflictError("Product was modified by another transaction")
 
-        changed = False
-        if data.name is not None:
-            new_name = data.name.strip()
-            if new_name != product.name:
-                product.rename(new_name)
-                changed = True
-        if data.retail_price is not None and data.retail_price != product.price_retail.amount:
-            product.change_price(data.retail_price)
-            changed = True
-        if data.purchase_price is not None and data.purchase_price != product.purchase_price.amount:
-            product.update_purchase_price(data.purchase_price)
-            changed = True
-        if data.category_id_provided:
-            new_category = data.category_id
-            if new_category != product.category_id:
-                product.assign_category(new_category)
-                changed = True
-
-        if not changed:
+        if not apply_product_changes(product, data):
             raise ValidationError("No changes detected")
 
         success = await self._repo.update(product, expected_version=data.expected_version)
@@ -1,7 +1,10 @@
-from typing import Any, Protocol
+from typing import Any, Mapping, Protocol, Sequence
 
 class CacheService(Protocol):
     async def get(self, key: str) -> Any | None: ...
+    async def get_many(self, keys: Sequence[str]) -> dict[str, Any]: ...
     async def set(self, key: str, value: Any, ttl: int = 300) -> None: ...
+    async def set_many(self, values: Mapping[str, Any], ttl: int = 300) -> None: ...
     async def delete(self, key: str) -> None: ...
+    async def delete_many(self, keys: Sequence[str]) -> None: ...
     async def clear_prefix(self, prefix: str) -> None: ...
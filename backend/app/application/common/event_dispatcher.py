@@ -16,3 +16,9 @@ class EventDispatcher(Protocol):
     async def publish_many(self, events: Sequence[DomainEvent]) -> None: ...
 
     def subscribe(self, event_type: type[E], handler: EventHandler) -> None: ...
+
+
+class EventOutbox(Protocol):
+    """Records events in the caller's unit of work; they are delivered only once it commits."""
+
+    async def add(self, events: Sequence[DomainEvent]) -> None: ...
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Protocol, Sequence
 
+from app.application.sales.ports import CustomerSalesSummary
 from app.domain.customers import Customer
 
 
@@ -22,3 +24,24 @@ class CustomerRepository(Protocol):
         offset: int = 0,
         limit: int = 20,
     ) -> tuple[Sequence[Customer], int]: ...  # pragma: no cover
+
+
+@dataclass(slots=True)
+class CustomerSummaryListItem:
+    customer_id: str
+    first_name: str
+    last_name: str
+    email: str
+    active: bool
+    sales: CustomerSalesSummary
+
+
+class CustomerSummaryQueryService(Protocol):
+    async def list_summaries(
+        self,
+        *,
+        search: str | None = None,
+        active: bool | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[Sequence[CustomerSummaryListItem], int]: ...  # pragma: no cover
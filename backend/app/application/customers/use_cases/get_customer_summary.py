@@ -21,6 +21,27 @@ class CustomerSummaryResult:
     last_sale_id: str | None
     last_sale_amount: Decimal | None
     average_order_value: Decimal | None
+    returned_amount: Decimal = Decimal("0.00")
+
+
+def build_customer_summary(customer_id: str, summary: CustomerSalesSummary) -> CustomerSummaryResult:
+    average_order_value: Decimal | None = None
+    if summary.total_sales > 0:
+        average_order_value = (summary.total_amount / Decimal(summary.total_sales)).quantize(Decimal("0.01"))
+
+    return CustomerSummaryResult(
+        customer_id=customer_id,
+        currency=summary.currency,
+        total_sales=summary.total_sales,
+        total_amount=summary.total_amount,
+        total_quantity=summary.total_quantity,
+        first_purchase_at=summary.first_sale_at,
+        last_purchase_at=summary.last_sale_at,
+        last_sale_id=summary.last_sale_id,
+        last_sale_amount=summary.last_sale_amount,
+        average_order_value=average_order_value,
+        returned_amount=summary.returned_amount,
+    )
 
 
 class GetCustomerSummaryUseCase:
@@ -34,21 +55,4 @@ class GetCustomerSummaryUseCase:
             raise NotFoundError("Customer not found")
 
         summary: CustomerSalesSummary = await self._sales_repo.get_customer_sales_summary(customer_id)
-        average_order_value: Decimal | None = None
-        if summary.total_sales > 0:
-            average_order_value = (summary.total_amount / Decimal(summary.total_sales)).quantize(
-                Decimal("0.01")
-            )
-
-        return CustomerSummaryResult(
-            customer_id=customer.id,
-            currency=summary.currency,
-            total_sales=summary.total_sales,
-            total_amount=summary.total_amount,
-            total_quantity=summary.total_quantity,
-            first_purchase_at=summary.first_sale_at,
-            last_purchase_at=summary.last_sale_at,
-            last_sale_id=summary.last_sale_id,
-            last_sale_amount=summary.last_sale_amount,
-            average_order_value=average_order_value,
-        )
+        return build_customer_summary(customer.id, summary)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.application.customers.ports import CustomerSummaryQueryService
+from app.application.customers.use_cases.get_customer_summary import (
+    CustomerSummaryResult,
+    build_customer_summary,
+)
+from app.domain.common.errors import ValidationError
+
+
+@dataclass(slots=True)
+class ListCustomerSummariesInput:
+    page: int = 1
+    limit: int = 20
+    search: str | None = None
+    active: bool | None = None
+
+
+@dataclass(slots=True)
+class CustomerSummaryEntry:
+    first_name: str
+    last_name: str
+    email: str
+    active: bool
+    summary: CustomerSummaryResult
+
+
+@dataclass(slots=True)
+class ListCustomerSummariesResult:
+    items: list[CustomerSummaryEntry]
+    total: int
+    page: int
+    limit: int
+    pages: int
+
+
+class ListCustomerSummariesUseCase:
+    def __init__(self, queries: CustomerSummaryQueryService) -> None:
+        self._queries = queries
+
+    async def execute(self, data: ListCustomerSummariesInput) -> ListCustomerSummariesResult:
+        if data.page < 1:
+            raise ValidationError("page must be >= 1")
+        if data.limit < 1 or data.limit > 100:
+            raise ValidationError("limit must be between 1 and 100")
+
+        offset = (data.page - 1) * data.limit
+        rows, total = await self._queries.list_summaries(
+            search=data.search,
+            active=data.active,
+            offset=offset,
+            limit=data.limit,
+        )
+        items = [
+            CustomerSummaryEntry(
+                first_name=row.first_name,
+                last_name=row.last_name,
+                email=row.email,
+                active=row.active,
+                summary=build_customer_summary(row.customer_id, row.sales),
+            )
+            for row in rows
+        ]
+        pages = (total + data.limit - 1) // data.limit if total > 0 else 0
+        return ListCustomerSummariesResult(
+            items=items,
+            total=total,
+            page=data.page,
+            limit=data.limit,
+            pages=pages,
+        )
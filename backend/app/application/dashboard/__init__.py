@@ -0,0 +1 @@
+"""Dashboard application services."""
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Protocol
+
+from app.application.sales.ports import SaleListItem
+
+
+@dataclass(slots=True)
+class CurrencyTotals:
+    currency: str
+    orders: int
+    items_sold: int
+    revenue: Decimal
+    returned_amount: Decimal
+
+    @property
+    def net_revenue(self) -> Decimal:
+        return self.revenue - self.returned_amount
+
+
+@dataclass(slots=True)
+class DashboardSummary:
+    date_from: date
+    date_to: date
+    catalog_size: int
+    customer_count: int
+    totals: list[CurrencyTotals] = field(default_factory=list)
+    recent_sales: list[SaleListItem] = field(default_factory=list)
+
+    @property
+    def orders(self) -> int:
+        return sum(total.orders for total in self.totals)
+
+
+class DashboardQueryService(Protocol):
+    async def get_summary(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        recent_limit: int = 5,
+    ) -> DashboardSummary: ...  # pragma: no cover
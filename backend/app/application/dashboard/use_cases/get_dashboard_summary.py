@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from app.application.dashboard.ports import DashboardQueryService, DashboardSummary
+from app.domain.common.errors import ValidationError
+
+MAX_DASHBOARD_DAYS = 366
+MAX_RECENT_SALES = 20
+
+
+@dataclass(slots=True)
+class GetDashboardSummaryInput:
+    days: int = 30
+    recent_limit: int = 5
+
+
+class GetDashboardSummaryUseCase:
+    def __init__(self, dashboard_queries: DashboardQueryService) -> None:
+        self._dashboard_queries = dashboard_queries
+
+    async def execute(self, data: GetDashboardSummaryInput) -> DashboardSummary:
+        if data.days < 1 or data.days > MAX_DASHBOARD_DAYS:
+            raise ValidationError(f"days must be between 1 and {MAX_DASHBOARD_DAYS}")
+        if data.recent_limit < 0 or data.recent_limit > MAX_RECENT_SALES:
+            raise ValidationError(f"recent_limit must be between 0 and {MAX_RECENT_SALES}")
+
+        date_to = datetime.now(UTC).date()
+        date_from = date_to - timedelta(days=data.days - 1)
+        return await self._dashboard_queries.get_summary(
+            date_from=date_from,
+            date_to=date_to,
+            recent_limit=data.recent_limit,
+        )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol, Sequence
 
@@ -9,6 +11,8 @@ from app.domain.inventory import InventoryMovement, StockLevel
 class InventoryMovementRepository(Protocol):
     async def add(self, movement: InventoryMovement) -> None: ...  # pragma: no cover
 
+    async def add_many(self, movements: Sequence[InventoryMovement]) -> None: ...  # pragma: no cover
+
     async def list_for_product(
         self,
         product_id: str,
@@ -24,4 +28,31 @@ class InventoryMovementRepository(Protocol):
         as_of: datetime | None = None,
     ) -> StockLevel: ...  # pragma: no cover
 
+    async def get_stock_levels(self, product_ids: Sequence[str]) -> dict[str, int]: ...  # pragma: no cover
+
     async def get_last_movement_at(self, product_id: str) -> datetime | None: ...  # pragma: no cover
+
+
+@dataclass(slots=True)
+class InventoryMovementListItem:
+    """Read model for ledger exports; mapped from column tuples."""
+
+    id: str
+    product_id: str
+    quantity: int
+    direction: str
+    reason: str
+    reference: str | None
+    occurred_at: datetime
+    created_at: datetime
+
+
+class InventoryQueryService(Protocol):
+    def iter_movements(
+        self,
+        *,
+        product_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[InventoryMovementListItem]: ...  # pragma: no cover - streamed with a server-side cursor
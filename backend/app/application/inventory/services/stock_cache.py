@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+from app.application.common.cache import CacheService
+from app.application.inventory.ports import InventoryMovementRepository
+
+STOCK_KEY_PREFIX = "products:stock:"
+DEFAULT_STOCK_TTL_SECONDS = 60
+
+
+class StockLevelCache:
+    """Per-product on-hand quantities cached apart from the catalog pages.
+
+    Catalog listings change rarely and stay cached under ``products:list``;
+    stock moves on every sale, so it lives in one small entry per product that
+    writers drop, once their transaction commits, for just the products they touched.
+    """
+
+    def __init__(
+        self,
+        cache: CacheService,
+        inventory_repo: InventoryMovementRepository,
+        *,
+        ttl: int = DEFAULT_STOCK_TTL_SECONDS,
+    ) -> None:
+        self._cache = cache
+        self._inventory_repo = inventory_repo
+        self._ttl = ttl
+
+    async def get_levels(self, product_ids: Sequence[str]) -> dict[str, int]:
+        if not product_ids:
+            return {}
+        keys = [self.key(product_id) for product_id in product_ids]
+        cached = await self._cache.get_many(keys)
+        levels: dict[str, int] = {}
+        missing: list[str] = []
+        for product_id, key in zip(product_ids, keys):
+            if key in cached:
+                levels[product_id] = int(cached[key])
+            else:
+                missing.append(product_id)
+
+        if missing:
+            fetched = await self._inventory_repo.get_stock_levels(missing)
+            fresh = {product_id: fetched.get(product_id, 0) for product_id in missing}
+            await self._cache.set_many({self.key(pid): qty for pid, qty in fresh.items()}, ttl=self._ttl)
+            levels.update(fresh)
+        return levels
+
+    async def invalidate(self, product_ids: Iterable[str]) -> None:
+        keys = [self.key(product_id) for product_id in dict.fromkeys(product_ids)]
+        if keys:
+            await self._cache.delete_many(keys)
+
+    @staticmethod
+    def key(product_id: str) -> str:
+        return f"{STOCK_KEY_PREFIX}{product_id}"
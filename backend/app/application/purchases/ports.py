@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Protocol, Sequence
+from typing import Mapping, Protocol, Sequence
 
 from app.domain.purchases import PurchaseOrder, PurchaseOrderItem
 
@@ -20,6 +20,31 @@ class SupplierPurchaseSummary:
     last_order_amount: Decimal | None
     open_orders: int
     average_lead_time_hours: Decimal | None
+    p50_lead_time_hours: Decimal | None = None
+    p90_lead_time_hours: Decimal | None = None
+
+
+@dataclass(slots=True)
+class PurchaseListLine:
+    id: str
+    product_id: str
+    quantity: int
+    unit_cost: Decimal
+    line_total: Decimal
+
+
+@dataclass(slots=True)
+class PurchaseListItem:
+    """Read model for purchase order listings; `items` is only populated when explicitly requested."""
+
+    id: str
+    supplier_id: str
+    currency: str
+    total_amount: Decimal
+    total_quantity: int
+    created_at: datetime
+    received_at: datetime | None
+    items: list[PurchaseListLine] = field(default_factory=list)
 
 
 class PurchaseRepository(Protocol):
@@ -31,12 +56,20 @@ class PurchaseRepository(Protocol):
 
     async def get_purchase(self, purchase_id: str) -> PurchaseOrder | None: ...  # pragma: no cover
 
+    async def get_supplier_purchase_summary(self, supplier_id: str) -> SupplierPurchaseSummary: ...  # pragma: no cover
+
+    async def get_supplier_purchase_summaries(
+        self,
+        supplier_ids: Sequence[str],
+    ) -> Mapping[str, SupplierPurchaseSummary]: ...  # pragma: no cover
+
+
+class PurchasesQueryService(Protocol):
     async def list_purchases(
         self,
         *,
         supplier_id: str | None = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[Sequence[PurchaseOrder], int]: ...  # pragma: no cover
-
-    async def get_supplier_purchase_summary(self, supplier_id: str) -> SupplierPurchaseSummary: ...  # pragma: no cover
+        include_items: bool = False,
+    ) -> tuple[Sequence[PurchaseListItem], int]: ...  # pragma: no cover
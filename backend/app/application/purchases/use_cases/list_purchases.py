@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from app.application.purchases.ports import PurchaseRepository
+from app.application.purchases.ports import PurchaseListItem, PurchasesQueryService
 from app.domain.common.errors import ValidationError
-from app.domain.purchases import PurchaseOrder
 
 
 @dataclass(slots=True)
@@ -12,11 +11,12 @@ class ListPurchasesInput:
     page: int = 1
     limit: int = 20
     supplier_id: str | None = None
+    include_items: bool = False
 
 
 @dataclass(slots=True)
 class ListPurchasesResult:
-    purchases: list[PurchaseOrder]
+    purchases: list[PurchaseListItem]
     total: int
     page: int
     limit: int
@@ -24,8 +24,8 @@ class ListPurchasesResult:
 
 
 class ListPurchasesUseCase:
-    def __init__(self, repo: PurchaseRepository) -> None:
-        self._repo = repo
+    def __init__(self, queries: PurchasesQueryService) -> None:
+        self._queries = queries
 
     async def execute(self, data: ListPurchasesInput) -> ListPurchasesResult:
         if data.page < 1:
@@ -34,10 +34,11 @@ class ListPurchasesUseCase:
             raise ValidationError("limit must be between 1 and 100")
 
         offset = (data.page - 1) * data.limit
-        purchases, total = await self._repo.list_purchases(
+        purchases, total = await self._queries.list_purchases(
             supplier_id=data.supplier_id,
             offset=offset,
             limit=data.limit,
+            include_items=data.include_items,
         )
         pages = (total + data.limit - 1) // data.limit if total > 0 else 0
         return ListPurchasesResult(
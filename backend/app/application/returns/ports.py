@@ -1,18 +1,49 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from decimal import Decimal
 from typing import Mapping, Protocol, Sequence
 
 from app.domain.returns import Return, ReturnItem
 
 
+@dataclass(slots=True)
+class ReturnListLine:
+    id: str
+    sale_item_id: str
+    product_id: str
+    quantity: int
+    unit_price: Decimal
+    line_total: Decimal
+
+
+@dataclass(slots=True)
+class ReturnListItem:
+    """Read model for return listings; `items` is only populated when explicitly requested."""
+
+    id: str
+    sale_id: str
+    currency: str
+    total_amount: Decimal
+    total_quantity: int
+    created_at: datetime
+    items: list[ReturnListLine] = field(default_factory=list)
+
+
 class ReturnsRepository(Protocol):
     async def add_return(self, return_: Return, items: Sequence[ReturnItem]) -> None: ...  # pragma: no cover
 
-    async def get_returned_quantities(self, sale_item_ids: Sequence[str]) -> Mapping[str, int]: ...  # pragma: no cover
+    async def claim_returned_quantities(
+        self,
+        sale_id: str,
+        quantities: Mapping[str, int],
+    ) -> set[str]: ...  # pragma: no cover
 
     async def get_by_id(self, return_id: str) -> Return | None: ...  # pragma: no cover
 
+
+class ReturnsQueryService(Protocol):
     async def list_returns(
         self,
         *,
@@ -21,4 +52,5 @@ class ReturnsRepository(Protocol):
         date_to: datetime | None = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[Sequence[Return], int]: ...  # pragma: no cover
+        include_items: bool = False,
+    ) -> tuple[Sequence[ReturnListItem], int]: ...  # pragma: no cover
@@ -3,9 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from app.application.returns.ports import ReturnsRepository
+from app.application.returns.ports import ReturnListItem, ReturnsQueryService
 from app.domain.common.errors import ValidationError
-from app.domain.returns import Return
 
 
 @dataclass(slots=True)
@@ -15,11 +14,12 @@ class ListReturnsInput:
     sale_id: str | None = None
     date_from: datetime | None = None
     date_to: datetime | None = None
+    include_items: bool = False
 
 
 @dataclass(slots=True)
 class ListReturnsResult:
-    returns: list[Return]
+    returns: list[ReturnListItem]
     total: int
     page: int
     limit: int
@@ -27,8 +27,8 @@ class ListReturnsResult:
 
 
 class ListReturnsUseCase:
-    def __init__(self, returns_repo: ReturnsRepository) -> None:
-        self._returns_repo = returns_repo
+    def __init__(self, returns_queries: ReturnsQueryService) -> None:
+        self._returns_queries = returns_queries
 
     async def execute(self, data: ListReturnsInput) -> ListReturnsResult:
         if data.page < 1:
@@ -39,12 +39,13 @@ class ListReturnsUseCase:
             raise ValidationError("date_from must be before or equal to date_to")
 
         offset = (data.page - 1) * data.limit
-        returns, total = await self._returns_repo.list_returns(
+        returns, total = await self._returns_queries.list_returns(
             sale_id=data.sale_id,
             date_from=data.date_from,
             date_to=data.date_to,
             offset=offset,
             limit=data.limit,
+            include_items=data.include_items,
         )
         pages = (total + data.limit - 1) // data.limit if total > 0 else 0
         return ListReturnsResult(returns=list(returns), total=total, page=data.page, limit=data.limit, pages=pages)
@@ -68,13 +68,17 @@ class RecordReturnUseCase:
                 raise ValidationError(f"Sale item {sale_item_id} not found on sale")
             aggregated[sale_item_id] = aggregated.get(sale_item_id, 0) + line.quantity
 
-        prior_quantities = await self._returns_repo.get_returned_quantities(list(aggregated.keys()))
-
         for sale_item_id, requested_qty in aggregated.items():
-            sale_item = sale_items[sale_item_id]
-            already_returned = int(prior_quantities.get(sale_item_id, 0))
-            remaining = sale_item.quantity - already_returned
-            if requested_qty > remaining:
+            if requested_qty > sale_items[sale_item_id].returnable_quantity:
+                raise ValidationError(
+                    f"Return quantity exceeds remaining for sale item {sale_item_id}",
+                )
+
+        # The read above fails fast; this conditional update is the authoritative check
+        # against returns recorded concurrently since the sale was loaded.
+        rejected = await self._returns_repo.claim_returned_quantities(sale.id, aggregated)
+        for sale_item_id in aggregated:
+            if sale_item_id in rejected:
                 raise ValidationError(
                     f"Return quantity exceeds remaining for sale item {sale_item_id}",
                 )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Protocol, Sequence
 
@@ -18,13 +19,63 @@ class CustomerSalesSummary:
     last_sale_at: datetime | None
     last_sale_id: str | None
     last_sale_amount: Decimal | None
+    returned_amount: Decimal = Decimal("0.00")
+
+
+@dataclass(slots=True)
+class SaleListLine:
+    id: str
+    product_id: str
+    quantity: int
+    unit_price: Decimal
+    line_total: Decimal
+    returned_quantity: int = 0
+
+
+@dataclass(slots=True)
+class SaleListItem:
+    """Read model for sale listings; mapped from column tuples instead of the `Sale` aggregate."""
+
+    id: str
+    currency: str
+    total_amount: Decimal
+    total_quantity: int
+    created_at: datetime
+    closed_at: datetime | None
+    customer_id: str | None
+    items: list[SaleListLine] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DailySalesRollup:
+    """One day of pre-aggregated sales for a currency, read from the rollup tables."""
+
+    day: date
+    currency: str
+    sales_count: int
+    quantity: int
+    revenue: Decimal
+    returned_quantity: int
+    returned_amount: Decimal
+
+    @property
+    def net_revenue(self) -> Decimal:
+        return self.revenue - self.returned_amount
 
 
 class SalesRepository(Protocol):
     async def add_sale(self, sale: Sale, items: Sequence[SaleItem]) -> None: ...  # pragma: no cover
 
+    async def add_sales(self, sales: Sequence[Sale]) -> None: ...  # pragma: no cover
+
+    async def existing_ids(self, sale_ids: Sequence[str]) -> set[str]: ...  # pragma: no cover
+
     async def get_by_id(self, sale_id: str) -> Sale | None: ...  # pragma: no cover
 
+    async def get_customer_sales_summary(self, customer_id: str) -> CustomerSalesSummary: ...  # pragma: no cover
+
+
+class SalesQueryService(Protocol):
     async def list_sales(
         self,
         *,
@@ -33,14 +84,25 @@ class SalesRepository(Protocol):
         date_to: datetime | None = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> tuple[Sequence[Sale], int]: ...  # pragma: no cover
+        include_items: bool = False,
+    ) -> tuple[Sequence[SaleListItem], int]: ...  # pragma: no cover
 
-    async def list_sales_for_customer(
+    def iter_sales(
         self,
-        customer_id: str,
         *,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[Sequence[Sale], int]: ...  # pragma: no cover
+        customer_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[SaleListItem]: ...  # pragma: no cover - streamed with a server-side cursor
 
-    async def get_customer_sales_summary(self, customer_id: str) -> CustomerSalesSummary: ...  # pragma: no cover
+
+class SalesReportQueryService(Protocol):
+    async def daily_sales(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        product_id: str | None = None,
+        customer_id: str | None = None,
+    ) -> Sequence[DailySalesRollup]: ...  # pragma: no cover
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from app.application.sales.ports import DailySalesRollup, SalesReportQueryService
+from app.domain.common.errors import ValidationError
+
+MAX_REPORT_DAYS = 366
+
+
+@dataclass(slots=True)
+class GetDailySalesReportInput:
+    date_from: date
+    date_to: date
+    product_id: str | None = None
+    customer_id: str | None = None
+
+
+class GetDailySalesReportUseCase:
+    def __init__(self, report_queries: SalesReportQueryService) -> None:
+        self._report_queries = report_queries
+
+    async def execute(self, data: GetDailySalesReportInput) -> list[DailySalesRollup]:
+        if data.date_from > data.date_to:
+            raise ValidationError("date_from must be before or equal to date_to")
+        if (data.date_to - data.date_from).days >= MAX_REPORT_DAYS:
+            raise ValidationError(f"report range cannot exceed {MAX_REPORT_DAYS} days")
+        if data.product_id is not None and data.customer_id is not None:
+            raise ValidationError("filter by product_id or customer_id, not both")
+
+        rows = await self._report_queries.daily_sales(
+            date_from=data.date_from,
+            date_to=data.date_to,
+            product_id=data.product_id,
+            customer_id=data.customer_id,
+        )
+        return list(rows)
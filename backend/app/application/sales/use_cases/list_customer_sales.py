@@ -3,9 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from app.application.customers.ports import CustomerRepository
-from app.application.sales.ports import SalesRepository
+from app.application.sales.ports import SaleListItem, SalesQueryService
 from app.domain.common.errors import NotFoundError, ValidationError
-from app.domain.sales import Sale
 
 
 @dataclass(slots=True)
@@ -17,7 +16,7 @@ class ListCustomerSalesInput:
 
 @dataclass(slots=True)
 class ListCustomerSalesResult:
-    sales: list[Sale]
+    sales: list[SaleListItem]
     total: int
     page: int
     limit: int
@@ -25,8 +24,8 @@ class ListCustomerSalesResult:
 
 
 class ListCustomerSalesUseCase:
-    def __init__(self, sales_repo: SalesRepository, customer_repo: CustomerRepository) -> None:
-        self._sales_repo = sales_repo
+    def __init__(self, sales_queries: SalesQueryService, customer_repo: CustomerRepository) -> None:
+        self._sales_queries = sales_queries
         self._customer_repo = customer_repo
 
     async def execute(self, data: ListCustomerSalesInput) -> ListCustomerSalesResult:
@@ -40,10 +39,11 @@ class ListCustomerSalesUseCase:
             raise NotFoundError("Customer not found")
 
         offset = (data.page - 1) * data.limit
-        sales, total = await self._sales_repo.list_sales_for_customer(
-            data.customer_id,
+        sales, total = await self._sales_queries.list_sales(
+            customer_id=data.customer_id,
             offset=offset,
             limit=data.limit,
+            include_items=True,
         )
         pages = (total + data.limit - 1) // data.limit if total > 0 else 0
         return ListCustomerSalesResult(
@@ -3,9 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 
-from app.application.sales.ports import SalesRepository
+from app.application.sales.ports import SaleListItem, SalesQueryService
 from app.domain.common.errors import ValidationError
-from app.domain.sales import Sale
 
 
 @dataclass(slots=True)
@@ -15,11 +14,12 @@ class ListSalesInput:
     customer_id: str | None = None
     date_from: datetime | None = None
     date_to: datetime | None = None
+    include_items: bool = False
 
 
 @dataclass(slots=True)
 class ListSalesResult:
-    sales: list[Sale]
+    sales: list[SaleListItem]
     total: int
     page: int
     limit: int
@@ -27,8 +27,8 @@ class ListSalesResult:
 
 
 class ListSalesUseCase:
-    def __init__(self, sales_repo: SalesRepository) -> None:
-        self._sales_repo = sales_repo
+    def __init__(self, sales_queries: SalesQueryService) -> None:
+        self._sales_queries = sales_queries
 
     async def execute(self, data: ListSalesInput) -> ListSalesResult:
         if data.page < 1:
@@ -39,12 +39,13 @@ class ListSalesUseCase:
             raise ValidationError("date_from must be before or equal to date_to")
 
         offset = (data.page - 1) * data.limit
-        sales, total = await self._sales_repo.list_sales(
+        sales, total = await self._sales_queries.list_sales(
             customer_id=data.customer_id,
             date_from=data.date_from,
             date_to=data.date_to,
             offset=offset,
             limit=data.limit,
+            include_items=data.include_items,
         )
         pages = (total + data.limit - 1) // data.limit if total > 0 else 0
         return ListSalesResult(sales=list(sales), total=total, page=data.page, limit=data.limit, pages=pages)
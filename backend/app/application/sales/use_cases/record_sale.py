@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from enum import Enum
 from typing import Sequence
 
 from app.application.catalog.ports import ProductRepository
-from app.application.common.event_dispatcher import EventDispatcher
+from app.application.common.event_dispatcher import EventOutbox
 from app.application.customers.ports import CustomerRepository
 from app.application.inventory.ports import InventoryMovementRepository
 from app.application.sales.ports import SalesRepository
 from app.domain.catalog.entities import Product
-from app.domain.common.errors import ConflictError, NotFoundError, ValidationError
+from app.domain.common.errors import ConcurrencyConflictError, DomainError, NotFoundError, ValidationError
 from app.domain.inventory import InventoryMovement, MovementDirection
 from app.domain.sales import Sale
 from app.domain.sales.events import SaleRecordedEvent
 
+MAX_BATCH_SALES = 500
+# Till clocks drift; sales stamped further ahead than this are rejected rather than trusted.
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
 
 @dataclass(slots=True)
 class SaleLineInput:
@@ -28,6 +34,9 @@ class RecordSaleInput:
     lines: Sequence[SaleLineInput]
     currency: str = "USD"
     customer_id: str | None = None
+    # Batch replay only: client-generated id (idempotency key) and when the till made the sale.
+    sale_id: str | None = None
+    occurred_at: datetime | None = None
 
 
 @dataclass(slots=True)
@@ -36,6 +45,31 @@ class RecordSaleResult:
     movements: list[InventoryMovement]
 
 
+class BatchSaleStatus(str, Enum):
+    RECORDED = "recorded"
+    DUPLICATE = "duplicate"
+    REJECTED = "rejected"
+
+
+@dataclass(slots=True)
+class BatchSaleOutcome:
+    sale_id: str
+    status: BatchSaleStatus
+    sale: Sale | None = None
+    error_code: str | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class RecordSaleBatchResult:
+    outcomes: list[BatchSaleOutcome]
+    movements: list[InventoryMovement] = field(default_factory=list)
+
+    @property
+    def product_ids(self) -> set[str]:
+        return {movement.product_id for movement in self.movements}
+
+
 class RecordSaleUseCase:
     def __init__(
         self,
@@ -43,13 +77,13 @@ class RecordSaleUseCase:
         sales_repo: SalesRepository,
         inventory_repo: InventoryMovementRepository,
         customer_repo: CustomerRepository | None = None,
-        event_dispatcher: EventDispatcher | None = None,
+        outbox: EventOutbox | None = None,
     ) -> None:
         self._product_repo = product_repo
         self._sales_repo = sales_repo
         self._inventory_repo = inventory_repo
         self._customer_repo = customer_repo
-        self._event_dispatcher = event_dispatcher
+        self._outbox = outbox
 
     async def execute(self, data: RecordSaleInput) -> RecordSaleResult:
         if not data.lines:
@@ -84,30 +118,173 @@ class RecordSaleUseCase:
             product.version += 1
             success = await self._product_repo.update(product, expected_version=current_version)
             if not success:
-                raise ConflictError(f"Product {pid} was modified concurrently")
+                raise ConcurrencyConflictError(f"Product {pid} was modified concurrently")
 
             product_cache[pid] = product
 
+        required_quantities.update(self._add_lines(sale, data.lines, product_cache))
+
+        for product_id, required in required_quantities.items():
+            stock = await self._inventory_repo.get_stock_level(product_id)
+            if stock.quantity_on_hand < required:
+                raise ValidationError(f"Insufficient stock for product {product_id}")
+
+        sale.close()
+
+        movements: list[InventoryMovement] = []
+        for movement in self._movements_for(sale):
+            await self._inventory_repo.add(movement)
+            movements.append(movement)
+
+        await self._sales_repo.add_sale(sale, list(sale.iter_items()))
+        await self._publish(sale)
+
+        return RecordSaleResult(sale=sale, movements=movements)
+
+    async def execute_batch(self, inputs: Sequence[RecordSaleInput]) -> RecordSaleBatchResult:
+        """Record many till sales at once, e.g. an offline queue catching up.
+
+        Every input carries a client-generated ``sale_id``; ids that already exist (or repeat
+        within the batch) are reported as duplicates so replays are idempotent, including a
+        replay that races the original. Products are
+        locked and stock is read once for the whole batch, and each sale is validated against
+        the stock left by the sales before it. Invalid sales are rejected individually; the
+        rest are written together.
+        """
+        if not inputs:
+            raise ValidationError("Batch requires at least one sale")
+        if len(inputs) > MAX_BATCH_SALES:
+            raise ValidationError(f"Batch cannot exceed {MAX_BATCH_SALES} sales")
+        keyed: list[tuple[str, RecordSaleInput]] = []
+        for data in inputs:
+            if not data.sale_id:
+                raise ValidationError("Every sale in a batch requires a client-generated id")
+            keyed.append((data.sale_id, data))
+
+        # Lock before checking for duplicates: a concurrent replay of the same batch waits on these
+        # rows and then sees the sales the first one committed.
+        product_ids = {line.product_id for data in inputs for line in data.lines}
+        products = {product.id: product for product in await self._product_repo.get_many(list(product_ids), lock=True)}
+        existing = await self._sales_repo.existing_ids([sale_id for sale_id, _ in keyed])
+        outcomes: dict[int, BatchSaleOutcome] = {}
+        pending: dict[int, tuple[str, RecordSaleInput]] = {}
+        seen: set[str] = set()
+        for index, (sale_id, data) in enumerate(keyed):
+            if sale_id in existing or sale_id in seen:
+                outcomes[index] = BatchSaleOutcome(sale_id=sale_id, status=BatchSaleStatus.DUPLICATE)
+            else:
+                pending[index] = (sale_id, data)
+            seen.add(sale_id)
+
+        customers = await self._load_customers({data.customer_id for _, data in pending.values() if data.customer_id})
+        available = await self._inventory_repo.get_stock_levels(list(products))
+
+        accepted: list[Sale] = []
+        now = datetime.now(UTC)
+        for index, (sale_id, data) in pending.items():
+            try:
+                sale, required = self._build_batch_sale(data, products, customers, now)
+                for product_id, quantity in required.items():
+                    if available.get(product_id, 0) < quantity:
+                        raise ValidationError(f"Insufficient stock for product {product_id}")
+            except DomainError as exc:
+                outcomes[index] = BatchSaleOutcome(
+                    sale_id=sale_id,
+                    status=BatchSaleStatus.REJECTED,
+                    error_code=exc.error_code,
+                    error=exc.message,
+                )
+                continue
+            for product_id, quantity in required.items():
+                available[product_id] -= quantity
+            accepted.append(sale)
+            outcomes[index] = BatchSaleOutcome(sale_id=sale.id, status=BatchSaleStatus.RECORDED, sale=sale)
+
+        movements = [movement for sale in accepted for movement in self._movements_for(sale)]
+        if accepted:
+            touched = {movement.product_id for movement in movements}
+            await self._touch_products([products[product_id] for product_id in sorted(touched)])
+            await self._inventory_repo.add_many(movements)
+            await self._sales_repo.add_sales(accepted)
+            await self._publish(*accepted)
+
+        return RecordSaleBatchResult(outcomes=[outcomes[index] for index in range(len(inputs))], movements=movements)
+
+    def _build_batch_sale(
+        self,
+        data: RecordSaleInput,
+        products: dict[str, Product],
+        customers: dict[str, bool],
+        now: datetime,
+    ) -> tuple[Sale, dict[str, int]]:
+        if not data.lines:
+            raise ValidationError("Sale requires at least one line item")
+        if data.occurred_at is not None and data.occurred_at > now + MAX_CLOCK_SKEW:
+            raise ValidationError("occurred_at cannot be in the future")
+        if data.customer_id is not None:
+            if data.customer_id not in customers:
+                raise NotFoundError("Customer not found")
+            if not customers[data.customer_id]:
+                raise ValidationError("Customer is inactive")
         for line in data.lines:
+            product = products.get(line.product_id)
+            if product is None:
+                raise NotFoundError(f"Product {line.product_id} not found")
+            if not product.active:
+                raise ValidationError(f"Product {product.id} is inactive")
+
+        sale = Sale.start(
+            currency=data.currency,
+            customer_id=data.customer_id,
+            sale_id=data.sale_id,
+            created_at=data.occurred_at,
+        )
+        required = self._add_lines(sale, data.lines, products)
+        sale.close(data.occurred_at)
+        return sale, required
+
+    @staticmethod
+    def _add_lines(sale: Sale, lines: Sequence[SaleLineInput], products: dict[str, Product]) -> dict[str, int]:
+        required: dict[str, int] = {}
+        for line in lines:
             if line.quantity <= 0:
                 raise ValidationError("Quantity must be positive")
             if line.unit_price <= Decimal("0"):
                 raise ValidationError("Unit price must be positive")
 
-            product = product_cache[line.product_id]
+            product = products[line.product_id]
             sale.add_line(product_id=product.id, quantity=line.quantity, unit_price=line.unit_price)
-            required_quantities[product.id] = required_quantities.get(product.id, 0) + line.quantity
+            required[product.id] = required.get(product.id, 0) + line.quantity
+        return required
 
-        for product_id, required in required_quantities.items():
-            stock = await self._inventory_repo.get_stock_level(product_id)
-            if stock.quantity_on_hand < required:
-                raise ValidationError(f"Insufficient stock for product {product_id}")
+    async def _load_customers(self, customer_ids: set[str]) -> dict[str, bool]:
+        """Map each known customer id to whether it is active; unknown ids are left out."""
+        if not customer_ids:
+            return {}
+        if self._customer_repo is None:
+            raise ValidationError("Customer support is not configured")
+        customers: dict[str, bool] = {}
+        for customer_id in sorted(customer_ids):
+            customer = await self._customer_repo.get_by_id(customer_id)
+            if customer is not None:
+                customers[customer.id] = customer.active
+        return customers
 
-        sale.close()
+    async def _touch_products(self, products: Sequence[Product]) -> None:
+        # Same serialization as the single-sale path: bump each product's version under lock.
+        updates = []
+        for product in products:
+            updates.append((product, product.version))
+            product.version += 1
+        written = await self._product_repo.update_many(updates)
+        stale = sorted({product.id for product in products} - written)
+        if stale:
+            raise ConcurrencyConflictError(f"Product {stale[0]} was modified concurrently")
 
-        movements: list[InventoryMovement] = []
-        for item in sale.iter_items():
-            movement = InventoryMovement.record(
+    @staticmethod
+    def _movements_for(sale: Sale) -> list[InventoryMovement]:
+        return [
+            InventoryMovement.record(
                 product_id=item.product_id,
                 quantity=item.quantity,
                 direction=MovementDirection.OUT,
@@ -115,18 +292,20 @@ class RecordSaleUseCase:
                 reference=sale.id,
                 occurred_at=sale.closed_at,
             )
-            await self._inventory_repo.add(movement)
-            movements.append(movement)
-
-        await self._sales_repo.add_sale(sale, list(sale.iter_items()))
+            for item in sale.iter_items()
+        ]
 
-        if self._event_dispatcher is not None:
-            event = SaleRecordedEvent(
-                aggregate_id=sale.id,
-                total_amount=str(sale.total_amount.amount),
-                currency=sale.currency,
-                customer_id=sale.customer_id,
-            )
-            await self._event_dispatcher.publish(event)
-
-        return RecordSaleResult(sale=sale, movements=movements)
+    async def _publish(self, *sales: Sale) -> None:
+        if self._outbox is None:
+            return
+        await self._outbox.add(
+            [
+                SaleRecordedEvent(
+                    aggregate_id=sale.id,
+                    total_amount=str(sale.total_amount.amount),
+                    currency=sale.currency,
+                    customer_id=sale.customer_id,
+                )
+                for sale in sales
+            ]
+        )
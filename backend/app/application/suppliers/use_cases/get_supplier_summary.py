@@ -23,6 +23,31 @@ class SupplierSummaryResult:
     average_order_value: Decimal | None
     open_orders: int
     average_lead_time_hours: Decimal | None
+    p50_lead_time_hours: Decimal | None = None
+    p90_lead_time_hours: Decimal | None = None
+
+
+def build_supplier_summary(supplier_id: str, summary: SupplierPurchaseSummary) -> SupplierSummaryResult:
+    average_order_value: Decimal | None = None
+    if summary.total_orders > 0:
+        average_order_value = (summary.total_amount / Decimal(summary.total_orders)).quantize(Decimal("0.01"))
+
+    return SupplierSummaryResult(
+        supplier_id=supplier_id,
+        currency=summary.currency,
+        total_orders=summary.total_orders,
+        total_amount=summary.total_amount,
+        total_quantity=summary.total_quantity,
+        first_order_at=summary.first_order_at,
+        last_order_at=summary.last_order_at,
+        last_order_id=summary.last_order_id,
+        last_order_amount=summary.last_order_amount,
+        average_order_value=average_order_value,
+        open_orders=summary.open_orders,
+        average_lead_time_hours=summary.average_lead_time_hours,
+        p50_lead_time_hours=summary.p50_lead_time_hours,
+        p90_lead_time_hours=summary.p90_lead_time_hours,
+    )
 
 
 class GetSupplierSummaryUseCase:
@@ -36,21 +61,4 @@ class GetSupplierSummaryUseCase:
             raise NotFoundError("Supplier not found")
 
         summary: SupplierPurchaseSummary = await self._purchase_repo.get_supplier_purchase_summary(supplier_id)
-        average_order_value: Decimal | None = None
-        if summary.total_orders > 0:
-            average_order_value = (summary.total_amount / Decimal(summary.total_orders)).quantize(Decimal("0.01"))
-
-        return SupplierSummaryResult(
-            supplier_id=supplier.id,
-            currency=summary.currency,
-            total_orders=summary.total_orders,
-            total_amount=summary.total_amount,
-            total_quantity=summary.total_quantity,
-            first_order_at=summary.first_order_at,
-            last_order_at=summary.last_order_at,
-            last_order_id=summary.last_order_id,
-            last_order_amount=summary.last_order_amount,
-            average_order_value=average_order_value,
-            open_orders=summary.open_orders,
-            average_lead_time_hours=summary.average_lead_time_hours,
-        )
+        return build_supplier_summary(supplier.id, summary)
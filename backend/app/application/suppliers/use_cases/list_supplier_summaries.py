@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from app.application.purchases.ports import PurchaseRepository
+from app.application.suppliers.ports import SupplierRepository
+from app.application.suppliers.use_cases.get_supplier_summary import (
+    SupplierSummaryResult,
+    build_supplier_summary,
+)
+from app.domain.common.errors import ValidationError
+
+
+@dataclass(slots=True)
+class ListSupplierSummariesInput:
+    page: int = 1
+    limit: int = 20
+    search: str | None = None
+    active: bool | None = None
+
+
+@dataclass(slots=True)
+class SupplierSummaryEntry:
+    name: str
+    active: bool
+    summary: SupplierSummaryResult
+
+
+@dataclass(slots=True)
+class ListSupplierSummariesResult:
+    items: list[SupplierSummaryEntry]
+    total: int
+    page: int
+    limit: int
+    pages: int
+
+
+class ListSupplierSummariesUseCase:
+    """Procurement overview: one page of suppliers plus their purchase summaries in a single batched query."""
+
+    def __init__(self, supplier_repo: SupplierRepository, purchase_repo: PurchaseRepository) -> None:
+        self._supplier_repo = supplier_repo
+        self._purchase_repo = purchase_repo
+
+    async def execute(self, data: ListSupplierSummariesInput) -> ListSupplierSummariesResult:
+        if data.page < 1:
+            raise ValidationError("page must be >= 1")
+        if data.limit < 1 or data.limit > 100:
+            raise ValidationError("limit must be between 1 and 100")
+
+        offset = (data.page - 1) * data.limit
+        suppliers, total = await self._supplier_repo.list_suppliers(
+            search=data.search,
+            active=data.active,
+            offset=offset,
+            limit=data.limit,
+        )
+        summaries = await self._purchase_repo.get_supplier_purchase_summaries([supplier.id for supplier in suppliers])
+        items = [
+            SupplierSummaryEntry(
+                name=supplier.name,
+                active=supplier.active,
+                summary=build_supplier_summary(supplier.id, summaries[supplier.id]),
+            )
+            for supplier in suppliers
+        ]
+        pages = (total + data.limit - 1) // data.limit if total > 0 else 0
+        return ListSupplierSummariesResult(
+            items=items,
+            total=total,
+            page=data.page,
+            limit=data.limit,
+            pages=pages,
+        )
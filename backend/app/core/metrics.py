@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (seconds) of the histogram buckets every timing is sorted into.
+TIMING_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(slots=True)
+class _Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(TIMING_BUCKETS) + 1))
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(TIMING_BUCKETS, seconds)] += 1
+
+    def cumulative_buckets(self) -> dict[str, int]:
+        running = 0
+        result: dict[str, int] = {}
+        for bound, count in zip([*map(str, TIMING_BUCKETS), "+Inf"], self.buckets):
+            running += count
+            result[bound] = running
+        return result
+
+
+class MetricsRegistry:
+    """In-process counters, timings and callback gauges, read by ``GET /metrics``.
+
+    Values are per worker process; scrape every worker (or aggregate in the collector).
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, int] = {}
+        self._timings: dict[str, _Timing] = {}
+        self._gauges: dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = self._timings[name] = _Timing()
+        timing.observe(seconds)
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        self._gauges[name] = read
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "counters": dict(sorted(self._counters.items())),
+            "gauges": {name: read() for name, read in sorted(self._gauges.items())},
+            "timings": {
+                name: {
+                    "count": timing.count,
+                    "avg_seconds": timing.total / timing.count if timing.count else 0.0,
+                    "max_seconds": timing.max,
+                    "buckets": timing.cumulative_buckets(),
+                }
+                for name, timing in sorted(self._timings.items())
+            },
+        }
+
+
+metrics = MetricsRegistry()
@@ -25,14 +25,62 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./dev.db"  # Development default; override outside dev/test.
+    # Connection pool per worker process: pool_size + max_overflow is the most connections it opens.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Server-side statement timeout (Postgres only); 0 leaves the server default.
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # Optional streaming replica for read-only endpoints; unset routes every read to the primary.
+    DATABASE_REPLICA_URL: str | None = None
+    # Replica lag assumed for timestamp consistency tokens (non-Postgres primaries).
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = 2.0
+    # Sale/return/purchase transactions replayed after a lost version race, deadlock or serialization failure.
+    TRANSACTION_RETRY_ATTEMPTS: int = 4
+    TRANSACTION_RETRY_BASE_SECONDS: float = 0.02
+    TRANSACTION_RETRY_MAX_SECONDS: float = 0.5
+    # Domain events are written to the outbox with the sale and relayed to subscribers in the background (0 disables).
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = 0.5
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_BASE_SECONDS: float = 1.0
+    OUTBOX_RETRY_MAX_SECONDS: float = 300.0
     DATABASE_ECHO: bool | None = None
 
     # Security
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    # Background purge of expired and revoked refresh tokens; 0 disables it
+    # (run scripts/purge_refresh_tokens.py instead).
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: float = 3600.0
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # Revoked tokens are kept this long after revocation so replays still report `token_revoked`
+    # rather than `invalid_token`.
+    REFRESH_TOKEN_REVOKED_RETENTION_HOURS: int = 24
+    # Admin action audit entries are spooled here and bulk-inserted in the background.
+    AUDIT_SPOOL_DIR: str = "./var/audit-spool"
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_BATCH_SIZE: int = 200
     JWT_ALGORITHM: str = "HS256"
     JWT_SECRET_KEY: str = _DEFAULT_SECRET_SENTINEL
     JWT_ISSUER: str = "retail-pos"
+    # Seconds an authenticated user is reused without a DB lookup; 0 disables the cache.
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 5.0
+    # Argon2 cost; changing these upgrades each stored hash on the user's next successful login.
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KIB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    # Threads hashing/verifying at once per worker; further requests queue instead of blocking the loop.
+    PASSWORD_HASH_WORKERS: int = 4
+    # Failed logins allowed per email / per client address inside the window before a lockout.
+    LOGIN_MAX_FAILURES_PER_EMAIL: int = 5
+    LOGIN_MAX_FAILURES_PER_CLIENT: int = 30
+    LOGIN_FAILURE_WINDOW_SECONDS: float = 300.0
+    # Lockouts start here and double with every further failure, up to the max.
+    LOGIN_LOCKOUT_BASE_SECONDS: float = 30.0
+    LOGIN_LOCKOUT_MAX_SECONDS: float = 3600.0
 
     # CORS / Hosts
     CORS_ORIGINS: list[str] = []
@@ -43,6 +91,7 @@ class Settings(BaseSettings):
         "Content-Type",
         "X-Requested-With",
         "X-Trace-Id",
+        "X-Consistency-Token",
     ]
     ALLOWED_HOSTS: list[str] = ["*"]
 
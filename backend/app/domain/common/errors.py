@@ -42,6 +42,16 @@ class ConflictError(DomainError):
         super().__init__(message, status_code=409, error_code=code)
 
 
+class ConcurrencyConflictError(ConflictError):
+    """Lost an optimistic-lock race; replaying the whole unit of work may succeed."""
+
+
+class TooManyRequestsError(DomainError):
+    def __init__(self, message: str, *, retry_after: int, code: str = "too_many_requests") -> None:
+        super().__init__(message, status_code=429, error_code=code)
+        self.retry_after = retry_after
+
+
 class TokenError(UnauthorizedError):
     def __init__(self, message: str, code: str = "invalid_token") -> None:
         super().__init__(message, code=code)
@@ -1,57 +1,163 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import FrozenInstanceError, dataclass
 from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Protocol
 
 from app.domain.common.errors import ValidationError
 
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0")
+
 
-@dataclass(frozen=True, slots=True)
 class Money:
-    amount: Decimal
-    currency: str = "USD"
+    """Non-negative amount in a currency, backed by integer minor units (cents).
+
+    Construction rounds half-up to cents exactly as the Decimal-backed version did. Each
+    instance keeps whichever of ``amount``/``cents`` it was built from and derives the other
+    on first use, so mapping rows stays one quantize and arithmetic stays in integers.
+    """
+
+    __slots__ = ("_amount", "_cents", "currency")
+
+    _amount: Decimal | None
+    _cents: int | None
+    currency: str
+
+    def __init__(self, amount: Decimal | int | str, currency: str = "USD") -> None:
+        if not isinstance(amount, Decimal):
+            amount = Decimal(str(amount))
+        amount = amount.quantize(_CENT, rounding=ROUND_HALF_UP)
+        if amount < _ZERO:
+            raise ValidationError("Money amount cannot be negative", code="money.negative_amount")
+        _set_amount(self, amount)
+        _set_cents(self, None)
+        _set_currency(self, currency)
 
-    def __post_init__(self) -> None:
-        object.__setattr__(self, "amount", self._quantize(self.amount))
-        if self.amount < Decimal("0"):
+    @classmethod
+    def from_cents(cls, cents: int, currency: str = "USD") -> Money:
+        if cents < 0:
             raise ValidationError("Money amount cannot be negative", code="money.negative_amount")
+        money = object.__new__(cls)
+        _set_amount(money, None)
+        _set_cents(money, cents)
+        _set_currency(money, currency)
+        return money
 
-    @staticmethod
-    def _quantize(value: Decimal) -> Decimal:
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    @classmethod
+    def total(cls, values: Iterable[Money], currency: str = "USD") -> Money:
+        cents = 0
+        for value in values:
+            if value.currency != currency:
+                raise ValidationError("Currency mismatch", code="money.currency_mismatch")
+            cents += value.cents
+        return cls.from_cents(cents, currency)
+
+    @property
+    def cents(self) -> int:
+        cents = self._cents
+        if cents is None:
+            cents = int(self._amount * 100)  # type: ignore[operator]
+            _set_cents(self, cents)
+        return cents
+
+    @property
+    def amount(self) -> Decimal:
+        amount = self._amount
+        if amount is None:
+            amount = Decimal(self._cents).scaleb(-2)  # type: ignore[arg-type]
+            _set_amount(self, amount)
+        return amount
 
     def add(self, other: Money) -> Money:
         self._assert_currency(other)
-        return Money(self.amount + other.amount, self.currency)
+        return Money.from_cents(self.cents + other.cents, self.currency)
 
     def subtract(self, other: Money) -> Money:
         self._assert_currency(other)
-        if other.amount > self.amount:
+        if other.cents > self.cents:
             raise ValidationError("Resulting money would be negative", code="money.negative_result")
-        return Money(self.amount - other.amount, self.currency)
+        return Money.from_cents(self.cents - other.cents, self.currency)
 
     def multiply(self, multiplier: int | Decimal) -> Money:
-        return Money(self.amount * Decimal(multiplier), self.currency)
+        if isinstance(multiplier, int):
+            return Money.from_cents(self.cents * multiplier, self.currency)
+        return Money(self.amount * multiplier, self.currency)
 
     def _assert_currency(self, other: Money) -> None:
         if self.currency != other.currency:
             raise ValidationError("Currency mismatch", code="money.currency_mismatch")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.cents == other.cents and self.currency == other.currency
+
+    def __hash__(self) -> int:
+        return hash((self.cents, self.currency))
+
     def __lt__(self, other: Money) -> bool:
         self._assert_currency(other)
-        return self.amount < other.amount
+        return self.cents < other.cents
 
     def __le__(self, other: Money) -> bool:
         self._assert_currency(other)
-        return self.amount <= other.amount
+        return self.cents <= other.cents
 
     def __gt__(self, other: Money) -> bool:
         self._assert_currency(other)
-        return self.amount > other.amount
+        return self.cents > other.cents
 
     def __ge__(self, other: Money) -> bool:
         self._assert_currency(other)
-        return self.amount >= other.amount
+        return self.cents >= other.cents
+
+    def __repr__(self) -> str:
+        return f"Money(amount={self.amount!r}, currency={self.currency!r})"
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"{self.currency} {self.amount}"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (Money.from_cents, (self.cents, self.currency))
+
+
+# Slot setters bypass the frozen ``__setattr__`` (cheaper than ``object.__setattr__`` per field).
+_set_amount = Money._amount.__set__  # type: ignore[attr-defined]
+_set_cents = Money._cents.__set__  # type: ignore[attr-defined]
+_set_currency = Money.currency.__set__  # type: ignore[attr-defined]
+
+
+class _Line(Protocol):
+    quantity: int
+    line_total: Money
+
+
+@dataclass(frozen=True, slots=True)
+class LineTotals:
+    """Amount/quantity totals of an entity's lines, summed in one pass.
+
+    Entities do not keep these: ``items`` is a plain list that repositories and query
+    services extend directly, so callers needing both figures take one snapshot instead.
+    """
+
+    amount: Money
+    quantity: int
+
+    @classmethod
+    def of(cls, items: Iterable[_Line], currency: str) -> LineTotals:
+        cents = 0
+        quantity = 0
+        for line in items:
+            if line.line_total.currency != currency:
+                raise ValidationError("Currency mismatch", code="money.currency_mismatch")
+            cents += line.line_total.cents
+            quantity += line.quantity
+        return cls(Money.from_cents(cents, currency), quantity)
@@ -7,7 +7,7 @@ from decimal import Decimal
 
 from app.domain.common.errors import ValidationError
 from app.domain.common.identifiers import new_ulid
-from app.domain.common.money import Money
+from app.domain.common.money import LineTotals, Money
 
 
 @dataclass(slots=True)
@@ -83,14 +83,14 @@ class PurchaseOrder:
 
     @property
     def total_amount(self) -> Money:
-        total = Money(Decimal("0"), self.currency)
-        for item in self.items:
-            total = total.add(item.line_total)
-        return total
+        return self.totals().amount
 
     @property
     def total_quantity(self) -> int:
-        return sum(item.quantity for item in self.items)
+        return self.totals().quantity
+
+    def totals(self) -> LineTotals:
+        return LineTotals.of(self.items, self.currency)
 
     def iter_items(self) -> Iterable[PurchaseOrderItem]:
         return iter(self.items)
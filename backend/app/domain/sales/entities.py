@@ -7,7 +7,7 @@ from decimal import Decimal
 
 from app.domain.common.errors import ValidationError
 from app.domain.common.identifiers import new_ulid
-from app.domain.common.money import Money
+from app.domain.common.money import LineTotals, Money
 
 
 @dataclass(slots=True)
@@ -17,6 +17,11 @@ class SaleItem:
     quantity: int
     unit_price: Money
     line_total: Money
+    returned_quantity: int = 0
+
+    @property
+    def returnable_quantity(self) -> int:
+        return self.quantity - self.returned_quantity
 
     @staticmethod
     def create(
@@ -52,10 +57,19 @@ class Sale:
     customer_id: str | None = None
 
     @staticmethod
-    def start(currency: str = "USD", *, customer_id: str | None = None) -> Sale:
+    def start(
+        currency: str = "USD",
+        *,
+        customer_id: str | None = None,
+        sale_id: str | None = None,
+        created_at: datetime | None = None,
+    ) -> Sale:
         if not currency or len(currency) != 3:
             raise ValidationError("currency must be a 3-letter code", code="sale.invalid_currency")
-        return Sale(id=new_ulid(), currency=currency.upper(), customer_id=customer_id)
+        sale = Sale(id=sale_id or new_ulid(), currency=currency.upper(), customer_id=customer_id)
+        if created_at is not None:
+            sale.created_at = created_at
+        return sale
 
     def add_item(self, item: SaleItem) -> None:
         if self.closed_at is not None:
@@ -75,12 +89,12 @@ class Sale:
         self.add_item(item)
         return item
 
-    def close(self) -> None:
+    def close(self, at: datetime | None = None) -> None:
         if not self.items:
             raise ValidationError("sale must have at least one item", code="sale.empty")
         if self.closed_at is not None:
             raise ValidationError("sale already closed", code="sale.already_closed")
-        self.closed_at = datetime.now(UTC)
+        self.closed_at = at or datetime.now(UTC)
 
     def assign_customer(self, customer_id: str | None) -> None:
         self.customer_id = customer_id
@@ -91,14 +105,14 @@ class Sale:
 
     @property
     def total_amount(self) -> Money:
-        total = Money(Decimal("0"), self.currency)
-        for item in self.items:
-            total = total.add(item.line_total)
-        return total
+        return self.totals().amount
 
     @property
     def total_quantity(self) -> int:
-        return sum(item.quantity for item in self.items)
+        return self.totals().quantity
+
+    def totals(self) -> LineTotals:
+        return LineTotals.of(self.items, self.currency)
 
     def iter_items(self) -> Iterable[SaleItem]:
         return iter(self.items)
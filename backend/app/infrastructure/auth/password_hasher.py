@@ -1,26 +1,75 @@
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TypeVar
+
 from passlib.context import CryptContext
 
+from app.core.metrics import metrics
+from app.core.settings import get_settings
 from app.domain.common.errors import ValidationError
 
-_pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+T = TypeVar("T")
+
+
+@lru_cache
+def _pwd_context() -> CryptContext:
+    settings = get_settings()
+    # Hashes made with other parameters still verify; `needs_rehash` flags them for upgrade at login.
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__rounds=settings.ARGON2_TIME_COST,
+        argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+        argon2__parallelism=settings.ARGON2_PARALLELISM,
+    )
+
+
+@lru_cache
+def _executor() -> ThreadPoolExecutor:
+    # argon2-cffi releases the GIL, so threads hash in parallel; max_workers is the concurrency cap.
+    return ThreadPoolExecutor(max_workers=get_settings().PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+
+def _timed(operation: str, fn: Callable[[], T], submitted_at: float) -> T:
+    started = time.perf_counter()
+    metrics.observe(f"auth.password_{operation}.queue_seconds", started - submitted_at)
+    try:
+        return fn()
+    finally:
+        metrics.observe(f"auth.password_{operation}.run_seconds", time.perf_counter() - started)
+
+
+async def _offload(operation: str, fn: Callable[[], T]) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor(), _timed, operation, fn, time.perf_counter())
 
 
 class PasswordHasher:
-    def hash(self, raw: str) -> str:
+    """Argon2 hashing run on a bounded worker pool so logins never block the event loop."""
+
+    async def hash(self, raw: str) -> str:
         if not raw or len(raw) < 8:
             raise ValidationError("Password too short", code="user.password_too_short")
-        return _pwd_context.hash(raw)
+        return await _offload("hash", lambda: _pwd_context().hash(raw))
+
+    async def verify(self, raw: str, hashed: str) -> bool:
+        return await _offload("verify", lambda: _pwd_context().verify(raw, hashed))
 
-    def verify(self, raw: str, hashed: str) -> bool:  # pragma: no cover - simple wrapper
-        return _pwd_context.verify(raw, hashed)
+    def needs_rehash(self, hashed: str) -> bool:
+        return _pwd_context().needs_update(hashed)
 
 
 # Backwards compatible functional helpers if any earlier code used them
 def hash_password(raw: str) -> str:  # pragma: no cover
-    return PasswordHasher().hash(raw)
+    if not raw or len(raw) < 8:
+        raise ValidationError("Password too short", code="user.password_too_short")
+    return _pwd_context().hash(raw)
 
 
 def verify_password(raw: str, hashed: str) -> bool:  # pragma: no cover
-    return PasswordHasher().verify(raw, hashed)
+    return _pwd_context().verify(raw, hashed)
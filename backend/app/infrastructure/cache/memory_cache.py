@@ -1,20 +1,46 @@
-from typing import Any
+import time
+from typing import Any, Mapping, Sequence
 from app.application.common.cache import CacheService
 
 class MemoryCacheService(CacheService):
     def __init__(self):
-        self._cache: dict[str, Any] = {}
+        # key -> (expires_at on the monotonic clock, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
 
     async def get(self, key: str) -> Any | None:
-        return self._cache.get(key)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
 
     async def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        self._cache[key] = value
+        self._cache[key] = (time.monotonic() + ttl, value)
+
+    async def set_many(self, values: Mapping[str, Any], ttl: int = 300) -> None:
+        expires_at = time.monotonic() + ttl
+        for key, value in values.items():
+            self._cache[key] = (expires_at, value)
 
     async def delete(self, key: str) -> None:
         if key in self._cache:
             del self._cache[key]
 
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+
     async def clear_prefix(self, prefix: str) -> None:
         keys_to_delete = [k for k in self._cache if k.startswith(prefix)]
         for k in keys_to_delete:
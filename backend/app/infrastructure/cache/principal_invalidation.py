@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.auth.services.principal_cache import PrincipalCache
+from app.infrastructure.db.post_commit import call_after_commit
+
+PRINCIPAL_INVALIDATION_CHANNEL = "auth:principal:invalidate"
+_RECONNECT_DELAY_SECONDS = 1.0
+
+logger = structlog.get_logger(__name__)
+
+
+class RedisPrincipalInvalidationBus:
+    """Fans principal-cache invalidations out to every worker over Redis pub/sub."""
+
+    def __init__(self, redis: Redis, cache: PrincipalCache) -> None:
+        self._redis = redis
+        self._cache = cache
+
+    async def publish(self, user_id: str) -> None:
+        try:
+            await self._redis.publish(PRINCIPAL_INVALIDATION_CHANNEL, user_id)
+        except Exception:  # local entry is already gone; peers fall back to the TTL
+            logger.warning("principal_invalidation_publish_failed", user_id=user_id)
+
+    async def listen(self) -> None:
+        """Drop local entries for ids published by any worker; reconnects until cancelled."""
+        while True:
+            try:
+                async with self._redis.pubsub() as pubsub:
+                    await pubsub.subscribe(PRINCIPAL_INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._cache.drop(str(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("principal_invalidation_listener_disconnected")
+                # Anything published while disconnected was missed.
+                self._cache.clear()
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+
+class PostCommitPrincipalInvalidator:
+    """Request-scoped invalidator that evicts a principal only once the request transaction commits.
+
+    Evicting earlier let a concurrent request re-read the pre-commit user and cache it for a full TTL.
+    """
+
+    def __init__(self, session: AsyncSession, cache: PrincipalCache) -> None:
+        self._session = session
+        self._cache = cache
+
+    async def invalidate(self, user_id: str) -> None:
+        call_after_commit(self._session, lambda: self._cache.invalidate(user_id))
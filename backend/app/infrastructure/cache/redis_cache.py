@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import Any, Mapping, Sequence
 from redis.asyncio import Redis
 from app.application.common.cache import CacheService
 
@@ -13,14 +13,32 @@ class RedisCacheService(CacheService):
             return json.loads(val)
         return None
 
+    async def get_many(self, keys: Sequence[str]) -> dict[str, Any]:
+        if not keys:
+            return {}
+        values = await self._redis.mget(list(keys))
+        return {key: json.loads(val) for key, val in zip(keys, values) if val}
+
     async def set(self, key: str, value: Any, ttl: int = 300) -> None:
         # Use default serializer (json)
         # For complex objects, we might need Pydantic .model_dump_json() before calling this
         await self._redis.set(key, json.dumps(value), ex=ttl)
 
+    async def set_many(self, values: Mapping[str, Any], ttl: int = 300) -> None:
+        if not values:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, json.dumps(value), ex=ttl)
+            await pipe.execute()
+
     async def delete(self, key: str) -> None:
         await self._redis.delete(key)
 
+    async def delete_many(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self._redis.delete(*keys)
+
     async def clear_prefix(self, prefix: str) -> None:
         keys = await self._redis.keys(f"{prefix}*")
         if keys:
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import math
+import secrets
+from collections import deque
+
+from redis.asyncio import Redis
+
+_EVENTS = ":events"
+_LOCK = ":lock"
+_STRIKES = ":strikes"
+
+
+class MemorySlidingWindowStore:
+    """Per-process sliding windows, used when Redis is unreachable; limits then apply per worker."""
+
+    def __init__(self, max_keys: int = 10_000) -> None:
+        self._events: dict[str, deque[float]] = {}
+        self._locks: dict[str, float] = {}
+        # key -> (strike count, expires_at)
+        self._strikes: dict[str, tuple[int, float]] = {}
+        self._max_keys = max_keys
+
+    async def hit(self, key: str, *, now: float, window: float) -> int:
+        events = self._events.get(key)
+        if events is None:
+            if len(self._events) >= self._max_keys:
+                self._sweep(now, window)
+            events = self._events[key] = deque()
+        while events and events[0] <= now - window:
+            events.popleft()
+        events.append(now)
+        return len(events)
+
+    async def strike(self, key: str, *, now: float, ttl: float) -> int:
+        count, expires_at = self._strikes.get(key, (0, 0.0))
+        if expires_at <= now:
+            count = 0
+        count += 1
+        self._strikes[key] = (count, now + ttl)
+        return count
+
+    async def lock(self, key: str, *, until: float, now: float) -> None:
+        self._locks[key] = until
+
+    async def locked_until(self, key: str, *, now: float) -> float | None:
+        until = self._locks.get(key)
+        if until is not None and until <= now:
+            del self._locks[key]
+            return None
+        return until
+
+    async def clear(self, key: str) -> None:
+        self._events.pop(key, None)
+        self._locks.pop(key, None)
+        self._strikes.pop(key, None)
+
+    def _sweep(self, now: float, window: float) -> None:
+        for key in [k for k, events in self._events.items() if not events or events[-1] <= now - window]:
+            del self._events[key]
+        for key in [k for k, until in self._locks.items() if until <= now]:
+            del self._locks[key]
+        for key in [k for k, (_, expires_at) in self._strikes.items() if expires_at <= now]:
+            del self._strikes[key]
+
+
+class RedisSlidingWindowStore:
+    """Sliding windows shared by every worker: a sorted set of failure timestamps per key."""
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+
+    async def hit(self, key: str, *, now: float, window: float) -> int:
+        events = key + _EVENTS
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(events, "-inf", now - window)
+            # Random suffix keeps simultaneous failures from collapsing into one member.
+            pipe.zadd(events, {f"{now}:{secrets.token_hex(4)}": now})
+            pipe.zcard(events)
+            pipe.expire(events, math.ceil(window))
+            results = await pipe.execute()
+        return int(results[2])
+
+    async def strike(self, key: str, *, now: float, ttl: float) -> int:
+        strikes = key + _STRIKES
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.incr(strikes)
+            pipe.expire(strikes, math.ceil(ttl))
+            results = await pipe.execute()
+        return int(results[0])
+
+    async def lock(self, key: str, *, until: float, now: float) -> None:
+        await self._redis.set(key + _LOCK, repr(until), ex=max(1, math.ceil(until - now)))
+
+    async def locked_until(self, key: str, *, now: float) -> float | None:
+        value = await self._redis.get(key + _LOCK)
+        if value is None:
+            return None
+        until = float(value)
+        return until if until > now else None
+
+    async def clear(self, key: str) -> None:
+        await self._redis.delete(key + _EVENTS, key + _LOCK, key + _STRIKES)
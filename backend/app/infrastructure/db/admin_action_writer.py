@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.auth.admin_action_log import AdminActionLog
+from app.infrastructure.db.models.auth.admin_action_log_model import AdminActionLogModel
+from app.infrastructure.db.post_commit import call_after_commit
+from app.infrastructure.db.utils import upsert_insert
+
+# Exclusive, non-blocking segment lock; raises OSError while another process holds it.
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock(handle: TextIO) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(handle: TextIO) -> None:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+logger = structlog.get_logger(__name__)
+
+_SEGMENT_GLOB = "admin-actions-*.jsonl"
+
+
+class BufferedAdminActionWriter:
+    """Audit sink that takes admin actions off the request path.
+
+    ``add`` appends the entry to a local spool segment and buffers it; a background task
+    bulk-inserts sealed segments every ``flush_interval`` seconds (sooner once ``batch_size``
+    entries are waiting) and deletes each segment only after its rows are committed. Inserts
+    ignore ids that already exist, so segments replayed after a crash are delivered at least
+    once without duplicates. The spool is flushed to the OS on every entry but not fsynced:
+    it survives a worker crash, not a host power loss.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        spool_dir: str | os.PathLike[str],
+        *,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._spool_dir = Path(spool_dir)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._segment: TextIO | None = None
+        self._segment_path: Path | None = None
+        self._segment_logs: list[AdminActionLog] = []
+        self._undelivered: deque[tuple[Path, list[AdminActionLog]]] = deque()
+        self._lock = asyncio.Lock()
+        self._spool_lock = asyncio.Lock()  # serialises spool writes, which run in a worker thread
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._segment_logs) + sum(len(logs) for _, logs in self._undelivered)
+
+    async def add(self, log: AdminActionLog) -> None:
+        line = json.dumps(_encode(log)) + "\n"
+        async with self._spool_lock:
+            await asyncio.to_thread(self._append, line)
+            self._segment_logs.append(log)
+        if self._wake is not None and len(self._segment_logs) >= self._batch_size:
+            self._wake.set()
+
+    async def flush(self) -> None:
+        """Insert everything added so far; a failed segment stays queued (and spooled) for the next try."""
+        async with self._lock:
+            async with self._spool_lock:
+                self._seal()
+            while self._undelivered:
+                path, logs = self._undelivered[0]
+                await self._insert(logs)
+                self._undelivered.popleft()
+                with contextlib.suppress(FileNotFoundError):
+                    path.unlink()
+
+    async def start(self) -> None:
+        self._recover()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            self._wake = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("admin_action_flush_failed", pending=self.pending)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            # asyncio.timeout rather than wait_for: on 3.11 wait_for can swallow stop()'s cancel when
+            # a wake lands at the same moment, leaving the loop parked for a full flush interval.
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self._flush_interval):
+                    await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("admin_action_flush_failed", pending=self.pending)
+
+    async def _insert(self, logs: list[AdminActionLog]) -> None:
+        async with self._session_factory() as session:
+            insert = upsert_insert(session)
+            for start in range(0, len(logs), self._batch_size):
+                rows = [_row(log) for log in logs[start : start + self._batch_size]]
+                stmt = insert(AdminActionLogModel).values(rows).on_conflict_do_nothing(index_elements=["id"])
+                await session.execute(stmt)
+            await session.commit()
+
+    def _append(self, line: str) -> None:
+        segment = self._segment or self._open_segment()
+        segment.write(line)
+        segment.flush()
+
+    def _open_segment(self) -> TextIO:
+        self._spool_dir.mkdir(parents=True, exist_ok=True)
+        self._segment_path = self._spool_dir / f"admin-actions-{os.getpid()}-{time.time_ns()}.jsonl"
+        self._segment = self._segment_path.open("a", encoding="utf-8")
+        # Held while this worker writes so a peer starting up does not replay a live segment.
+        _try_lock(self._segment)
+        return self._segment
+
+    def _seal(self) -> None:
+        if self._segment is None or self._segment_path is None:
+            return
+        self._segment.close()
+        if self._segment_logs:
+            self._undelivered.append((self._segment_path, self._segment_logs))
+        else:
+            self._segment_path.unlink(missing_ok=True)
+        self._segment = None
+        self._segment_path = None
+        self._segment_logs = []
+
+    def _recover(self) -> None:
+        """Queue segments left behind by workers that stopped before delivering them."""
+        if not self._spool_dir.is_dir():
+            return
+        for path in sorted(self._spool_dir.glob(_SEGMENT_GLOB)):
+            if path == self._segment_path:
+                continue
+            with path.open("r", encoding="utf-8") as handle:
+                try:
+                    _try_lock(handle)
+                except OSError:
+                    continue
+                logs = []
+                for line in handle:
+                    try:
+                        logs.append(_decode(json.loads(line)))
+                    except (ValueError, KeyError):  # torn final line from a crash mid-write
+                        logger.warning("admin_action_spool_line_skipped", segment=path.name)
+            if logs:
+                self._undelivered.append((path, logs))
+            else:
+                path.unlink(missing_ok=True)
+
+
+class PostCommitAdminActionSink:
+    """Request-scoped sink that hands entries to the writer only once the request transaction commits.
+
+    An admin mutation that fails or rolls back therefore leaves no audit entry behind.
+    """
+
+    def __init__(self, session: AsyncSession, writer: BufferedAdminActionWriter) -> None:
+        self._session = session
+        self._writer = writer
+
+    async def add(self, log: AdminActionLog) -> None:
+        call_after_commit(self._session, lambda: self._writer.add(log))
+
+    async def flush(self) -> None:
+        await self._writer.flush()
+
+
+def _row(log: AdminActionLog) -> dict[str, Any]:
+    return {
+        "id": log.id,
+        "actor_user_id": log.actor_user_id,
+        "target_user_id": log.target_user_id,
+        "action": log.action,
+        "details": log.details,
+        "trace_id": log.trace_id,
+        "created_at": log.created_at,
+    }
+
+
+def _encode(log: AdminActionLog) -> dict[str, Any]:
+    return _row(log) | {"created_at": log.created_at.isoformat()}
+
+
+def _decode(data: dict[str, Any]) -> AdminActionLog:
+    return AdminActionLog(**(data | {"created_at": datetime.fromisoformat(data["created_at"])}))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from structlog.contextvars import bind_contextvars
+
+from app.core.metrics import metrics
+
+_QUERY_STARTS = "query_started_at"
+
+
+@dataclass(slots=True)
+class DbTimer:
+    """Database time spent by one request: statements run and time waiting for a pooled connection."""
+
+    queries: int = 0
+    query_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    def log_fields(self) -> dict[str, Any]:
+        return {
+            "db_queries": self.queries,
+            "db_ms": round(self.query_seconds * 1000, 2),
+            "db_pool_wait_ms": round(self.wait_seconds * 1000, 2),
+        }
+
+
+_request_timer: ContextVar[DbTimer | None] = ContextVar("db_request_timer", default=None)
+
+
+def start_request_timer() -> DbTimer:
+    """Start accounting DB time for the current request; child tasks share the returned timer."""
+    timer = DbTimer()
+    _request_timer.set(timer)
+    return timer
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a free (or new) connection."""
+
+    metric_prefix = "db"
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            metrics.observe(f"{self.metric_prefix}.pool.checkout_wait_seconds", waited)
+            timer = _request_timer.get()
+            if timer is not None:
+                timer.wait_seconds += waited
+
+
+def instrument_engine(engine: Engine, prefix: str = "db") -> None:
+    """Export pool occupancy gauges and per-statement timings for ``engine`` (pass ``AsyncEngine.sync_engine``)."""
+    pool = engine.pool
+    if isinstance(pool, TimedQueuePool):
+        pool.metric_prefix = prefix
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        metrics.register_gauge(f"{prefix}.pool.size", pool.size)
+        metrics.register_gauge(f"{prefix}.pool.checked_out", pool.checkedout)
+        metrics.register_gauge(f"{prefix}.pool.overflow", lambda: max(pool.overflow(), 0))
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        metrics.increment(f"{prefix}.pool.connects")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        metrics.increment(f"{prefix}.pool.checkouts")
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_execute(conn: Any, *_: Any) -> None:
+        conn.info.setdefault(_QUERY_STARTS, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_execute(conn: Any, *_: Any) -> None:
+        _finish_query(conn)
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(context: Any) -> None:
+        if context.connection is not None:
+            _finish_query(context.connection)
+
+
+def _finish_query(conn: Any) -> None:
+    starts = conn.info.get(_QUERY_STARTS)
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    metrics.observe("db.query_seconds", elapsed)
+    timer = _request_timer.get()
+    if timer is not None:
+        timer.queries += 1
+        timer.query_seconds += elapsed
+        # Log lines emitted later in the request carry the running totals.
+        bind_contextvars(**timer.log_fields())
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import structlog
+
+from app.core.settings import get_settings
+from app.infrastructure.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.infrastructure.db.session import AsyncSessionLocal
+
+logger = structlog.get_logger(__name__)
+
+
+async def purge_refresh_tokens(now: datetime | None = None) -> int:
+    """Delete expired and long-revoked refresh tokens, one short transaction per batch."""
+    settings = get_settings()
+    now = now or datetime.now(UTC)
+    revoked_before = now - timedelta(hours=settings.REFRESH_TOKEN_REVOKED_RETENTION_HOURS)
+    batch_size = settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    total = 0
+    while True:
+        async with AsyncSessionLocal() as session:
+            deleted = await RefreshTokenRepository(session).purge(
+                expired_before=now, revoked_before=revoked_before, limit=batch_size
+            )
+            await session.commit()
+        total += deleted
+        if deleted < batch_size:
+            return total
+        await asyncio.sleep(0)  # let request handlers in between batches
+
+
+async def run_refresh_token_purger(interval: float) -> None:
+    """Purge on startup and then every ``interval`` seconds until cancelled."""
+    while True:
+        try:
+            deleted = await purge_refresh_tokens()
+            if deleted:
+                logger.info("refresh_tokens_purged", deleted=deleted)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("refresh_token_purge_failed")
+        await asyncio.sleep(interval)
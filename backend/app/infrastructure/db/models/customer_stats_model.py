@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.session import Base
+
+
+class CustomerStatsModel(Base):
+    """Lifetime purchase aggregates per customer, maintained as sales and returns are recorded."""
+
+    __tablename__ = "customer_stats"
+
+    customer_id: Mapped[str] = mapped_column(
+        String(26),
+        ForeignKey("customers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_sales: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    total_quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    returned_quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    returned_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    first_sale_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_sale_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_sale_id: Mapped[str | None] = mapped_column(String(26), nullable=True)
+    last_sale_amount: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, Index, Integer, Numeric, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.db.session import Base
+
+# Each hourly bucket is spread over this many rows; readers sum them. Sales from every till in a
+# store hit the same (day, hour, currency) bucket, and a single row would serialise their commits.
+HOURLY_ROLLUP_SLOTS = 8
+
+ROLLUP_COUNTER_COLUMNS = (
+    "sales_count",
+    "quantity",
+    "revenue",
+    "returned_quantity",
+    "returned_amount",
+)
+
+
+class _RollupCounters:
+    sales_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+    returned_quantity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    returned_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0)
+
+
+class SalesHourlyRollupModel(_RollupCounters, Base):
+    __tablename__ = "sales_hourly_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    hour: Mapped[int] = mapped_column(Integer, primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True, default=0)
+
+
+class SalesDailyProductRollupModel(_RollupCounters, Base):
+    __tablename__ = "sales_daily_product_rollups"
+    __table_args__ = (Index("ix_sales_daily_product_rollups_product_day", "product_id", "day"),)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    product_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+
+
+class SalesDailyCustomerRollupModel(_RollupCounters, Base):
+    __tablename__ = "sales_daily_customer_rollups"
+    __table_args__ = (Index("ix_sales_daily_customer_rollups_customer_day", "customer_id", "day"),)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    customer_id: Mapped[str] = mapped_column(String(26), primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+import structlog
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = structlog.get_logger(__name__)
+
+PostCommitCallback = Callable[[], Awaitable[None]]
+
+_PENDING = "post_commit_pending"
+_COMMITTED = "post_commit_committed"
+
+
+def call_after_commit(session: AsyncSession, callback: PostCommitCallback) -> None:
+    """Run ``callback`` once the session's current transaction commits; forget it if it rolls back."""
+    session.sync_session.info.setdefault(_PENDING, []).append(callback)
+
+
+async def run_post_commit_callbacks(session: AsyncSession) -> None:
+    """Await the callbacks of every transaction the session has committed so far."""
+    callbacks: list[PostCommitCallback] = session.sync_session.info.pop(_COMMITTED, [])
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception:
+            # The data is already committed; a failed side effect must not turn that into an error response.
+            logger.exception("post_commit_callback_failed")
+
+
+@event.listens_for(Session, "after_commit")
+def _promote(session: Session) -> None:
+    pending = session.info.pop(_PENDING, None)
+    if pending:
+        session.info.setdefault(_COMMITTED, []).extend(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(_PENDING, None)
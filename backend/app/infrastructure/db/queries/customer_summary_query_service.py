@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.customers.ports import CustomerSummaryListItem, CustomerSummaryQueryService
+from app.infrastructure.db.models.customer_model import CustomerModel
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.repositories.customer_stats_repository import (
+    SUMMARY_COLUMNS,
+    to_customer_sales_summary,
+)
+
+
+class SqlAlchemyCustomerSummaryQueryService(CustomerSummaryQueryService):
+    """Pages customers joined to their `customer_stats` row; one query for the page, one for the count."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_summaries(
+        self,
+        *,
+        search: str | None = None,
+        active: bool | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[Sequence[CustomerSummaryListItem], int]:
+        stmt = select(
+            CustomerModel.id,
+            CustomerModel.first_name,
+            CustomerModel.last_name,
+            CustomerModel.email,
+            CustomerModel.active,
+            *SUMMARY_COLUMNS,
+        ).outerjoin(CustomerStatsModel, CustomerStatsModel.customer_id == CustomerModel.id)
+        count_stmt = select(func.count(CustomerModel.id))
+
+        filters = []
+        if search:
+            like = f"%{search.lower()}%"
+            filters.append(
+                or_(
+                    func.lower(CustomerModel.first_name).like(like),
+                    func.lower(CustomerModel.last_name).like(like),
+                    func.lower(CustomerModel.email).like(like),
+                )
+            )
+        if active is not None:
+            filters.append(CustomerModel.active == active)
+
+        for condition in filters:
+            stmt = stmt.where(condition)
+            count_stmt = count_stmt.where(condition)
+
+        stmt = stmt.order_by(CustomerModel.created_at.desc(), CustomerModel.id).offset(offset).limit(limit)
+
+        rows = (await self._session.execute(stmt)).all()
+        total = (await self._session.execute(count_stmt)).scalar_one()
+        items = [
+            CustomerSummaryListItem(
+                customer_id=row[0],
+                first_name=row[1],
+                last_name=row[2],
+                email=row[3],
+                active=row[4],
+                sales=to_customer_sales_summary(row[5:]),
+            )
+            for row in rows
+        ]
+        return items, int(total)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.dashboard.ports import CurrencyTotals, DashboardQueryService, DashboardSummary
+from app.application.sales.ports import SaleListItem
+from app.infrastructure.db.models.customer_model import CustomerModel
+from app.infrastructure.db.models.product_model import ProductModel
+from app.infrastructure.db.models.sale_model import SaleModel
+from app.infrastructure.db.models.sales_rollup_model import SalesHourlyRollupModel
+
+
+class SqlAlchemyDashboardQueryService(DashboardQueryService):
+    """Dashboard figures in three statements: entity counts, rollup totals, recent sale headers."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_summary(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        recent_limit: int = 5,
+    ) -> DashboardSummary:
+        counts_stmt = select(
+            select(func.count(ProductModel.id)).where(ProductModel.active.is_(True)).scalar_subquery(),
+            select(func.count(CustomerModel.id)).where(CustomerModel.active.is_(True)).scalar_subquery(),
+        )
+        catalog_size, customer_count = (await self._session.execute(counts_stmt)).one()
+
+        totals_stmt = (
+            select(
+                SalesHourlyRollupModel.currency,
+                func.sum(SalesHourlyRollupModel.sales_count),
+                func.sum(SalesHourlyRollupModel.quantity),
+                func.sum(SalesHourlyRollupModel.revenue),
+                func.sum(SalesHourlyRollupModel.returned_amount),
+            )
+            .where(SalesHourlyRollupModel.day >= date_from, SalesHourlyRollupModel.day <= date_to)
+            .group_by(SalesHourlyRollupModel.currency)
+            .order_by(SalesHourlyRollupModel.currency)
+        )
+        totals = [
+            CurrencyTotals(
+                currency=currency,
+                orders=int(orders or 0),
+                items_sold=int(items_sold or 0),
+                revenue=_money(revenue),
+                returned_amount=_money(returned_amount),
+            )
+            for currency, orders, items_sold, revenue, returned_amount in (
+                await self._session.execute(totals_stmt)
+            ).tuples()
+        ]
+
+        recent_sales: list[SaleListItem] = []
+        if recent_limit:
+            recent_stmt = (
+                select(
+                    SaleModel.id,
+                    SaleModel.currency,
+                    SaleModel.total_amount,
+                    SaleModel.total_quantity,
+                    SaleModel.created_at,
+                    SaleModel.closed_at,
+                    SaleModel.customer_id,
+                )
+                .order_by(SaleModel.created_at.desc())
+                .limit(recent_limit)
+            )
+            recent_sales = [
+                SaleListItem(
+                    id=row[0],
+                    currency=row[1],
+                    total_amount=row[2],
+                    total_quantity=row[3],
+                    created_at=row[4],
+                    closed_at=row[5],
+                    customer_id=row[6],
+                )
+                for row in (await self._session.execute(recent_stmt)).tuples()
+            ]
+
+        return DashboardSummary(
+            date_from=date_from,
+            date_to=date_to,
+            catalog_size=int(catalog_size or 0),
+            customer_count=int(customer_count or 0),
+            totals=totals,
+            recent_sales=recent_sales,
+        )
+
+
+def _money(value: object) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
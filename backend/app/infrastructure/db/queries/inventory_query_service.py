@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.inventory.ports import InventoryMovementListItem, InventoryQueryService
+from app.infrastructure.db.models.inventory_movement_model import InventoryMovementModel
+
+
+class SqlAlchemyInventoryQueryService(InventoryQueryService):
+    """Ledger reads streamed from columns; never hydrates `InventoryMovement` entities."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def iter_movements(
+        self,
+        *,
+        product_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[InventoryMovementListItem]:
+        stmt = select(
+            InventoryMovementModel.id,
+            InventoryMovementModel.product_id,
+            InventoryMovementModel.quantity,
+            InventoryMovementModel.direction,
+            InventoryMovementModel.reason,
+            InventoryMovementModel.reference,
+            InventoryMovementModel.occurred_at,
+            InventoryMovementModel.created_at,
+        ).order_by(InventoryMovementModel.occurred_at, InventoryMovementModel.id)
+        if product_id is not None:
+            stmt = stmt.where(InventoryMovementModel.product_id == product_id)
+        if date_from is not None:
+            stmt = stmt.where(InventoryMovementModel.occurred_at >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(InventoryMovementModel.occurred_at <= date_to)
+
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            for row in partition:
+                yield InventoryMovementListItem(
+                    id=row[0],
+                    product_id=row[1],
+                    quantity=row[2],
+                    direction=row[3],
+                    reason=row[4],
+                    reference=row[5],
+                    occurred_at=row[6],
+                    created_at=row[7],
+                )
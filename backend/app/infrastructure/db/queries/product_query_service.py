@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from decimal import Decimal
+from typing import Any, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.application.catalog.ports import ProductListItem, ProductQueryService
+from app.infrastructure.db.models.product_model import ProductModel
+
+_LIST_COLUMNS = (
+    ProductModel.id,
+    ProductModel.name,
+    ProductModel.sku,
+    ProductModel.price_retail,
+    ProductModel.purchase_price,
+    ProductModel.category_id,
+    ProductModel.active,
+    ProductModel.version,
+)
+
+
+class SqlAlchemyProductQueryService(ProductQueryService):
+    """Column-level catalog reads that skip ORM identity-map and entity hydration."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_products(
+        self,
+        *,
+        search: str | None = None,
+        category_id: str | None = None,
+        active: bool | None = None,
+        min_price: Decimal | None = None,
+        max_price: Decimal | None = None,
+        sort_by: str = "created_at",
+        sort_direction: str = "desc",
+        offset: int = 0,
+        limit: int = 20,
+    ) -> tuple[Sequence[ProductListItem], int]:
+        stmt = select(*_LIST_COLUMNS)
+        count_stmt = select(func.count(ProductModel.id))
+        filters = _filters(
+            search=search,
+            category_id=category_id,
+            active=active,
+            min_price=min_price,
+            max_price=max_price,
+        )
+        for cond in filters:
+            stmt = stmt.where(cond)
+            count_stmt = count_stmt.where(cond)
+
+        sort_columns: dict[str, ColumnElement[Any] | InstrumentedAttribute[Any]] = {
+            "created_at": ProductModel.created_at,
+            "updated_at": ProductModel.updated_at,
+            "name": func.lower(ProductModel.name),
+            "sku": func.lower(ProductModel.sku),
+            "retail_price": ProductModel.price_retail,
+        }
+        sort_column = sort_columns.get(sort_by, ProductModel.created_at)
+        order_clause = sort_column.desc() if sort_direction == "desc" else sort_column.asc()
+
+        stmt = stmt.order_by(order_clause, ProductModel.created_at.desc()).offset(offset).limit(limit)
+        res = await self._session.execute(stmt)
+        items = [_to_item(row) for row in res.tuples()]
+        count_res = await self._session.execute(count_stmt)
+        total = count_res.scalar_one()
+        return items, int(total)
+
+    async def iter_products(
+        self,
+        *,
+        search: str | None = None,
+        category_id: str | None = None,
+        active: bool | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ProductListItem]:
+        stmt = select(*_LIST_COLUMNS).order_by(ProductModel.sku)
+        for cond in _filters(search=search, category_id=category_id, active=active):
+            stmt = stmt.where(cond)
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            for row in partition:
+                yield _to_item(row)
+
+
+def _filters(
+    *,
+    search: str | None = None,
+    category_id: str | None = None,
+    active: bool | None = None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+) -> list[ColumnElement[bool]]:
+    filters: list[ColumnElement[bool]] = []
+    if search:
+        like = f"%{search.lower()}%"
+        condition = func.lower(ProductModel.name).like(like)
+        sku_condition = func.lower(ProductModel.sku).like(like)
+        filters.append(condition | sku_condition)
+    if category_id:
+        filters.append(ProductModel.category_id == category_id)
+    if active is not None:
+        filters.append(ProductModel.active == active)
+    if min_price is not None:
+        filters.append(ProductModel.price_retail >= min_price)
+    if max_price is not None:
+        filters.append(ProductModel.price_retail <= max_price)
+    return filters
+
+
+def _to_item(row: Any) -> ProductListItem:
+    return ProductListItem(
+        id=row[0],
+        name=row[1],
+        sku=row[2],
+        retail_price=row[3],
+        purchase_price=row[4],
+        category_id=row[5],
+        active=row[6],
+        version=row[7],
+    )
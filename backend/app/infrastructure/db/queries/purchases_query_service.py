@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.purchases.ports import PurchaseListItem, PurchaseListLine, PurchasesQueryService
+from app.infrastructure.db.models.purchase_model import PurchaseOrderItemModel, PurchaseOrderModel
+
+
+class SqlAlchemyPurchasesQueryService(PurchasesQueryService):
+    """Purchase order listings from header columns, with line items fetched only on request."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_purchases(
+        self,
+        *,
+        supplier_id: str | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        include_items: bool = False,
+    ) -> tuple[Sequence[PurchaseListItem], int]:
+        stmt = select(
+            PurchaseOrderModel.id,
+            PurchaseOrderModel.supplier_id,
+            PurchaseOrderModel.currency,
+            PurchaseOrderModel.total_amount,
+            PurchaseOrderModel.total_quantity,
+            PurchaseOrderModel.created_at,
+            PurchaseOrderModel.received_at,
+        )
+        count_stmt = select(func.count(PurchaseOrderModel.id))
+
+        if supplier_id:
+            stmt = stmt.where(PurchaseOrderModel.supplier_id == supplier_id)
+            count_stmt = count_stmt.where(PurchaseOrderModel.supplier_id == supplier_id)
+
+        stmt = stmt.order_by(PurchaseOrderModel.created_at.desc()).offset(offset).limit(limit)
+
+        rows_result = await self._session.execute(stmt)
+        purchases = [
+            PurchaseListItem(
+                id=row[0],
+                supplier_id=row[1],
+                currency=row[2],
+                total_amount=row[3],
+                total_quantity=row[4],
+                created_at=row[5],
+                received_at=row[6],
+            )
+            for row in rows_result.tuples()
+        ]
+        total_result = await self._session.execute(count_stmt)
+        total = total_result.scalar_one()
+
+        if include_items:
+            await self._attach_lines(purchases)
+        return purchases, int(total)
+
+    async def _attach_lines(self, purchases: Sequence[PurchaseListItem]) -> None:
+        if not purchases:
+            return
+        by_id = {purchase.id: purchase for purchase in purchases}
+        stmt = select(
+            PurchaseOrderItemModel.purchase_order_id,
+            PurchaseOrderItemModel.id,
+            PurchaseOrderItemModel.product_id,
+            PurchaseOrderItemModel.quantity,
+            PurchaseOrderItemModel.unit_cost,
+            PurchaseOrderItemModel.line_total,
+        ).where(PurchaseOrderItemModel.purchase_order_id.in_(list(by_id)))
+        result = await self._session.execute(stmt)
+        for purchase_id, item_id, product_id, quantity, unit_cost, line_total in result.tuples():
+            by_id[purchase_id].items.append(
+                PurchaseListLine(
+                    id=item_id,
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_cost=unit_cost,
+                    line_total=line_total,
+                )
+            )
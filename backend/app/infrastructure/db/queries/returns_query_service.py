@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.returns.ports import ReturnListItem, ReturnListLine, ReturnsQueryService
+from app.infrastructure.db.models.return_model import ReturnItemModel, ReturnModel
+
+
+class SqlAlchemyReturnsQueryService(ReturnsQueryService):
+    """Return listings served from header columns; line items are fetched only on request."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_returns(
+        self,
+        *,
+        sale_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        include_items: bool = False,
+    ) -> tuple[Sequence[ReturnListItem], int]:
+        stmt = select(
+            ReturnModel.id,
+            ReturnModel.sale_id,
+            ReturnModel.currency,
+            ReturnModel.total_amount,
+            ReturnModel.total_quantity,
+            ReturnModel.created_at,
+        ).order_by(ReturnModel.created_at.desc())
+        count_stmt = select(func.count(ReturnModel.id))
+
+        if sale_id is not None:
+            stmt = stmt.where(ReturnModel.sale_id == sale_id)
+            count_stmt = count_stmt.where(ReturnModel.sale_id == sale_id)
+        if date_from is not None:
+            stmt = stmt.where(ReturnModel.created_at >= date_from)
+            count_stmt = count_stmt.where(ReturnModel.created_at >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(ReturnModel.created_at <= date_to)
+            count_stmt = count_stmt.where(ReturnModel.created_at <= date_to)
+
+        stmt = stmt.offset(offset).limit(limit)
+
+        rows = await self._session.execute(stmt)
+        returns = [
+            ReturnListItem(
+                id=row[0],
+                sale_id=row[1],
+                currency=row[2],
+                total_amount=row[3],
+                total_quantity=row[4],
+                created_at=row[5],
+            )
+            for row in rows.tuples()
+        ]
+        count_result = await self._session.execute(count_stmt)
+        total = count_result.scalar_one()
+
+        if include_items:
+            await self._attach_lines(returns)
+        return returns, int(total)
+
+    async def _attach_lines(self, returns: Sequence[ReturnListItem]) -> None:
+        if not returns:
+            return
+        by_id = {return_.id: return_ for return_ in returns}
+        stmt = select(
+            ReturnItemModel.return_id,
+            ReturnItemModel.id,
+            ReturnItemModel.sale_item_id,
+            ReturnItemModel.product_id,
+            ReturnItemModel.quantity,
+            ReturnItemModel.unit_price,
+            ReturnItemModel.line_total,
+        ).where(ReturnItemModel.return_id.in_(list(by_id)))
+        result = await self._session.execute(stmt)
+        for return_id, item_id, sale_item_id, product_id, quantity, unit_price, line_total in result.tuples():
+            by_id[return_id].items.append(
+                ReturnListLine(
+                    id=item_id,
+                    sale_item_id=sale_item_id,
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    line_total=line_total,
+                )
+            )
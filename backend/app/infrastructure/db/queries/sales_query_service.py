@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.sales.ports import SaleListItem, SaleListLine, SalesQueryService
+from app.infrastructure.db.models.sale_model import SaleItemModel, SaleModel
+
+
+class SqlAlchemySalesQueryService(SalesQueryService):
+    """Sale listings read straight from columns; the `Sale` aggregate is reserved for writes."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_sales(
+        self,
+        *,
+        customer_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        offset: int = 0,
+        limit: int = 20,
+        include_items: bool = False,
+    ) -> tuple[Sequence[SaleListItem], int]:
+        stmt = select(
+            SaleModel.id,
+            SaleModel.currency,
+            SaleModel.total_amount,
+            SaleModel.total_quantity,
+            SaleModel.created_at,
+            SaleModel.closed_at,
+            SaleModel.customer_id,
+        ).order_by(SaleModel.created_at.desc())
+        count_stmt = select(func.count(SaleModel.id))
+
+        if customer_id is not None:
+            stmt = stmt.where(SaleModel.customer_id == customer_id)
+            count_stmt = count_stmt.where(SaleModel.customer_id == customer_id)
+        if date_from is not None:
+            stmt = stmt.where(SaleModel.created_at >= date_from)
+            count_stmt = count_stmt.where(SaleModel.created_at >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(SaleModel.created_at <= date_to)
+            count_stmt = count_stmt.where(SaleModel.created_at <= date_to)
+
+        stmt = stmt.offset(offset).limit(limit)
+
+        header_result = await self._session.execute(stmt)
+        sales = [
+            SaleListItem(
+                id=row[0],
+                currency=row[1],
+                total_amount=row[2],
+                total_quantity=row[3],
+                created_at=row[4],
+                closed_at=row[5],
+                customer_id=row[6],
+            )
+            for row in header_result.tuples()
+        ]
+        count_result = await self._session.execute(count_stmt)
+        total = count_result.scalar_one()
+
+        if include_items:
+            await self._attach_lines(sales)
+        return sales, int(total)
+
+    async def iter_sales(
+        self,
+        *,
+        customer_id: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[SaleListItem]:
+        stmt = select(
+            SaleModel.id,
+            SaleModel.currency,
+            SaleModel.total_amount,
+            SaleModel.total_quantity,
+            SaleModel.created_at,
+            SaleModel.closed_at,
+            SaleModel.customer_id,
+        ).order_by(SaleModel.created_at, SaleModel.id)
+        if customer_id is not None:
+            stmt = stmt.where(SaleModel.customer_id == customer_id)
+        if date_from is not None:
+            stmt = stmt.where(SaleModel.created_at >= date_from)
+        if date_to is not None:
+            stmt = stmt.where(SaleModel.created_at <= date_to)
+
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            for row in partition:
+                yield SaleListItem(
+                    id=row[0],
+                    currency=row[1],
+                    total_amount=row[2],
+                    total_quantity=row[3],
+                    created_at=row[4],
+                    closed_at=row[5],
+                    customer_id=row[6],
+                )
+
+    async def _attach_lines(self, sales: Sequence[SaleListItem]) -> None:
+        if not sales:
+            return
+        by_id = {sale.id: sale for sale in sales}
+        stmt = select(
+            SaleItemModel.sale_id,
+            SaleItemModel.id,
+            SaleItemModel.product_id,
+            SaleItemModel.quantity,
+            SaleItemModel.unit_price,
+            SaleItemModel.line_total,
+            SaleItemModel.returned_quantity,
+        ).where(SaleItemModel.sale_id.in_(list(by_id)))
+        result = await self._session.execute(stmt)
+        for sale_id, item_id, product_id, quantity, unit_price, line_total, returned in result.tuples():
+            by_id[sale_id].items.append(
+                SaleListLine(
+                    id=item_id,
+                    product_id=product_id,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    line_total=line_total,
+                    returned_quantity=returned,
+                )
+            )
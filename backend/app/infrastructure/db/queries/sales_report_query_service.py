@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Any, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.sales.ports import DailySalesRollup, SalesReportQueryService
+from app.infrastructure.db.models.sales_rollup_model import (
+    SalesDailyCustomerRollupModel,
+    SalesDailyProductRollupModel,
+    SalesHourlyRollupModel,
+)
+
+
+class SqlAlchemySalesReportQueryService(SalesReportQueryService):
+    """Report reads that touch only the rollup tables, never `sales` or `sale_items`."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def daily_sales(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        product_id: str | None = None,
+        customer_id: str | None = None,
+    ) -> Sequence[DailySalesRollup]:
+        model: Any = SalesHourlyRollupModel
+        if product_id is not None:
+            model = SalesDailyProductRollupModel
+        elif customer_id is not None:
+            model = SalesDailyCustomerRollupModel
+
+        stmt = (
+            select(
+                model.day,
+                model.currency,
+                func.sum(model.sales_count),
+                func.sum(model.quantity),
+                func.sum(model.revenue),
+                func.sum(model.returned_quantity),
+                func.sum(model.returned_amount),
+            )
+            .where(model.day >= date_from, model.day <= date_to)
+            .group_by(model.day, model.currency)
+            .order_by(model.day, model.currency)
+        )
+        if product_id is not None:
+            stmt = stmt.where(SalesDailyProductRollupModel.product_id == product_id)
+        elif customer_id is not None:
+            stmt = stmt.where(SalesDailyCustomerRollupModel.customer_id == customer_id)
+
+        result = await self._session.execute(stmt)
+        return [
+            DailySalesRollup(
+                day=row[0],
+                currency=row[1],
+                sales_count=int(row[2] or 0),
+                quantity=int(row[3] or 0),
+                revenue=_money(row[4]),
+                returned_quantity=int(row[5] or 0),
+                returned_amount=_money(row[6]),
+            )
+            for row in result.tuples()
+        ]
+
+
+def _money(value: Any) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Insert, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.sales.ports import CustomerSalesSummary
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.models.return_model import ReturnModel
+from app.infrastructure.db.models.sale_model import SaleModel
+from app.infrastructure.db.utils import upsert_insert
+
+
+class SqlAlchemyCustomerStatsRepository:
+    """Keeps `customer_stats` current inside the caller's transaction.
+
+    Increments go through ``INSERT ... ON CONFLICT DO UPDATE`` so concurrent sales for
+    the same customer never lose an update; the "last sale" columns only move forward.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record_sale(
+        self,
+        *,
+        customer_id: str,
+        sale_id: str,
+        currency: str,
+        amount: Decimal,
+        quantity: int,
+        created_at: datetime,
+    ) -> None:
+        stats = CustomerStatsModel
+        stmt = upsert_insert(self._session)(stats).values(
+            customer_id=customer_id,
+            total_sales=1,
+            total_amount=amount,
+            total_quantity=quantity,
+            returned_quantity=0,
+            returned_amount=0,
+            first_sale_at=created_at,
+            last_sale_at=created_at,
+            last_sale_id=sale_id,
+            last_sale_amount=amount,
+            currency=currency,
+        )
+        excluded = stmt.excluded
+        is_latest = (stats.last_sale_at.is_(None)) | (excluded.last_sale_at >= stats.last_sale_at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stats.customer_id],
+            set_={
+                "total_sales": stats.total_sales + 1,
+                "total_amount": stats.total_amount + excluded.total_amount,
+                "total_quantity": stats.total_quantity + excluded.total_quantity,
+                "first_sale_at": case(
+                    (stats.first_sale_at.is_(None), excluded.first_sale_at),
+                    (excluded.first_sale_at < stats.first_sale_at, excluded.first_sale_at),
+                    else_=stats.first_sale_at,
+                ),
+                "last_sale_at": case((is_latest, excluded.last_sale_at), else_=stats.last_sale_at),
+                "last_sale_id": case((is_latest, excluded.last_sale_id), else_=stats.last_sale_id),
+                "last_sale_amount": case((is_latest, excluded.last_sale_amount), else_=stats.last_sale_amount),
+                "currency": case((is_latest, excluded.currency), else_=stats.currency),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def record_return(self, *, customer_id: str, amount: Decimal, quantity: int) -> None:
+        stmt = (
+            update(CustomerStatsModel)
+            .where(CustomerStatsModel.customer_id == customer_id)
+            .values(
+                returned_quantity=CustomerStatsModel.returned_quantity + quantity,
+                returned_amount=CustomerStatsModel.returned_amount + amount,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.execute(stmt)
+
+    async def get(self, customer_id: str) -> CustomerSalesSummary:
+        stmt = select(*SUMMARY_COLUMNS).where(CustomerStatsModel.customer_id == customer_id)
+        row = (await self._session.execute(stmt)).first()
+        return to_customer_sales_summary(row)
+
+    async def rebuild(self) -> int:
+        """Recompute every customer's row from the sales and returns ledgers in one statement."""
+        await self._session.execute(delete(CustomerStatsModel))
+        await self._session.execute(rebuild_statement())
+        return (await self._session.execute(select(func.count()).select_from(CustomerStatsModel))).scalar_one()
+
+
+def rebuild_statement() -> Insert:
+    """``INSERT ... SELECT`` filling ``customer_stats`` the way migration 0018 backfills it.
+
+    Per-customer sale totals, the latest sale picked by ``row_number()`` and a grouped join
+    over returns are combined in one pass instead of two queries per customer.
+    """
+    sale = SaleModel
+    totals = (
+        select(
+            sale.customer_id,
+            func.count(sale.id).label("total_sales"),
+            func.sum(sale.total_amount).label("total_amount"),
+            func.sum(sale.total_quantity).label("total_quantity"),
+            func.min(sale.created_at).label("first_sale_at"),
+            func.max(sale.created_at).label("last_sale_at"),
+        )
+        .where(sale.customer_id.is_not(None))
+        .group_by(sale.customer_id)
+        .subquery("totals")
+    )
+    ranked = (
+        select(
+            sale.customer_id,
+            sale.id,
+            sale.total_amount,
+            sale.currency,
+            func.row_number()
+            .over(partition_by=sale.customer_id, order_by=(sale.created_at.desc(), sale.id.desc()))
+            .label("rank"),
+        )
+        .where(sale.customer_id.is_not(None))
+        .subquery("ranked")
+    )
+    returned = (
+        select(
+            sale.customer_id,
+            func.sum(ReturnModel.total_quantity).label("quantity"),
+            func.sum(ReturnModel.total_amount).label("amount"),
+        )
+        .join(sale, sale.id == ReturnModel.sale_id)
+        .where(sale.customer_id.is_not(None))
+        .group_by(sale.customer_id)
+        .subquery("returned")
+    )
+    rows = (
+        select(
+            totals.c.customer_id,
+            totals.c.total_sales,
+            totals.c.total_amount,
+            totals.c.total_quantity,
+            func.coalesce(returned.c.quantity, 0),
+            func.coalesce(returned.c.amount, 0),
+            totals.c.first_sale_at,
+            totals.c.last_sale_at,
+            ranked.c.id,
+            ranked.c.total_amount,
+            ranked.c.currency,
+        )
+        .join(ranked, (ranked.c.customer_id == totals.c.customer_id) & (ranked.c.rank == 1))
+        .outerjoin(returned, returned.c.customer_id == totals.c.customer_id)
+    )
+    stats = CustomerStatsModel
+    return insert(stats).from_select(
+        [
+            stats.customer_id,
+            stats.total_sales,
+            stats.total_amount,
+            stats.total_quantity,
+            stats.returned_quantity,
+            stats.returned_amount,
+            stats.first_sale_at,
+            stats.last_sale_at,
+            stats.last_sale_id,
+            stats.last_sale_amount,
+            stats.currency,
+        ],
+        rows,
+    )
+
+
+SUMMARY_COLUMNS = (
+    CustomerStatsModel.currency,
+    CustomerStatsModel.total_sales,
+    CustomerStatsModel.total_amount,
+    CustomerStatsModel.total_quantity,
+    CustomerStatsModel.first_sale_at,
+    CustomerStatsModel.last_sale_at,
+    CustomerStatsModel.last_sale_id,
+    CustomerStatsModel.last_sale_amount,
+    CustomerStatsModel.returned_amount,
+)
+
+
+def to_customer_sales_summary(row: Sequence[Any] | None) -> CustomerSalesSummary:
+    """Map `SUMMARY_COLUMNS` (or a missing row, meaning no purchases yet) to the summary read model."""
+    if row is None or row[1] is None:
+        return CustomerSalesSummary(
+            currency=None,
+            total_sales=0,
+            total_amount=Decimal("0.00"),
+            total_quantity=0,
+            first_sale_at=None,
+            last_sale_at=None,
+            last_sale_id=None,
+            last_sale_amount=None,
+        )
+    currency, total_sales, total_amount, total_quantity, first_at, last_at, last_id, last_amount, returned = row
+    return CustomerSalesSummary(
+        currency=currency,
+        total_sales=int(total_sales),
+        total_amount=Decimal(str(total_amount)).quantize(Decimal("0.01")),
+        total_quantity=int(total_quantity),
+        first_sale_at=first_at,
+        last_sale_at=last_at,
+        last_sale_id=last_id,
+        last_sale_amount=Decimal(str(last_amount)).quantize(Decimal("0.01")) if last_amount is not None else None,
+        returned_amount=Decimal(str(returned)).quantize(Decimal("0.01")),
+    )
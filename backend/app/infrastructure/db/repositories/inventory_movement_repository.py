@@ -16,7 +16,16 @@ class SqlAlchemyInventoryMovementRepository(InventoryMovementRepository):
         self._session = session
 
     async def add(self, movement: InventoryMovement) -> None:
-        model = InventoryMovementModel(
+        self._session.add(self._to_model(movement))
+        await self._session.flush()
+
+    async def add_many(self, movements: Sequence[InventoryMovement]) -> None:
+        self._session.add_all([self._to_model(movement) for movement in movements])
+        await self._session.flush()
+
+    @staticmethod
+    def _to_model(movement: InventoryMovement) -> InventoryMovementModel:
+        return InventoryMovementModel(
             id=movement.id,
             product_id=movement.product_id,
             quantity=movement.quantity,
@@ -26,8 +35,6 @@ class SqlAlchemyInventoryMovementRepository(InventoryMovementRepository):
             occurred_at=movement.occurred_at,
             created_at=movement.created_at,
         )
-        self._session.add(model)
-        await self._session.flush()
 
     async def list_for_product(
         self,
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import Any, Sequence
+from collections.abc import Sequence
 
-from sqlalchemy import func, select, update
+from sqlalchemy import case, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.sql import Select
-from sqlalchemy.sql.elements import ColumnElement
 
 from app.application.catalog.ports import ProductRepository
 from app.domain.catalog.entities import Product
 from app.domain.common.money import Money
 from app.infrastructure.db.models.product_model import ProductModel
 
+# Rows per statement for bulk reads/writes; keeps bind parameters well under driver limits.
+BULK_CHUNK_SIZE = 200
+
 
 class SqlAlchemyProductRepository(ProductRepository):
     def __init__(self, session: AsyncSession):
@@ -63,6 +63,51 @@ class SqlAlchemyProductRepository(ProductRepository):
         result = await self._session.execute(stmt)
         return result.rowcount > 0
 
+    async def get_many(self, product_ids: Sequence[str], *, lock: bool = False) -> list[Product]:
+        products: list[Product] = []
+        # Sorted so concurrent lockers acquire row locks in the same order.
+        ids = sorted(set(product_ids)) if lock else list(dict.fromkeys(product_ids))
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start : start + BULK_CHUNK_SIZE]
+            stmt = select(ProductModel).where(ProductModel.id.in_(chunk))
+            if lock:
+                stmt = stmt.order_by(ProductModel.id).with_for_update()
+            res = await self._session.execute(stmt)
+            products.extend(self._to_entity(model) for model in res.scalars())  # type: ignore[misc]
+        return products
+
+    async def update_many(self, updates: Sequence[tuple[Product, int]]) -> set[str]:
+        written: set[str] = set()
+        for start in range(0, len(updates), BULK_CHUNK_SIZE):
+            chunk = updates[start : start + BULK_CHUNK_SIZE]
+            written.update(await self._update_chunk(chunk))
+        return written
+
+    async def _update_chunk(self, chunk: Sequence[tuple[Product, int]]) -> set[str]:
+        # One UPDATE per chunk: CASE on id picks each row's new values, and the
+        # (id, version) filter keeps the optimistic lock per row. RETURNING tells
+        # us exactly which rows still had the expected version.
+        def by_id(values: dict[str, object], column):  # type: ignore[no-untyped-def]
+            return case(values, value=ProductModel.id, else_=column)
+
+        products = [product for product, _ in chunk]
+        stmt = (
+            update(ProductModel)
+            .where(tuple_(ProductModel.id, ProductModel.version).in_([(p.id, v) for p, v in chunk]))
+            .values(
+                name=by_id({p.id: p.name for p in products}, ProductModel.name),
+                price_retail=by_id({p.id: p.price_retail.amount for p in products}, ProductModel.price_retail),
+                purchase_price=by_id({p.id: p.purchase_price.amount for p in products}, ProductModel.purchase_price),
+                category_id=by_id({p.id: p.category_id for p in products}, ProductModel.category_id),
+                updated_at=by_id({p.id: p.updated_at for p in products}, ProductModel.updated_at),
+                version=by_id({p.id: p.version for p in products}, ProductModel.version),
+            )
+            .returning(ProductModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
+
     async def _fetch_one(self, stmt: Select[tuple[ProductModel]]) -> ProductModel | None:
         res = await self._session.execute(stmt)
         return res.scalar_one_or_none()
@@ -74,77 +119,11 @@ class SqlAlchemyProductRepository(ProductRepository):
             id=model.id,
             name=model.name,
             sku=model.sku,
-            price_retail=Money(Decimal(str(model.price_retail))),
-            purchase_price=Money(Decimal(str(model.purchase_price))),
+            price_retail=Money(model.price_retail),
+            purchase_price=Money(model.purchase_price),
             category_id=model.category_id,
             active=model.active,
             created_at=model.created_at,
             updated_at=model.updated_at,
             version=model.version,
         )
-
-    async def list_products(
-        self,
-        *,
-        search: str | None = None,
-        category_id: str | None = None,
-        active: bool | None = None,
-        min_price: Decimal | None = None,
-        max_price: Decimal | None = None,
-        sort_by: str = "created_at",
-        sort_direction: str = "desc",
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[Sequence[Product], int]:
-        stmt = select(ProductModel)
-        count_stmt = select(func.count(ProductModel.id))
-        filters: list[ColumnElement[bool]] = []
-        if search:
-            like = f"%{search.lower()}%"
-            condition = func.lower(ProductModel.name).like(like)
-            sku_condition = func.lower(ProductModel.sku).like(like)
-            filters.append(condition | sku_condition)
-        if category_id:
-            filters.append(ProductModel.category_id == category_id)
-        if active is not None:
-            filters.append(ProductModel.active == active)
-        if min_price is not None:
-            filters.append(ProductModel.price_retail >= min_price)
-        if max_price is not None:
-            filters.append(ProductModel.price_retail <= max_price)
-
-        if filters:
-            for cond in filters:
-                stmt = stmt.where(cond)
-                count_stmt = count_stmt.where(cond)
-
-        sort_columns: dict[str, ColumnElement[Any] | InstrumentedAttribute[Any]] = {
-            "created_at": ProductModel.created_at,
-            "name": func.lower(ProductModel.name),
-            "sku": func.lower(ProductModel.sku),
-            "retail_price": ProductModel.price_retail,
-        }
-        sort_column = sort_columns.get(sort_by, ProductModel.created_at)
-        order_clause = sort_column.desc() if sort_direction == "desc" else sort_column.asc()
-
-        stmt = stmt.order_by(order_clause, ProductModel.created_at.desc()).offset(offset).limit(limit)
-        res = await self._session.execute(stmt)
-        rows = res.scalars().all()
-        count_res = await self._session.execute(count_stmt)
-        total = count_res.scalar_one()
-        products = [
-            Product(
-                id=m.id,
-                name=m.name,
-                sku=m.sku,
-                price_retail=Money(Decimal(str(m.price_retail))),
-                purchase_price=Money(Decimal(str(m.purchase_price))),
-                category_id=m.category_id,
-                active=m.active,
-                created_at=m.created_at,
-                updated_at=m.updated_at,
-                version=m.version,
-            )
-            for m in rows
-        ]
-        return products, int(total)
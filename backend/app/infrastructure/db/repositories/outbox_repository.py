@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.domain.common.events import DomainEvent
+from app.domain.sales.events import SaleRecordedEvent
+from app.infrastructure.db.models.outbox_model import OUTBOX_FAILED, OUTBOX_PENDING, OutboxEventModel
+
+_ENVELOPE_FIELDS = frozenset({"aggregate_id", "event_id", "occurred_at"})
+
+# Event types the relay can rebuild from a stored row, keyed by ``DomainEvent.event_name``.
+OUTBOX_EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    SaleRecordedEvent.__name__: SaleRecordedEvent,
+}
+
+
+def decode_event(row: OutboxEventModel) -> DomainEvent:
+    event_type = OUTBOX_EVENT_TYPES[row.event_type]
+    occurred_at = row.occurred_at if row.occurred_at.tzinfo else row.occurred_at.replace(tzinfo=UTC)
+    return event_type(aggregate_id=row.aggregate_id, event_id=row.event_id, occurred_at=occurred_at, **row.payload)
+
+
+class SqlAlchemyOutboxRepository:
+    """Transactional outbox: events are inserted with the aggregate and deleted once relayed."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, events: Sequence[DomainEvent]) -> None:
+        self._session.add_all(self._to_model(event) for event in events)
+
+    async def claim(self, *, now: datetime, limit: int) -> list[OutboxEventModel]:
+        """Lock up to ``limit`` due events, at most the oldest pending one per aggregate.
+
+        A later event never overtakes an earlier one for the same aggregate, even while the
+        earlier one is backing off or is being delivered by another relay (``SKIP LOCKED``).
+        """
+        earlier = aliased(OutboxEventModel)
+        blocked = exists().where(
+            earlier.aggregate_id == OutboxEventModel.aggregate_id,
+            earlier.id < OutboxEventModel.id,
+            earlier.status == OUTBOX_PENDING,
+        )
+        stmt = (
+            select(OutboxEventModel)
+            .where(OutboxEventModel.status == OUTBOX_PENDING, OutboxEventModel.available_at <= now, ~blocked)
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list((await self._session.execute(stmt)).scalars())
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        if ids:
+            stmt = delete(OutboxEventModel).where(OutboxEventModel.id.in_(ids))
+            await self._session.execute(stmt.execution_options(synchronize_session=False))
+
+    @staticmethod
+    def retry_later(row: OutboxEventModel, *, error: str, available_at: datetime) -> None:
+        row.attempts += 1
+        row.last_error = error
+        row.available_at = available_at
+
+    @staticmethod
+    def give_up(row: OutboxEventModel, *, error: str) -> None:
+        row.attempts += 1
+        row.last_error = error
+        row.status = OUTBOX_FAILED
+
+    @staticmethod
+    def _to_model(event: DomainEvent) -> OutboxEventModel:
+        payload: dict[str, Any] = {
+            field.name: getattr(event, field.name)
+            for field in dataclasses.fields(event)
+            if field.name not in _ENVELOPE_FIELDS
+        }
+        return OutboxEventModel(
+            event_id=event.event_id,
+            event_type=event.event_name,
+            aggregate_id=event.aggregate_id,
+            payload=payload,
+            occurred_at=event.occurred_at,
+            status=OUTBOX_PENDING,
+            attempts=0,
+            available_at=event.occurred_at,
+        )
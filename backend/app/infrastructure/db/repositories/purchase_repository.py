@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Sequence
+from typing import Any, Mapping, Sequence
 
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +11,7 @@ from app.application.purchases.ports import PurchaseRepository, SupplierPurchase
 from app.domain.common.money import Money
 from app.domain.purchases import PurchaseOrder, PurchaseOrderItem
 from app.infrastructure.db.models.purchase_model import PurchaseOrderItemModel, PurchaseOrderModel
+from app.infrastructure.db.utils import seconds_between
 
 
 class SqlAlchemyPurchaseRepository(PurchaseRepository):
@@ -22,12 +23,13 @@ class SqlAlchemyPurchaseRepository(PurchaseRepository):
             raise ValueError("Purchase must include items to persist")
 
         created_at = order.created_at
+        totals = order.totals()
         model = PurchaseOrderModel(
             id=order.id,
             supplier_id=order.supplier_id,
             currency=order.currency,
-            total_amount=order.total_amount.amount,
-            total_quantity=order.total_quantity,
+            total_amount=totals.amount.amount,
+            total_quantity=totals.quantity,
             created_at=created_at,
             received_at=order.received_at,
             items=[
@@ -55,114 +57,111 @@ class SqlAlchemyPurchaseRepository(PurchaseRepository):
         model = result.scalar_one_or_none()
         return self._to_purchase(model)
 
-    async def list_purchases(
+    async def get_supplier_purchase_summary(self, supplier_id: str) -> SupplierPurchaseSummary:
+        summaries = await self.get_supplier_purchase_summaries([supplier_id])
+        return summaries[supplier_id]
+
+    async def get_supplier_purchase_summaries(
         self,
-        *,
-        supplier_id: str | None = None,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[list[PurchaseOrder], int]:
-        stmt = select(PurchaseOrderModel).options(selectinload(PurchaseOrderModel.items))
-        count_stmt = select(func.count(PurchaseOrderModel.id))
-
-        if supplier_id:
-            stmt = stmt.where(PurchaseOrderModel.supplier_id == supplier_id)
-            count_stmt = count_stmt.where(PurchaseOrderModel.supplier_id == supplier_id)
-
-        stmt = stmt.order_by(PurchaseOrderModel.created_at.desc()).offset(offset).limit(limit)
-
-        rows_result = await self._session.execute(stmt)
-        rows = rows_result.scalars().all()
-        total_result = await self._session.execute(count_stmt)
-        total = total_result.scalar_one()
-        purchases: list[PurchaseOrder] = []
-        for row in rows:
-            purchase = self._to_purchase(row)
-            if purchase is not None:
-                purchases.append(purchase)
-        return purchases, int(total)
+        supplier_ids: Sequence[str],
+    ) -> Mapping[str, SupplierPurchaseSummary]:
+        """Order totals, latest order and lead-time avg/p50/p90 for many suppliers in one statement."""
+        if not supplier_ids:
+            return {}
+        order = PurchaseOrderModel
+        ids = list(dict.fromkeys(supplier_ids))
+
+        ranked = select(
+            order.supplier_id,
+            order.id,
+            order.currency,
+            order.total_amount,
+            order.total_quantity,
+            order.created_at,
+            order.received_at,
+            func.row_number()
+            .over(partition_by=order.supplier_id, order_by=(order.created_at.desc(), order.id.desc()))
+            .label("recency"),
+        ).where(order.supplier_id.in_(ids)).subquery()
+        latest = ranked.c.recency == 1
+        totals = (
+            select(
+                ranked.c.supplier_id,
+                func.count(ranked.c.id).label("total_orders"),
+                func.sum(ranked.c.total_amount).label("total_amount"),
+                func.sum(ranked.c.total_quantity).label("total_quantity"),
+                func.min(ranked.c.created_at).label("first_order_at"),
+                func.max(ranked.c.created_at).label("last_order_at"),
+                func.sum(case((ranked.c.received_at.is_(None), 1), else_=0)).label("open_orders"),
+                func.max(case((latest, ranked.c.id))).label("last_order_id"),
+                func.max(case((latest, ranked.c.currency))).label("currency"),
+                func.max(case((latest, ranked.c.total_amount))).label("last_order_amount"),
+            )
+            .group_by(ranked.c.supplier_id)
+            .subquery()
+        )
 
-    async def get_supplier_purchase_summary(self, supplier_id: str) -> SupplierPurchaseSummary:
-        open_case = case((PurchaseOrderModel.received_at.is_(None), 1), else_=0)
-        summary_stmt = (
+        lead_seconds = seconds_between(order.created_at, order.received_at)
+        leads = (
             select(
-                func.count(PurchaseOrderModel.id),
-                func.coalesce(func.sum(PurchaseOrderModel.total_amount), 0),
-                func.coalesce(func.sum(PurchaseOrderModel.total_quantity), 0),
-                func.min(PurchaseOrderModel.created_at),
-                func.max(PurchaseOrderModel.created_at),
-                func.coalesce(func.sum(open_case), 0),
+                order.supplier_id,
+                lead_seconds.label("seconds"),
+                func.row_number().over(partition_by=order.supplier_id, order_by=lead_seconds).label("rank"),
+                func.count().over(partition_by=order.supplier_id).label("size"),
             )
-            .where(PurchaseOrderModel.supplier_id == supplier_id)
+            .where(order.supplier_id.in_(ids))
+            .where(order.received_at.is_not(None))
+            .where(lead_seconds >= 0)
+            .subquery()
         )
-        result = await self._session.execute(summary_stmt)
-        total_orders, total_amount, total_quantity, first_order_at, last_order_at, open_orders = result.one()
-
-        total_orders_int = int(total_orders or 0)
-        total_quantity_int = int(total_quantity or 0)
-        total_amount_decimal = Decimal(total_amount or 0).quantize(Decimal("0.01"))
-        open_orders_int = int(open_orders or 0)
-
-        currency: str | None = None
-        last_order_id: str | None = None
-        last_order_amount: Decimal | None = None
-
-        if total_orders_int > 0:
-            last_stmt = (
-                select(
-                    PurchaseOrderModel.id,
-                    PurchaseOrderModel.currency,
-                    PurchaseOrderModel.total_amount,
-                )
-                .where(PurchaseOrderModel.supplier_id == supplier_id)
-                .order_by(PurchaseOrderModel.created_at.desc())
-                .limit(1)
+        lead_stats = (
+            select(
+                leads.c.supplier_id,
+                func.avg(leads.c.seconds).label("avg_seconds"),
+                func.min(case((leads.c.rank >= leads.c.size * 0.5, leads.c.seconds))).label("p50_seconds"),
+                func.min(case((leads.c.rank >= leads.c.size * 0.9, leads.c.seconds))).label("p90_seconds"),
             )
-            last_result = await self._session.execute(last_stmt)
-            last_row = last_result.first()
-            if last_row is not None:
-                last_order_id = last_row[0]
-                currency = last_row[1]
-                last_amount = last_row[2]
-                last_order_amount = Decimal(last_amount).quantize(Decimal("0.01"))
-
-        lead_stmt = (
-            select(PurchaseOrderModel.created_at, PurchaseOrderModel.received_at)
-            .where(PurchaseOrderModel.supplier_id == supplier_id)
-            .where(PurchaseOrderModel.received_at.is_not(None))
+            .group_by(leads.c.supplier_id)
+            .subquery()
         )
-        lead_result = await self._session.execute(lead_stmt)
-        lead_rows = lead_result.all()
-
-        average_lead_time_hours: Decimal | None = None
-        if lead_rows:
-            total_seconds = Decimal("0")
-            valid_count = 0
-            for created_at, received_at in lead_rows:
-                if received_at is None:
-                    continue
-                delta = received_at - created_at
-                seconds = Decimal(str(delta.total_seconds()))
-                if seconds < 0:
-                    continue
-                total_seconds += seconds
-                valid_count += 1
-            if valid_count > 0:
-                avg_seconds = total_seconds / Decimal(valid_count)
-                average_lead_time_hours = (avg_seconds / Decimal("3600")).quantize(Decimal("0.01"))
-
-        average_currency = currency
+
+        stmt = select(
+            totals,
+            lead_stats.c.avg_seconds,
+            lead_stats.c.p50_seconds,
+            lead_stats.c.p90_seconds,
+        ).outerjoin(lead_stats, lead_stats.c.supplier_id == totals.c.supplier_id)
+        rows = {row.supplier_id: row for row in (await self._session.execute(stmt)).all()}
+        return {supplier_id: self._to_supplier_summary(rows.get(supplier_id)) for supplier_id in ids}
+
+    @staticmethod
+    def _to_supplier_summary(row: Any | None) -> SupplierPurchaseSummary:
+        if row is None:
+            return SupplierPurchaseSummary(
+                currency=None,
+                total_orders=0,
+                total_amount=Decimal("0.00"),
+                total_quantity=0,
+                first_order_at=None,
+                last_order_at=None,
+                last_order_id=None,
+                last_order_amount=None,
+                open_orders=0,
+                average_lead_time_hours=None,
+            )
         return SupplierPurchaseSummary(
-            currency=average_currency,
-            total_orders=total_orders_int,
-            total_amount=total_amount_decimal,
-            total_quantity=total_quantity_int,
-            first_order_at=first_order_at,
-            last_order_at=last_order_at,
-            last_order_id=last_order_id,
-            last_order_amount=last_order_amount,
-            open_orders=open_orders_int,
-            average_lead_time_hours=average_lead_time_hours,
+            currency=row.currency,
+            total_orders=int(row.total_orders),
+            total_amount=Decimal(str(row.total_amount)).quantize(Decimal("0.01")),
+            total_quantity=int(row.total_quantity),
+            first_order_at=row.first_order_at,
+            last_order_at=row.last_order_at,
+            last_order_id=row.last_order_id,
+            last_order_amount=_to_cents(row.last_order_amount),
+            open_orders=int(row.open_orders),
+            average_lead_time_hours=_seconds_to_hours(row.avg_seconds),
+            p50_lead_time_hours=_seconds_to_hours(row.p50_seconds),
+            p90_lead_time_hours=_seconds_to_hours(row.p90_seconds),
         )
 
     def _to_purchase(self, model: PurchaseOrderModel | None) -> PurchaseOrder | None:
@@ -185,3 +184,11 @@ class SqlAlchemyPurchaseRepository(PurchaseRepository):
             )
             purchase.items.append(item)
         return purchase
+
+
+def _to_cents(value: Any) -> Decimal | None:
+    return None if value is None else Decimal(str(value)).quantize(Decimal("0.01"))
+
+
+def _seconds_to_hours(seconds: Any) -> Decimal | None:
+    return None if seconds is None else (Decimal(str(seconds)) / Decimal("3600")).quantize(Decimal("0.01"))
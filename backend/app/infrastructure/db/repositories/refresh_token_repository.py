@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import delete, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.auth.entities import RefreshToken
 from app.infrastructure.db.models.auth.refresh_token_model import RefreshTokenModel
+from app.infrastructure.db.utils import utcnow
 
 
 class RefreshTokenRepository:
@@ -37,6 +38,7 @@ class RefreshTokenRepository:
             return None
         if not model.revoked:
             model.revoked = True
+            model.revoked_at = utcnow()
             model.replaced_by = replacement.id if replacement else None
             model.version += 1
         if replacement is not None:
@@ -48,19 +50,37 @@ class RefreshTokenRepository:
         return await self.revoke_and_replace(token_id, None)
 
     async def revoke_all_for_user(self, user_id: str) -> int:
-        stmt = select(RefreshTokenModel).where(
-            RefreshTokenModel.user_id == user_id,
-            RefreshTokenModel.revoked.is_(False),
+        stmt = (
+            update(RefreshTokenModel)
+            .where(
+                RefreshTokenModel.user_id == user_id,
+                RefreshTokenModel.revoked.is_(False),
+            )
+            .values(revoked=True, revoked_at=utcnow(), replaced_by=None, version=RefreshTokenModel.version + 1)
+            .execution_options(synchronize_session="fetch")
         )
         result = await self._session.execute(stmt)
-        models = result.scalars().all()
-        for model in models:
-            model.revoked = True
-            model.replaced_by = None
-            model.version += 1
-        if models:
-            await self._session.flush()
-        return len(models)
+        return result.rowcount or 0
+
+    async def purge(self, *, expired_before: datetime, revoked_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` tokens that expired, or were revoked, before the respective cutoff."""
+        doomed = (
+            select(RefreshTokenModel.id)
+            .where(
+                or_(
+                    RefreshTokenModel.expires_at < expired_before,
+                    RefreshTokenModel.revoked_at < revoked_before,
+                )
+            )
+            .limit(limit)
+        )
+        # Ids are fetched first because not every backend accepts LIMIT inside a DELETE subquery.
+        ids = list((await self._session.execute(doomed)).scalars())
+        if not ids:
+            return 0
+        stmt = delete(RefreshTokenModel).where(RefreshTokenModel.id.in_(ids))
+        await self._session.execute(stmt.execution_options(synchronize_session=False))
+        return len(ids)
 
     @staticmethod
     def _to_entity(model: RefreshTokenModel) -> RefreshToken:
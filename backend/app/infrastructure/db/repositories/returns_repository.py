@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
 from decimal import Decimal
 from typing import Mapping, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import case, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,23 +11,32 @@ from app.application.returns.ports import ReturnsRepository
 from app.domain.returns import Return, ReturnItem
 from app.domain.common.money import Money
 from app.infrastructure.db.models.return_model import ReturnItemModel, ReturnModel
+from app.infrastructure.db.models.sale_model import SaleItemModel, SaleModel
+from app.infrastructure.db.repositories.customer_stats_repository import SqlAlchemyCustomerStatsRepository
+from app.infrastructure.db.repositories.sales_rollup_repository import (
+    RollupLine,
+    SqlAlchemySalesRollupRepository,
+)
 
 
 class SqlAlchemyReturnsRepository(ReturnsRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._rollups = SqlAlchemySalesRollupRepository(session)
+        self._customer_stats = SqlAlchemyCustomerStatsRepository(session)
 
     async def add_return(self, return_: Return, items: Sequence[ReturnItem]) -> None:
         if not items:
             raise ValueError("Return must include items to persist")
 
         created_at = return_.created_at
+        totals = return_.totals()
         return_model = ReturnModel(
             id=return_.id,
             sale_id=return_.sale_id,
             currency=return_.currency,
-            total_amount=return_.total_amount.amount,
-            total_quantity=return_.total_quantity,
+            total_amount=totals.amount.amount,
+            total_quantity=totals.quantity,
             created_at=created_at,
             items=[
                 ReturnItemModel(
@@ -45,18 +53,46 @@ class SqlAlchemyReturnsRepository(ReturnsRepository):
         )
         self._session.add(return_model)
         await self._session.flush()
-
-    async def get_returned_quantities(self, sale_item_ids: Sequence[str]) -> Mapping[str, int]:
-        if not sale_item_ids:
-            return {}
-
+        customer_id = (
+            await self._session.execute(select(SaleModel.customer_id).where(SaleModel.id == return_.sale_id))
+        ).scalar_one_or_none()
+        await self._rollups.record_return(
+            customer_id=customer_id,
+            created_at=created_at,
+            currency=return_.currency,
+            lines=[
+                RollupLine(product_id=item.product_id, quantity=item.quantity, amount=item.line_total.amount)
+                for item in items
+            ],
+        )
+        if customer_id is not None:
+            await self._customer_stats.record_return(
+                customer_id=customer_id,
+                amount=totals.amount.amount,
+                quantity=totals.quantity,
+            )
+
+    async def claim_returned_quantities(self, sale_id: str, quantities: Mapping[str, int]) -> set[str]:
+        """Add `quantities` to each sale item's returned_quantity; return the ids that would over-return.
+
+        A single conditional UPDATE checks and increments together, so concurrent returns
+        cannot both pass a stale read. Rows that were claimed stay claimed: callers must
+        fail the transaction when anything is rejected.
+        """
+        if not quantities:
+            return set()
+        increment = case(dict(quantities), value=SaleItemModel.id, else_=0)
         stmt = (
-            select(ReturnItemModel.sale_item_id, func.coalesce(func.sum(ReturnItemModel.quantity), 0))
-            .where(ReturnItemModel.sale_item_id.in_(sale_item_ids))
-            .group_by(ReturnItemModel.sale_item_id)
+            update(SaleItemModel)
+            .where(SaleItemModel.sale_id == sale_id)
+            .where(SaleItemModel.id.in_(list(quantities)))
+            .where(SaleItemModel.returned_quantity + increment <= SaleItemModel.quantity)
+            .values(returned_quantity=SaleItemModel.returned_quantity + increment)
+            .returning(SaleItemModel.id)
+            .execution_options(synchronize_session=False)
         )
-        result = await self._session.execute(stmt)
-        return {row[0]: int(row[1]) for row in result.all()}
+        claimed = set((await self._session.execute(stmt)).scalars())
+        return set(quantities) - claimed
 
     async def get_by_id(self, return_id: str) -> Return | None:
         stmt = (
@@ -70,42 +106,6 @@ class SqlAlchemyReturnsRepository(ReturnsRepository):
             return None
         return self._to_return(model)
 
-    async def list_returns(
-        self,
-        *,
-        sale_id: str | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[Sequence[Return], int]:
-        stmt = (
-            select(ReturnModel)
-            .options(selectinload(ReturnModel.items))
-            .order_by(ReturnModel.created_at.desc())
-        )
-        count_stmt = select(func.count(ReturnModel.id))
-
-        if sale_id is not None:
-            stmt = stmt.where(ReturnModel.sale_id == sale_id)
-            count_stmt = count_stmt.where(ReturnModel.sale_id == sale_id)
-        if date_from is not None:
-            stmt = stmt.where(ReturnModel.created_at >= date_from)
-            count_stmt = count_stmt.where(ReturnModel.created_at >= date_from)
-        if date_to is not None:
-            stmt = stmt.where(ReturnModel.created_at <= date_to)
-            count_stmt = count_stmt.where(ReturnModel.created_at <= date_to)
-
-        stmt = stmt.offset(offset).limit(limit)
-
-        rows = await self._session.execute(stmt)
-        models = rows.scalars().all()
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
-
-        returns = [self._to_return(model) for model in models]
-        return returns, int(total)
-
     def _to_return(self, model: ReturnModel) -> Return:
         return_ = Return(
             id=model.id,
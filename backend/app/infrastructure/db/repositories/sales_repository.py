@@ -1,53 +1,104 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from decimal import Decimal
 from typing import Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.application.sales.ports import CustomerSalesSummary, SalesRepository
+from app.domain.common.errors import ConcurrencyConflictError
 from app.domain.common.money import Money
 from app.domain.sales import Sale, SaleItem
 from app.infrastructure.db.models.sale_model import SaleItemModel, SaleModel
+from app.infrastructure.db.repositories.customer_stats_repository import SqlAlchemyCustomerStatsRepository
+from app.infrastructure.db.repositories.sales_rollup_repository import (
+    RollupDelta,
+    RollupLine,
+    SqlAlchemySalesRollupRepository,
+)
 
 
 class SqlAlchemySalesRepository(SalesRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
+        self._rollups = SqlAlchemySalesRollupRepository(session)
+        self._customer_stats = SqlAlchemyCustomerStatsRepository(session)
 
     async def add_sale(self, sale: Sale, items: Sequence[SaleItem]) -> None:
         if not items:
             raise ValueError("Sale must include items to persist")
+        await self._persist([(sale, items)])
 
-        created_at = sale.created_at
-        closed_at = sale.closed_at
-        item_timestamp = closed_at or created_at or datetime.now(UTC)
-
-        sale_model = SaleModel(
-            id=sale.id,
-            currency=sale.currency,
-            total_amount=sale.total_amount.amount,
-            total_quantity=sale.total_quantity,
-            created_at=created_at,
-            closed_at=closed_at,
-            customer_id=sale.customer_id,
-            items=[
-                SaleItemModel(
-                    id=item.id,
-                    product_id=item.product_id,
-                    quantity=item.quantity,
-                    unit_price=item.unit_price.amount,
-                    line_total=item.line_total.amount,
-                    created_at=item_timestamp,
+    async def add_sales(self, sales: Sequence[Sale]) -> None:
+        """Persist many closed sales with one flush and one rollup upsert per bucket."""
+        if any(not sale.items for sale in sales):
+            raise ValueError("Sale must include items to persist")
+        await self._persist([(sale, sale.items) for sale in sales])
+
+    async def existing_ids(self, sale_ids: Sequence[str]) -> set[str]:
+        if not sale_ids:
+            return set()
+        stmt = select(SaleModel.id).where(SaleModel.id.in_(list(sale_ids)))
+        return set((await self._session.execute(stmt)).scalars())
+
+    async def _persist(self, sales: Sequence[tuple[Sale, Sequence[SaleItem]]]) -> None:
+        delta = RollupDelta()
+        totals = {sale.id: sale.totals() for sale, _ in sales}
+        for sale, items in sales:
+            created_at = sale.created_at
+            item_timestamp = sale.closed_at or created_at or datetime.now(UTC)
+            self._session.add(
+                SaleModel(
+                    id=sale.id,
+                    currency=sale.currency,
+                    total_amount=totals[sale.id].amount.amount,
+                    total_quantity=totals[sale.id].quantity,
+                    created_at=created_at,
+                    closed_at=sale.closed_at,
+                    customer_id=sale.customer_id,
+                    items=[
+                        SaleItemModel(
+                            id=item.id,
+                            product_id=item.product_id,
+                            quantity=item.quantity,
+                            unit_price=item.unit_price.amount,
+                            line_total=item.line_total.amount,
+                            created_at=item_timestamp,
+                        )
+                        for item in items
+                    ],
+                )
+            )
+            delta.add_sale(
+                created_at=created_at,
+                currency=sale.currency,
+                customer_id=sale.customer_id,
+                lines=[
+                    RollupLine(product_id=item.product_id, quantity=item.quantity, amount=item.line_total.amount)
+                    for item in items
+                ],
+            )
+        try:
+            await self._session.flush()
+        except IntegrityError as exc:
+            if _is_sale_id_conflict(exc):
+                # A concurrent replay committed these ids first; retrying reports them as duplicates.
+                raise ConcurrencyConflictError("Sale was recorded concurrently") from exc
+            raise
+        await self._rollups.apply(delta)
+        for sale, _ in sales:
+            if sale.customer_id is not None:
+                await self._customer_stats.record_sale(
+                    customer_id=sale.customer_id,
+                    sale_id=sale.id,
+                    currency=sale.currency,
+                    amount=totals[sale.id].amount.amount,
+                    quantity=totals[sale.id].quantity,
+                    created_at=sale.created_at,
                 )
-                for item in items
-            ],
-        )
-        self._session.add(sale_model)
-        await self._session.flush()
 
     async def get_by_id(self, sale_id: str) -> Sale | None:
         stmt = select(SaleModel).options(selectinload(SaleModel.items)).where(SaleModel.id == sale_id)
@@ -57,95 +108,8 @@ class SqlAlchemySalesRepository(SalesRepository):
             return None
         return self._to_sale(model)
 
-    async def list_sales(
-        self,
-        *,
-        customer_id: str | None = None,
-        date_from: datetime | None = None,
-        date_to: datetime | None = None,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[Sequence[Sale], int]:
-        stmt = select(SaleModel).options(selectinload(SaleModel.items)).order_by(SaleModel.created_at.desc())
-        count_stmt = select(func.count(SaleModel.id))
-
-        if customer_id is not None:
-            stmt = stmt.where(SaleModel.customer_id == customer_id)
-            count_stmt = count_stmt.where(SaleModel.customer_id == customer_id)
-        if date_from is not None:
-            stmt = stmt.where(SaleModel.created_at >= date_from)
-            count_stmt = count_stmt.where(SaleModel.created_at >= date_from)
-        if date_to is not None:
-            stmt = stmt.where(SaleModel.created_at <= date_to)
-            count_stmt = count_stmt.where(SaleModel.created_at <= date_to)
-
-        stmt = stmt.offset(offset).limit(limit)
-
-        sales_result = await self._session.execute(stmt)
-        sale_models = sales_result.scalars().all()
-        count_result = await self._session.execute(count_stmt)
-        total = count_result.scalar_one()
-
-        sales = [self._to_sale(model) for model in sale_models]
-        return sales, int(total)
-
-    async def list_sales_for_customer(
-        self,
-        customer_id: str,
-        *,
-        offset: int = 0,
-        limit: int = 20,
-    ) -> tuple[Sequence[Sale], int]:
-        return await self.list_sales(customer_id=customer_id, offset=offset, limit=limit)
-
     async def get_customer_sales_summary(self, customer_id: str) -> CustomerSalesSummary:
-        summary_stmt = select(
-            func.count(SaleModel.id),
-            func.coalesce(func.sum(SaleModel.total_amount), 0),
-            func.coalesce(func.sum(SaleModel.total_quantity), 0),
-            func.min(SaleModel.created_at),
-            func.max(SaleModel.created_at),
-        ).where(SaleModel.customer_id == customer_id)
-
-        result = await self._session.execute(summary_stmt)
-        total_sales, total_amount, total_quantity, first_sale_at, last_sale_at = result.one()
-
-        total_sales_int = int(total_sales or 0)
-        total_amount_decimal = Decimal(total_amount or 0).quantize(Decimal("0.01"))
-        total_quantity_int = int(total_quantity or 0)
-
-        currency: str | None = None
-        last_sale_id: str | None = None
-        last_sale_amount: Decimal | None = None
-
-        if total_sales_int > 0:
-            last_sale_stmt = (
-                select(
-                    SaleModel.id,
-                    SaleModel.currency,
-                    SaleModel.total_amount,
-                )
-                .where(SaleModel.customer_id == customer_id)
-                .order_by(SaleModel.created_at.desc())
-                .limit(1)
-            )
-            last_sale_result = await self._session.execute(last_sale_stmt)
-            last_row = last_sale_result.first()
-            if last_row is not None:
-                last_sale_id = last_row[0]
-                currency = last_row[1]
-                last_sale_amount = Decimal(last_row[2]).quantize(Decimal("0.01"))
-
-        return CustomerSalesSummary(
-            currency=currency,
-            total_sales=total_sales_int,
-            total_amount=total_amount_decimal,
-            total_quantity=total_quantity_int,
-            first_sale_at=first_sale_at,
-            last_sale_at=last_sale_at,
-            last_sale_id=last_sale_id,
-            last_sale_amount=last_sale_amount,
-        )
+        return await self._customer_stats.get(customer_id)
 
     def _to_sale(self, model: SaleModel) -> Sale:
         sale = Sale(
@@ -163,7 +127,13 @@ class SqlAlchemySalesRepository(SalesRepository):
                 quantity=item_model.quantity,
                 unit_price=Money(item_model.unit_price, sale.currency),
                 line_total=Money(item_model.line_total, sale.currency),
+                returned_quantity=item_model.returned_quantity,
             )
             items.append(item)
         sale.items.extend(items)
         return sale
+
+
+def _is_sale_id_conflict(exc: IntegrityError) -> bool:
+    message = str(exc.orig)
+    return "sales_pkey" in message or "sales.id" in message
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+from app.infrastructure.db.models.return_model import ReturnItemModel, ReturnModel
+from app.infrastructure.db.models.sale_model import SaleItemModel, SaleModel
+from app.infrastructure.db.models.sales_rollup_model import (
+    HOURLY_ROLLUP_SLOTS,
+    ROLLUP_COUNTER_COLUMNS,
+    SalesDailyCustomerRollupModel,
+    SalesDailyProductRollupModel,
+    SalesHourlyRollupModel,
+)
+from app.infrastructure.db.utils import upsert_insert
+
+# Rows per INSERT ... ON CONFLICT statement; keeps bind parameters under driver limits.
+UPSERT_CHUNK_SIZE = 500
+
+
+@dataclass(slots=True)
+class RollupLine:
+    product_id: str
+    quantity: int
+    amount: Decimal
+
+
+def _bucket(moment: datetime) -> tuple[date, int]:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return moment.date(), moment.hour
+
+
+def _counters() -> list[Any]:
+    return [0, 0, Decimal("0"), 0, Decimal("0")]
+
+
+@dataclass(slots=True)
+class RollupDelta:
+    """Counter increments keyed by rollup primary key; merged before hitting the database."""
+
+    hourly: dict[tuple[date, int, str], list[Any]] = field(default_factory=lambda: defaultdict(_counters))
+    product: dict[tuple[date, str, str], list[Any]] = field(default_factory=lambda: defaultdict(_counters))
+    customer: dict[tuple[date, str, str], list[Any]] = field(default_factory=lambda: defaultdict(_counters))
+
+    def add_sale(
+        self,
+        *,
+        created_at: datetime,
+        currency: str,
+        customer_id: str | None,
+        lines: Iterable[RollupLine],
+    ) -> None:
+        day, hour = _bucket(created_at)
+        lines = list(lines)
+        quantity = sum(line.quantity for line in lines)
+        revenue = sum((line.amount for line in lines), Decimal("0"))
+        _bump(self.hourly[(day, hour, currency)], 1, quantity, revenue, 0, Decimal("0"))
+        if customer_id is not None:
+            _bump(self.customer[(day, customer_id, currency)], 1, quantity, revenue, 0, Decimal("0"))
+
+        per_product: dict[str, list[Any]] = defaultdict(lambda: [0, Decimal("0")])
+        for line in lines:
+            per_product[line.product_id][0] += line.quantity
+            per_product[line.product_id][1] += line.amount
+        for product_id, (product_qty, product_amount) in per_product.items():
+            _bump(self.product[(day, product_id, currency)], 1, product_qty, product_amount, 0, Decimal("0"))
+
+    def add_return(
+        self,
+        *,
+        created_at: datetime,
+        currency: str,
+        customer_id: str | None,
+        lines: Iterable[RollupLine],
+    ) -> None:
+        day, hour = _bucket(created_at)
+        lines = list(lines)
+        quantity = sum(line.quantity for line in lines)
+        amount = sum((line.amount for line in lines), Decimal("0"))
+        _bump(self.hourly[(day, hour, currency)], 0, 0, Decimal("0"), quantity, amount)
+        if customer_id is not None:
+            _bump(self.customer[(day, customer_id, currency)], 0, 0, Decimal("0"), quantity, amount)
+        for line in lines:
+            _bump(self.product[(day, line.product_id, currency)], 0, 0, Decimal("0"), line.quantity, line.amount)
+
+
+def _bump(counters: list[Any], *deltas: Any) -> None:
+    for index, delta in enumerate(deltas):
+        counters[index] += delta
+
+
+class SqlAlchemySalesRollupRepository:
+    """Maintains the sales rollup tables inside the caller's transaction.
+
+    Sales and returns add their deltas with ``INSERT ... ON CONFLICT DO UPDATE`` so
+    concurrent writers increment the same bucket without read-modify-write races. Hourly
+    deltas land on a random one of ``HOURLY_ROLLUP_SLOTS`` rows so concurrent checkouts
+    rarely wait on each other's row lock.
+    ``rebuild`` recomputes every bucket from the ledger for backfills or repairs.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def record_sale(
+        self,
+        *,
+        created_at: datetime,
+        currency: str,
+        customer_id: str | None,
+        lines: Sequence[RollupLine],
+    ) -> None:
+        delta = RollupDelta()
+        delta.add_sale(created_at=created_at, currency=currency, customer_id=customer_id, lines=lines)
+        await self.apply(delta)
+
+    async def record_return(
+        self,
+        *,
+        customer_id: str | None,
+        created_at: datetime,
+        currency: str,
+        lines: Sequence[RollupLine],
+    ) -> None:
+        delta = RollupDelta()
+        delta.add_return(created_at=created_at, currency=currency, customer_id=customer_id, lines=lines)
+        await self.apply(delta)
+
+    async def apply(self, delta: RollupDelta) -> None:
+        slot = random.randrange(HOURLY_ROLLUP_SLOTS)
+        hourly = {(*key, slot): counters for key, counters in delta.hourly.items()}
+        await self._upsert(SalesHourlyRollupModel, ("day", "hour", "currency", "slot"), hourly)
+        await self._upsert(SalesDailyProductRollupModel, ("day", "product_id", "currency"), delta.product)
+        await self._upsert(SalesDailyCustomerRollupModel, ("day", "customer_id", "currency"), delta.customer)
+
+    async def rebuild(self, *, batch_size: int = 1000) -> int:
+        """Recompute all rollups from sales and returns; returns the number of sales folded in."""
+        for model in (SalesHourlyRollupModel, SalesDailyProductRollupModel, SalesDailyCustomerRollupModel):
+            await self._session.execute(delete(model))
+
+        delta = RollupDelta()
+        sales_seen = 0
+        sale_rows = await self._session.stream(
+            select(
+                SaleModel.id,
+                SaleModel.created_at,
+                SaleModel.currency,
+                SaleModel.customer_id,
+                SaleItemModel.product_id,
+                SaleItemModel.quantity,
+                SaleItemModel.line_total,
+            )
+            .join(SaleItemModel, SaleItemModel.sale_id == SaleModel.id)
+            .order_by(SaleModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for header, lines in _group_by_parent(sale_rows):
+            _, created_at, currency, customer_id = header
+            delta.add_sale(created_at=created_at, currency=currency, customer_id=customer_id, lines=lines)
+            sales_seen += 1
+
+        return_rows = await self._session.stream(
+            select(
+                ReturnModel.id,
+                ReturnModel.created_at,
+                ReturnModel.currency,
+                SaleModel.customer_id,
+                ReturnItemModel.product_id,
+                ReturnItemModel.quantity,
+                ReturnItemModel.line_total,
+            )
+            .join(ReturnItemModel, ReturnItemModel.return_id == ReturnModel.id)
+            .join(SaleModel, SaleModel.id == ReturnModel.sale_id)
+            .order_by(ReturnModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for header, lines in _group_by_parent(return_rows):
+            _, created_at, currency, customer_id = header
+            delta.add_return(created_at=created_at, currency=currency, customer_id=customer_id, lines=lines)
+
+        await self.apply(delta)
+        return sales_seen
+
+    async def _upsert(
+        self,
+        model: type[Any],
+        key_columns: tuple[str, ...],
+        buckets: dict[tuple[Any, ...], list[Any]],
+    ) -> None:
+        if not buckets:
+            return
+        rows = [
+            {**dict(zip(key_columns, key)), **dict(zip(ROLLUP_COUNTER_COLUMNS, counters))}
+            for key, counters in buckets.items()
+        ]
+        insert = upsert_insert(self._session)
+        for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+            stmt = insert(model).values(rows[start : start + UPSERT_CHUNK_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key_columns),
+                set_={name: getattr(model, name) + getattr(stmt.excluded, name) for name in ROLLUP_COUNTER_COLUMNS},
+            )
+            await self._session.execute(stmt)
+
+
+async def _group_by_parent(result: AsyncResult[Any]) -> AsyncIterator[tuple[tuple[Any, ...], list[RollupLine]]]:
+    """Yield (header, lines) for rows ordered by parent id: (id, created_at, currency, customer_id, *line)."""
+    current_id: str | None = None
+    header: tuple[Any, ...] = ()
+    lines: list[RollupLine] = []
+    async for partition in result.partitions():
+        for row in partition:
+            if row[0] != current_id:
+                if current_id is not None:
+                    yield header, lines
+                current_id, header, lines = row[0], tuple(row[:4]), []
+            lines.append(RollupLine(product_id=row[4], quantity=row[5], amount=Decimal(str(row[6]))))
+    if current_id is not None:
+        yield header, lines
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from tenacity import AsyncRetrying, RetryCallState, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from app.core.metrics import metrics
+from app.core.settings import get_settings
+from app.domain.common.errors import ConcurrencyConflictError
+
+T = TypeVar("T")
+
+# serialization_failure, deadlock_detected
+RETRYABLE_SQLSTATES = frozenset({"40001", "40P01"})
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, ConcurrencyConflictError):
+        return True
+    if isinstance(exc, DBAPIError):
+        sqlstate = getattr(exc.orig, "sqlstate", None) or getattr(exc.orig, "pgcode", None)
+        return sqlstate in RETRYABLE_SQLSTATES or "database is locked" in str(exc.orig)
+    return False
+
+
+async def run_transaction(session: AsyncSession, work: Callable[[], Awaitable[T]], *, operation: str) -> T:
+    """Run ``work`` and commit, replaying both from a rolled-back session on retryable failures.
+
+    ``work`` must rebuild all of its state from the session on every call. Retries back off with
+    full jitter, so competing tills on a hot SKU spread out instead of colliding again.
+    """
+    settings = get_settings()
+
+    def _count_retry(state: RetryCallState) -> None:
+        metrics.increment(f"db.transaction.retries.{operation}")
+
+    retrying = AsyncRetrying(
+        stop=stop_after_attempt(settings.TRANSACTION_RETRY_ATTEMPTS),
+        wait=wait_random_exponential(
+            multiplier=settings.TRANSACTION_RETRY_BASE_SECONDS, max=settings.TRANSACTION_RETRY_MAX_SECONDS
+        ),
+        retry=retry_if_exception(is_retryable),
+        before_sleep=_count_retry,
+        reraise=True,
+    )
+    try:
+        async for attempt in retrying:
+            with attempt:
+                try:
+                    result = await work()
+                    await session.commit()
+                except BaseException:
+                    await session.rollback()
+                    raise
+    except Exception as exc:
+        if is_retryable(exc):
+            metrics.increment(f"db.transaction.retries_exhausted.{operation}")
+        raise
+    return result
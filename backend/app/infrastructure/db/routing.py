@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+_WROTE = "wrote"
+_LSN_PREFIX = "lsn:"
+_TIMESTAMP_PREFIX = "ts:"
+
+
+@dataclass(slots=True)
+class WriteTracker:
+    """Collects the consistency token of the request's committed write, if any."""
+
+    token: str | None = None
+
+
+_write_tracker: ContextVar[WriteTracker | None] = ContextVar("db_write_tracker", default=None)
+
+
+def start_write_tracking() -> WriteTracker:
+    tracker = WriteTracker()
+    _write_tracker.set(tracker)
+    return tracker
+
+
+def current_write_tracker() -> WriteTracker | None:
+    return _write_tracker.get()
+
+
+def session_wrote(session: AsyncSession) -> bool:
+    return bool(session.sync_session.info.get(_WROTE))
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(orm_execute_state: Any) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+async def issue_consistency_token(session: AsyncSession) -> str:
+    """Token for the write just committed through ``session``: the WAL position on Postgres, else the time."""
+    if session.get_bind().dialect.name == "postgresql":
+        lsn = (await session.execute(text("SELECT pg_current_wal_lsn()::text"))).scalar_one()
+        return f"{_LSN_PREFIX}{lsn}"
+    return f"{_TIMESTAMP_PREFIX}{time.time():.6f}"
+
+
+def replica_has_caught_up(replica: Connection, token: str, *, max_lag_seconds: float) -> bool:
+    """Whether ``replica`` already reflects the write ``token`` was issued for; unknown tokens count as not."""
+    try:
+        if token.startswith(_LSN_PREFIX):
+            stmt = text("SELECT pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn)")
+            return bool(replica.execute(stmt, {"lsn": token[len(_LSN_PREFIX) :]}).scalar())
+        if token.startswith(_TIMESTAMP_PREFIX):
+            # Without a replay position to compare, assume the replica trails by at most max_lag_seconds.
+            return time.time() - float(token[len(_TIMESTAMP_PREFIX) :]) >= max_lag_seconds
+    except (ValueError, TypeError):
+        return False
+    return False
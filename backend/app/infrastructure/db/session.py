@@ -1,23 +1,106 @@
 from __future__ import annotations
 
 from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session
 
-from app.core.settings import get_settings
+from app.core.settings import Settings, get_settings
+from app.infrastructure.db.instrumentation import TimedQueuePool, instrument_engine
+from app.infrastructure.db.post_commit import run_post_commit_callbacks
+from app.infrastructure.db.routing import (
+    current_write_tracker,
+    issue_consistency_token,
+    replica_has_caught_up,
+    session_wrote,
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def engine_options(settings: Settings, database_url: str | None = None) -> dict[str, Any]:
+    """Keyword arguments for ``create_async_engine`` derived from the pool settings."""
+    url = make_url(database_url or settings.DATABASE_URL)
+    options: dict[str, Any] = {"echo": settings.database_echo}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options  # in-memory SQLite keeps SQLAlchemy's single-connection pool
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if settings.DB_STATEMENT_TIMEOUT_MS and url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+    return options
+
+
 _settings = get_settings()
-engine = create_async_engine(_settings.DATABASE_URL, echo=_settings.database_echo)
+engine = create_async_engine(_settings.DATABASE_URL, **engine_options(_settings))
+instrument_engine(engine.sync_engine)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 # Export factory alias for tests
 async_session_factory = AsyncSessionLocal
 
+replica_engine: AsyncEngine | None = None
+if _settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        _settings.DATABASE_REPLICA_URL, **engine_options(_settings, _settings.DATABASE_REPLICA_URL)
+    )
+    instrument_engine(replica_engine.sync_engine, prefix="db.replica")
+
+
+@lru_cache
+def _read_only(bind: Engine) -> Engine:
+    # asyncpg then opens each transaction as READ ONLY DEFERRABLE; SQLite has no equivalent.
+    if bind.dialect.name == "postgresql":
+        return bind.execution_options(postgresql_readonly=True, postgresql_deferrable=True)
+    return bind
+
+
+class ReadOnlySession(Session):
+    """Session for read-only requests whose bind is picked when the first statement runs.
+
+    Until then no connection is checked out, so a request answered from cache never touches
+    the pool. Reads go to the replica when one is configured, unless ``consistency_token``
+    names a write the replica has not replayed yet (then the primary serves them).
+    """
+
+    def __init__(self, *args: Any, consistency_token: str | None = None, use_replica: bool = True, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._consistency_token = consistency_token
+        self._use_replica = use_replica
+        self._routed: Engine | None = None
+
+    def get_bind(self, mapper: Any = None, **kwargs: Any) -> Engine:
+        if self._routed is None:
+            self._routed = _read_only(self._route())
+        return self._routed
+
+    def _route(self) -> Engine:
+        if replica_engine is None or not self._use_replica:
+            return engine.sync_engine
+        replica = replica_engine.sync_engine
+        if self._consistency_token is None:
+            return replica
+        with replica.connect() as connection:
+            caught_up = replica_has_caught_up(
+                connection, self._consistency_token, max_lag_seconds=_settings.DATABASE_REPLICA_MAX_LAG_SECONDS
+            )
+        return replica if caught_up else engine.sync_engine
+
+
+ReadSessionLocal = async_sessionmaker(
+    engine, expire_on_commit=False, class_=AsyncSession, sync_session_class=ReadOnlySession
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:  # FastAPI dependency
     async with AsyncSessionLocal() as session:  # pragma: no cover - thin wrapper
@@ -26,4 +109,10 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:  # FastAPI depend
             await session.commit()
         except Exception:
             await session.rollback()
+            await run_post_commit_callbacks(session)  # side effects of work committed earlier, e.g. by run_transaction
             raise
+        await run_post_commit_callbacks(session)
+        tracker = current_write_tracker()
+        if replica_engine is not None and tracker is not None and session_wrote(session):
+            # Clients echo this back so their next read waits for (or bypasses) a lagging replica.
+            tracker.token = await issue_consistency_token(session)
@@ -1,6 +1,43 @@
 from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Float
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 
 
 def utcnow() -> datetime:
     """Return a timezone-aware UTC datetime for SQLAlchemy defaults."""
     return datetime.now(timezone.utc)
+
+
+def upsert_insert(session: AsyncSession) -> Any:
+    """Return the dialect's ``insert`` construct, which supports ``on_conflict_do_update``."""
+    return pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+
+
+class SecondsBetween(FunctionElement[float]):
+    type = Float()
+    name = "seconds_between"
+    inherit_cache = True
+
+
+def seconds_between(start: Any, end: Any) -> SecondsBetween:
+    """Elapsed seconds from ``start`` to ``end`` as a float SQL expression (Postgres and SQLite)."""
+    return SecondsBetween(start, end)
+
+
+@compiles(SecondsBetween)
+def _seconds_between_default(element: SecondsBetween, compiler: SQLCompiler, **kw: Any) -> str:
+    start, end = list(element.clauses)
+    return f"EXTRACT(EPOCH FROM ({compiler.process(end, **kw)} - {compiler.process(start, **kw)}))"
+
+
+@compiles(SecondsBetween, "sqlite")
+def _seconds_between_sqlite(element: SecondsBetween, compiler: SQLCompiler, **kw: Any) -> str:
+    start, end = list(element.clauses)
+    return f"((julianday({compiler.process(end, **kw)}) - julianday({compiler.process(start, **kw)})) * 86400.0)"
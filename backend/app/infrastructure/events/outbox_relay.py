@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.application.common.event_dispatcher import EventDispatcher
+from app.core.metrics import metrics
+from app.infrastructure.db.repositories.outbox_repository import SqlAlchemyOutboxRepository, decode_event
+
+logger = structlog.get_logger(__name__)
+
+
+class OutboxRelay:
+    """Background task that delivers committed outbox events to the in-process subscribers.
+
+    Every ``interval`` seconds (immediately again while batches come back full) it claims up to
+    ``batch_size`` due events, publishes them in commit order and deletes the delivered rows in
+    the same transaction. A failing event is retried with exponential backoff and holds back
+    later events of its aggregate; after ``max_attempts`` it is parked as ``failed`` and stops
+    blocking. Delivery is at least once, so handlers should be idempotent on ``event_id``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        dispatcher: EventDispatcher,
+        *,
+        batch_size: int = 100,
+        interval: float = 0.5,
+        max_attempts: int = 10,
+        retry_base: float = 1.0,
+        retry_max: float = 300.0,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._session_factory = session_factory
+        self._dispatcher = dispatcher
+        self._batch_size = batch_size
+        self._interval = interval
+        self._max_attempts = max_attempts
+        self._retry_base = retry_base
+        self._retry_max = retry_max
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+
+    async def relay_once(self) -> int:
+        """Deliver one batch; returns the number of events claimed."""
+        now = self._clock()
+        async with self._session_factory() as session:
+            outbox = SqlAlchemyOutboxRepository(session)
+            rows = await outbox.claim(now=now, limit=self._batch_size)
+            delivered: list[int] = []
+            for row in rows:
+                try:
+                    await self._dispatcher.publish(decode_event(row))
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                    if row.attempts + 1 >= self._max_attempts:
+                        outbox.give_up(row, error=error)
+                        metrics.increment("outbox.events.failed")
+                        logger.error(
+                            "outbox_event_failed", event_id=row.event_id, event_type=row.event_type, error=error
+                        )
+                    else:
+                        delay = min(self._retry_base * 2**row.attempts, self._retry_max)
+                        outbox.retry_later(row, error=error, available_at=now + timedelta(seconds=delay))
+                        metrics.increment("outbox.events.retried")
+                        logger.warning("outbox_event_retry", event_id=row.event_id, attempts=row.attempts, error=error)
+                    continue
+                delivered.append(row.id)
+                metrics.observe("outbox.delivery_lag_seconds", (now - _aware(row.created_at)).total_seconds())
+            await outbox.delete(delivered)
+            await session.commit()
+        metrics.increment("outbox.events.delivered", len(delivered))
+        return len(rows)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.relay_once()
+            except Exception:
+                logger.exception("outbox_relay_failed")
+                claimed = 0
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._interval)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
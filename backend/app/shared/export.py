@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import AbstractAsyncContextManager
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Literal, TypeVar
+
+ExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows buffered per chunk handed to the ASGI server; large enough to avoid
+# per-row send overhead, small enough that memory stays flat.
+EXPORT_CHUNK_ROWS = 500
+
+# Spreadsheets evaluate text cells starting with these as formulas, so CSV prefixes them with '.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+S = TypeVar("S")
+Q = TypeVar("Q")
+
+
+def export_headers(filename: str, fmt: ExportFormat) -> dict[str, str]:
+    return {
+        "Content-Disposition": f'attachment; filename="{filename}.{fmt}"',
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+    }
+
+
+async def export_rows(
+    open_session: Callable[[], AbstractAsyncContextManager[S]],
+    query_service: Callable[[S], Q],
+    rows: Callable[[Q], AsyncIterator[Any]],
+) -> AsyncIterator[Any]:
+    """Stream ``rows(query_service(session))`` from a session opened for the export alone."""
+    # The request-scoped session is released before the body streams, so the cursor gets its own.
+    # Callers pass the replica factory: exports tolerate lag, so they never wait for the caller's own writes.
+    async with open_session() as session:
+        async for row in rows(query_service(session)):
+            yield row
+
+
+async def encode_rows(
+    rows: AsyncIterator[Any],
+    fields: Sequence[str],
+    fmt: ExportFormat,
+    *,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> AsyncIterator[str]:
+    """Serialize read-model ``rows`` lazily, reading ``fields`` as attributes.
+
+    CSV emits its header before the first row is fetched, so clients see bytes immediately.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+    if writer is not None:
+        writer.writerow(fields)
+        yield _drain(buffer)
+
+    pending = 0
+    async for row in rows:
+        if writer is not None:
+            writer.writerow([_csv_value(getattr(row, name)) for name in fields])
+        else:
+            buffer.write(json.dumps({name: _json_value(getattr(row, name)) for name in fields}, ensure_ascii=False))
+            buffer.write("\n")
+        pending += 1
+        if pending >= chunk_rows:
+            yield _drain(buffer)
+            pending = 0
+    if pending:
+        yield _drain(buffer)
+
+
+def _drain(buffer: io.StringIO) -> str:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return chunk
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return _json_value(value)
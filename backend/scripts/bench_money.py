@@ -0,0 +1,112 @@
+"""Micro-benchmark: integer-cents Money vs. the previous Decimal-backed implementation.
+
+Usage: python scripts/bench_money.py [--lines 25] [--rows 1000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import timeit
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from app.domain.common.money import LineTotals, Money  # noqa: E402
+
+
+@dataclass(frozen=True, slots=True)
+class DecimalMoney:
+    """The Decimal-backed Money this module replaced, kept here as the baseline."""
+
+    amount: Decimal
+    currency: str = "USD"
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "amount", self.amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+    def add(self, other: DecimalMoney) -> DecimalMoney:
+        return DecimalMoney(self.amount + other.amount, self.currency)
+
+    def multiply(self, multiplier: int) -> DecimalMoney:
+        return DecimalMoney(self.amount * Decimal(multiplier), self.currency)
+
+
+def _basket(lines: int) -> list[tuple[Decimal, int]]:
+    return [(Decimal(f"{(index % 40) + 1}.{index % 100:02d}"), (index % 5) + 1) for index in range(lines)]
+
+
+@dataclass(slots=True)
+class _Line:
+    quantity: int
+    line_total: Any
+
+
+def bench_basket(lines: int, repeat: int) -> tuple[float, float]:
+    basket = _basket(lines)
+
+    def legacy() -> Decimal:
+        items = [_Line(quantity, DecimalMoney(price).multiply(quantity)) for price, quantity in basket]
+        # The old Sale.total_amount re-summed on every read; add_sale, the response and the event read it 3x.
+        result = Decimal("0")
+        for _ in range(3):
+            total = DecimalMoney(Decimal("0"))
+            for item in items:
+                total = total.add(item.line_total)
+            result = total.amount
+        return result
+
+    def current() -> Decimal:
+        items = [_Line(quantity, Money(price).multiply(quantity)) for price, quantity in basket]
+        # Persisting, the response and the event each still take one snapshot, now summed in cents.
+        result = Decimal("0")
+        for _ in range(3):
+            result = LineTotals.of(items, "USD").amount.amount
+        return result
+
+    assert legacy() == current()
+    number = max(1, 20_000 // lines)
+    return (
+        min(timeit.repeat(legacy, number=number, repeat=repeat)) / number,
+        min(timeit.repeat(current, number=number, repeat=repeat)) / number,
+    )
+
+
+def bench_mapping(rows: int, repeat: int) -> tuple[float, float]:
+    # Numeric columns come back as Decimal; the old mapper round-tripped them through str.
+    values = [Decimal(f"{(index % 900) + 1}.{index % 100:02d}") for index in range(rows)]
+
+    def legacy() -> list[DecimalMoney]:
+        return [DecimalMoney(Decimal(str(value))) for value in values]
+
+    def current() -> list[Money]:
+        return [Money(value) for value in values]
+
+    number = max(1, 50_000 // rows)
+    return (
+        min(timeit.repeat(legacy, number=number, repeat=repeat)) / number,
+        min(timeit.repeat(current, number=number, repeat=repeat)) / number,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=25)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, (legacy, current) in (
+        (f"basket total ({args.lines} lines, 3 reads)", bench_basket(args.lines, args.repeat)),
+        (f"row mapping ({args.rows} prices)", bench_mapping(args.rows, args.repeat)),
+    ):
+        print(f"{label:<36} decimal {legacy * 1e6:9.1f} us   cents {current * 1e6:9.1f} us   x{legacy / current:.2f}")
+
+
+if __name__ == "__main__":
+    main()
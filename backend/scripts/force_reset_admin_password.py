@@ -22,7 +22,7 @@ async def main() -> None:
         print(f"Found admin user: {user.id}")
         
         hasher = PasswordHasher()
-        new_hash = hasher.hash("AdminPass123!")
+        new_hash = await hasher.hash("AdminPass123!")
         
         # Manually update the model to avoid use case complexity for this fix
         # But we should use the repository update if possible, or just SQL
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+async def main() -> None:
+    from app.infrastructure.db.maintenance import purge_refresh_tokens
+
+    deleted = await purge_refresh_tokens()
+    print(f"Purged {deleted} expired or revoked refresh tokens")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
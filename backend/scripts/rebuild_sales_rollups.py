@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sys
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+async def main() -> None:
+    from app.infrastructure.db.repositories.customer_stats_repository import SqlAlchemyCustomerStatsRepository
+    from app.infrastructure.db.repositories.sales_rollup_repository import SqlAlchemySalesRollupRepository
+    from app.infrastructure.db.session import async_session_factory
+
+    async with async_session_factory() as session:
+        sales = await SqlAlchemySalesRollupRepository(session).rebuild()
+        customers = await SqlAlchemyCustomerStatsRepository(session).rebuild()
+        await session.commit()
+        print(f"Rebuilt sales rollups from {sales} sales and stats for {customers} customers")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
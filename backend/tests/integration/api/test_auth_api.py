@@ -1,12 +1,24 @@
+import json
 import uuid
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
 
 from app.api.main import app
-from app.domain.auth.entities import UserRole
+from app.application.auth.services.principal_cache import PrincipalCache
+from app.domain.auth.admin_action_log import AdminActionLog
+from app.domain.auth.entities import RefreshToken, User, UserRole
+from app.infrastructure.cache.principal_invalidation import PostCommitPrincipalInvalidator
+from app.infrastructure.db.admin_action_writer import BufferedAdminActionWriter, PostCommitAdminActionSink
+from app.infrastructure.db.post_commit import run_post_commit_callbacks
+from app.infrastructure.db.repositories.admin_action_log_repository import AdminActionLogRepository
+from app.infrastructure.db.repositories.refresh_token_repository import RefreshTokenRepository
 from app.infrastructure.db.repositories.user_repository import UserRepository
+from app.infrastructure.db.session import async_session_factory
+from app.shared.pagination import PageParams
 from tests.integration.api.helpers import create_user, login_as
 
 
@@ -401,4 +413,197 @@ async def test_admin_can_list_users_with_filters(async_session):
         payload = response.json()
         assert payload["meta"]["total"] >= 1
         assert all(item["role"] == UserRole.MANAGER.value for item in payload["items"])
-        assert any(item["email"] == manager_email for item in payload["items"])
\ No newline at end of file
+        assert any(item["email"] == manager_email for item in payload["items"])
+
+@pytest.mark.asyncio
+async def test_cached_principal_is_invalidated_by_admin_changes(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        admin_headers = {"Authorization": f"Bearer {await login_as(async_session, ac, UserRole.ADMIN)}"}
+        cashier_headers = {"Authorization": f"Bearer {await login_as(async_session, ac, UserRole.CASHIER)}"}
+
+        me = await ac.get("/api/v1/auth/me", headers=cashier_headers)
+        assert me.status_code == 200, me.text
+        cashier = me.json()
+        assert (await ac.get("/api/v1/products", headers=cashier_headers)).status_code == 200
+
+        demoted = await ac.post(
+            f"/api/v1/auth/users/{cashier['id']}/role",
+            json={"expected_version": cashier["version"], "role": UserRole.AUDITOR.value},
+            headers=admin_headers,
+        )
+        assert demoted.status_code == 200, demoted.text
+        assert (await ac.get("/api/v1/products", headers=cashier_headers)).status_code == 403
+
+        deactivated = await ac.post(
+            f"/api/v1/auth/users/{cashier['id']}/deactivate",
+            json={"expected_version": demoted.json()["version"]},
+            headers=admin_headers,
+        )
+        assert deactivated.status_code == 200, deactivated.text
+        assert (await ac.get("/api/v1/auth/me", headers=cashier_headers)).status_code in (401, 403)
+
+        metrics = await ac.get("/api/v1/metrics", headers=admin_headers)
+        assert metrics.status_code == 200, metrics.text
+        gauges = metrics.json()["gauges"]
+        assert gauges["auth.principal_cache.hits"] >= 1
+        assert gauges["db.pool.checked_out"] >= 0
+        query_timing = metrics.json()["timings"]["db.query_seconds"]
+        assert query_timing["buckets"]["+Inf"] == query_timing["count"] > 0
+        assert metrics.headers["Server-Timing"].startswith("db;dur=")
+        assert 0 < gauges["auth.principal_cache.hit_ratio"] <= 1
+        assert (await ac.get("/api/v1/metrics", headers=cashier_headers)).status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_repeated_failed_logins_are_throttled(async_session):
+    transport = ASGITransport(app=app)
+    email = f"user_{uuid.uuid4().hex[:8]}@example.com"
+
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        reg = await ac.post("/api/v1/auth/register", json={"email": email, "password": "password123"})
+        assert reg.status_code == 201
+
+        for _ in range(5):
+            failed = await ac.post("/api/v1/auth/login", json={"email": email, "password": "wrongpass"})
+            assert failed.status_code == 401
+
+        # Locked out: even the right password is refused without being checked.
+        locked = await ac.post("/api/v1/auth/login", json={"email": email, "password": "password123"})
+        assert locked.status_code == 429
+        assert locked.json()["code"] == "too_many_login_attempts"
+        assert 0 < int(locked.headers["Retry-After"]) <= 30
+
+        token = await ac.post("/api/v1/auth/token", data={"username": email.upper(), "password": "password123"})
+        assert token.status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_refresh_tokens_are_revoked_in_bulk_and_purged(async_session):
+    email = f"user_{uuid.uuid4().hex[:8]}@example.com"
+    await create_user(async_session, email, "password123", UserRole.CASHIER)
+    user = await UserRepository(async_session).get_by_email(email)
+    assert user is not None
+    repo = RefreshTokenRepository(async_session)
+    now = datetime.now(UTC)
+
+    live = [RefreshToken.issue(user.id, expires_at=now + timedelta(days=1)) for _ in range(3)]
+    expired = RefreshToken.issue(user.id, expires_at=now - timedelta(minutes=1))
+    # Issued a week ago: retention counts from its revocation below, not from issue time.
+    live[0].created_at = now - timedelta(days=7)
+    for token in [*live, expired]:
+        await repo.add(token)
+    await repo.revoke(live[0].id)
+
+    assert await repo.revoke_all_for_user(user.id) == 3
+    assert await repo.revoke_all_for_user(user.id) == 0
+    revoked = await repo.get_by_id(live[1].id)
+    assert revoked is not None and revoked.revoked and revoked.version == 1
+
+    # Recently revoked tokens survive until the retention cutoff; expired ones go straight away.
+    kept = now - timedelta(hours=1)
+    assert await repo.purge(expired_before=now, revoked_before=kept, limit=100) >= 1
+    assert await repo.get_by_id(expired.id) is None
+    assert await repo.get_by_id(live[0].id) is not None
+
+    later = now + timedelta(seconds=1)
+    assert await repo.purge(expired_before=now, revoked_before=later, limit=2) == 2
+    await repo.purge(expired_before=now, revoked_before=later, limit=100)
+    assert all([await repo.get_by_id(token.id) is None for token in live])
+    await async_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_admin_action_writer_bulk_inserts_and_replays_spool(async_session, tmp_path):
+    email = f"admin_{uuid.uuid4().hex[:8]}@example.com"
+    await create_user(async_session, email, "password123", UserRole.ADMIN)
+    admin = await UserRepository(async_session).get_by_email(email)
+    assert admin is not None
+
+    # A segment left behind by a worker that died before delivering it, ending in a torn line.
+    leftover = AdminActionLog.create(actor_user_id=admin.id, target_user_id=None, action="test.leftover")
+    line = json.dumps(
+        {
+            "id": leftover.id,
+            "actor_user_id": admin.id,
+            "target_user_id": None,
+            "action": leftover.action,
+            "details": {},
+            "trace_id": None,
+            "created_at": leftover.created_at.isoformat(),
+        }
+    )
+    (tmp_path / "admin-actions-1-1.jsonl").write_text(f'{line}\n{line}\n{{"id": ', encoding="utf-8")
+
+    writer = BufferedAdminActionWriter(async_session_factory, tmp_path, batch_size=2, flush_interval=60)
+    await writer.start()
+    for n in range(3):
+        log = AdminActionLog.create(actor_user_id=admin.id, target_user_id=None, action=f"test.buffered{n}")
+        await writer.add(log)
+    assert writer.pending == 5
+    await writer.stop()
+
+    assert writer.pending == 0
+    assert list(tmp_path.iterdir()) == []
+    logs, total = await AdminActionLogRepository(async_session).search(
+        actor_user_id=admin.id,
+        target_user_id=None,
+        action=None,
+        start=None,
+        end=None,
+        params=PageParams(page=1, limit=10),
+    )
+    assert total == 4
+    assert sorted(log.action for log in logs) == ["test.buffered0", "test.buffered1", "test.buffered2", "test.leftover"]
+
+
+@pytest.mark.asyncio
+async def test_admin_action_reaches_the_writer_only_after_commit(tmp_path):
+    writer = BufferedAdminActionWriter(async_session_factory, tmp_path, flush_interval=60)
+    log = AdminActionLog.create(actor_user_id="01ACTOR", target_user_id=None, action="user.deactivate")
+
+    async with async_session_factory() as session:
+        sink = PostCommitAdminActionSink(session, writer)
+        await session.execute(text("SELECT 1"))
+        await sink.add(log)
+        await session.rollback()
+        await run_post_commit_callbacks(session)
+        assert writer.pending == 0
+
+        await session.execute(text("SELECT 1"))
+        await sink.add(log)
+        assert writer.pending == 0
+        await session.commit()
+        await run_post_commit_callbacks(session)
+        assert writer.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_principal_is_invalidated_only_after_commit():
+    cache = PrincipalCache(ttl=60)
+    now = datetime.now(UTC)
+    user = User(
+        id="01PRINCIPAL",
+        email="principal@example.com",
+        password_hash="x" * 20,
+        role=UserRole.CASHIER,
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+    cache.put(user)
+
+    async with async_session_factory() as session:
+        principals = PostCommitPrincipalInvalidator(session, cache)
+        await session.execute(text("SELECT 1"))
+        await principals.invalidate(user.id)
+        await session.rollback()
+        await run_post_commit_callbacks(session)
+        assert cache.get(user.id) is not None
+
+        await session.execute(text("SELECT 1"))
+        await principals.invalidate(user.id)
+        assert cache.get(user.id) is not None
+        await session.commit()
+        await run_post_commit_callbacks(session)
+        assert cache.get(user.id) is None
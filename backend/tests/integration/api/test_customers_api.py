@@ -5,9 +5,15 @@ from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
 
 from app.api.main import app
 from app.domain.auth.entities import UserRole
+from app.infrastructure.db.models.customer_stats_model import CustomerStatsModel
+from app.infrastructure.db.repositories.customer_stats_repository import (
+    SUMMARY_COLUMNS,
+    SqlAlchemyCustomerStatsRepository,
+)
 from tests.integration.api.helpers import login_as
 
 
@@ -539,6 +545,45 @@ async def test_get_customer_summary_returns_aggregates(async_session):
         assert summary["last_purchase_at"] is not None
 
 
+@pytest.mark.asyncio
+async def test_customer_stats_rebuild_matches_incremental_upkeep(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token = await _register_and_login(async_session, client)
+        manager_token = await _register_and_login(async_session, client, role=UserRole.MANAGER, label="manager")
+        product = await _create_product(client, manager_token, retail_price="20.00")
+        await _add_stock(client, manager_token, product["id"], quantity=20)
+        customers = [await _create_customer(client, sales_token) for _ in range(2)]
+        orders = ((customers[0], 2, "15.00"), (customers[0], 1, "12.50"), (customers[1], 3, "9.99"))
+        sales = [
+            await _record_sale(
+                client,
+                sales_token,
+                customer_id=customer["id"],
+                product_id=product["id"],
+                quantity=quantity,
+                unit_price=price,
+            )
+            for customer, quantity, price in orders
+        ]
+        returned = await client.post(
+            "/api/v1/returns",
+            json={"sale_id": sales[0]["id"], "lines": [{"sale_item_id": sales[0]["items"][0]["id"], "quantity": 1}]},
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+        assert returned.status_code == 201, returned.text
+
+        stmt = select(*SUMMARY_COLUMNS, CustomerStatsModel.returned_quantity).where(
+            CustomerStatsModel.customer_id.in_([customer["id"] for customer in customers])
+        ).order_by(CustomerStatsModel.customer_id)
+        incremental = (await async_session.execute(stmt)).all()
+        assert incremental[0].returned_quantity == 1
+
+        assert await SqlAlchemyCustomerStatsRepository(async_session).rebuild() >= 2
+        await async_session.commit()
+        assert (await async_session.execute(stmt)).all() == incremental
+
+
 @pytest.mark.asyncio
 async def test_get_customer_summary_handles_no_sales(async_session):
     transport = ASGITransport(app=app)
@@ -562,4 +607,61 @@ async def test_get_customer_summary_handles_no_sales(async_session):
         assert summary["last_sale_id"] is None
         assert summary["last_sale_amount"] is None
         assert summary["first_purchase_at"] is None
-        assert summary["last_purchase_at"] is None
\ No newline at end of file
+        assert summary["last_purchase_at"] is None
+
+@pytest.mark.asyncio
+async def test_list_customer_summaries_pages_customers_with_stats(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token = await _register_and_login(async_session, client)
+        manager_token = await _register_and_login(async_session, client, role=UserRole.MANAGER, label="manager")
+        marker = uuid4().hex[:8]
+        buyer = await _create_customer(client, sales_token, last_name=f"Buyer{marker}")
+        browser = await _create_customer(client, sales_token, last_name=f"Browser{marker}")
+        product = await _create_product(client, manager_token, retail_price="20.00")
+        await _add_stock(client, manager_token, product["id"], quantity=10)
+        sale = await _record_sale(
+            client,
+            sales_token,
+            customer_id=buyer["id"],
+            product_id=product["id"],
+            quantity=3,
+            unit_price="10.00",
+        )
+        returned = await client.post(
+            "/api/v1/returns",
+            json={"sale_id": sale["id"], "lines": [{"sale_item_id": sale["items"][0]["id"], "quantity": 1}]},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert returned.status_code == 201, returned.text
+
+        resp = await client.get(
+            "/api/v1/customers/summaries",
+            params={"search": marker},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert resp.status_code == 200, resp.text
+        payload = resp.json()
+        assert payload["meta"]["total"] == 2
+        by_id = {item["customer_id"]: item for item in payload["items"]}
+
+        bought = by_id[buyer["id"]]
+        assert bought["last_name"] == buyer["last_name"]
+        assert bought["total_sales"] == 1
+        assert bought["total_quantity"] == 3
+        assert bought["lifetime_value"] == "30.00"
+        assert bought["returned_amount"] == "10.00"
+        assert bought["last_sale_id"] == sale["id"]
+
+        idle = by_id[browser["id"]]
+        assert idle["total_sales"] == 0
+        assert idle["lifetime_value"] == "0.00"
+        assert idle["last_sale_id"] is None
+
+        single = await client.get(
+            f"/api/v1/customers/{buyer['id']}/summary",
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert single.json() == {
+            key: value for key, value in bought.items() if key not in {"first_name", "last_name", "email", "active"}
+        }
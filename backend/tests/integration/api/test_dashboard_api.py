@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.main import app
+from app.domain.auth.entities import UserRole
+from tests.integration.api.helpers import login_as
+
+
+async def _create_stocked_product(client: AsyncClient, token: str) -> dict:
+    resp = await client.post(
+        "/api/v1/products",
+        json={
+            "name": "Dash Prod",
+            "sku": f"SKU{uuid4().hex[:8]}",
+            "retail_price": "10.00",
+            "purchase_price": "5.00",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 201, resp.text
+    product = resp.json()
+    stock = await client.post(
+        f"/api/v1/products/{product['id']}/inventory/movements",
+        json={"quantity": 10, "direction": "in", "reason": "initial_stock"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert stock.status_code == 201, stock.text
+    return product
+
+
+async def _record_sale(client: AsyncClient, token: str, product_id: str) -> dict:
+    resp = await client.post(
+        "/api/v1/sales",
+        json={"currency": "USD", "lines": [{"product_id": product_id, "quantity": 1, "unit_price": "10.00"}]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()["sale"]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary_aggregates_in_one_call(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        cashier = await login_as(async_session, client, UserRole.CASHIER)
+        manager = await login_as(async_session, client, UserRole.MANAGER)
+        product = await _create_stocked_product(client, manager)
+        sale = await _record_sale(client, cashier, product["id"])
+
+        resp = await client.get(
+            "/api/v1/dashboard/summary",
+            params={"days": 2, "recent_limit": 1},
+            headers={"Authorization": f"Bearer {cashier}"},
+        )
+        assert resp.status_code == 200, resp.text
+        summary = resp.json()
+        assert summary["catalog_size"] >= 1
+        assert summary["orders"] >= 1
+        usd = next(total for total in summary["totals"] if total["currency"] == "USD")
+        assert Decimal(usd["revenue"]) >= Decimal("10.00")
+        assert [recent["id"] for recent in summary["recent_sales"]] == [sale["id"]]
+
+        await _record_sale(client, cashier, product["id"])
+        cached = await client.get(
+            "/api/v1/dashboard/summary",
+            params={"days": 2, "recent_limit": 1},
+            headers={"Authorization": f"Bearer {cashier}"},
+        )
+        assert cached.json() == summary
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary_rejects_out_of_range_window(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        manager = await login_as(async_session, client, UserRole.MANAGER)
+        resp = await client.get(
+            "/api/v1/dashboard/summary",
+            params={"days": 0},
+            headers={"Authorization": f"Bearer {manager}"},
+        )
+        assert resp.status_code == 422
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+import csv
+import io
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 
+from app.api.dependencies.cache import get_cache_service
 from app.api.main import app
+from app.application.inventory.services.stock_cache import StockLevelCache
+from app.application.inventory.use_cases.record_inventory_movement import RecordInventoryMovementUseCase
 from app.domain.auth.entities import UserRole
+from app.domain.common.errors import ConflictError
+from app.infrastructure.cache.memory_cache import MemoryCacheService
+from app.infrastructure.db.repositories.inventory_movement_repository import (
+    SqlAlchemyInventoryMovementRepository,
+)
+from app.infrastructure.db.session import async_session_factory
 from tests.integration.api.helpers import create_user_and_login
 
 
@@ -266,3 +277,98 @@ async def test_inventory_movement_history_pagination(async_session):
         data2 = page2.json()
         assert data2["meta"] == {"page": 2, "limit": 2, "total": 3, "pages": 2}
         assert [item["reason"] for item in data2["items"]] == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_export_inventory_movements_csv(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        inventory_token = await _register_and_login(async_session, client, f"inventory_{uuid4().hex[:6]}@example.com")
+        product = await _create_product(async_session, client)
+        headers = {"Authorization": f"Bearer {inventory_token}"}
+        for quantity, direction, reason in ((7, "in", "count"), (2, "out", '=HYPERLINK("http://x","y")')):
+            resp = await client.post(
+                f"/api/v1/inventory/products/{product['id']}/movements",
+                json={"quantity": quantity, "direction": direction, "reason": reason},
+                headers=headers,
+            )
+            assert resp.status_code == 201, resp.text
+
+        export = await client.get(
+            "/api/v1/inventory/movements/export",
+            params={"product_id": product["id"]},
+            headers=headers,
+        )
+        assert export.status_code == 200, export.text
+        rows = list(csv.DictReader(io.StringIO(export.text)))
+        assert [(row["direction"], row["quantity"]) for row in rows] == [("in", "7"), ("out", "2")]
+        # Free-text cells that a spreadsheet would evaluate are neutralised with a leading quote.
+        assert [row["reason"] for row in rows] == ["count", '\'=HYPERLINK("http://x","y")']
+        assert {row["product_id"] for row in rows} == {product["id"]}
+
+        empty = await client.get(
+            "/api/v1/inventory/movements/export",
+            params={"product_id": "01NOPRODUCT000000000000000"},
+            headers=headers,
+        )
+        assert empty.status_code == 200
+        assert empty.text.strip() == ",".join(
+            ["id", "product_id", "direction", "quantity", "reason", "reference", "occurred_at", "created_at"]
+        )
+
+
+class _CommittedLevelCache(MemoryCacheService):
+    """Records the stock level other sessions can see whenever entries are dropped."""
+
+    def __init__(self, product_id: str) -> None:
+        super().__init__()
+        self.product_id = product_id
+        self.levels_at_drop: list[int] = []
+
+    async def delete_many(self, keys):
+        async with async_session_factory() as session:
+            levels = await SqlAlchemyInventoryMovementRepository(session).get_stock_levels([self.product_id])
+        self.levels_at_drop.append(levels.get(self.product_id, 0))
+        await super().delete_many(keys)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path",
+    ["/api/v1/products/{id}/inventory/movements", "/api/v1/inventory/products/{id}/movements"],
+)
+async def test_movement_drops_cached_stock_only_after_commit(async_session, monkeypatch, path):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        inventory_token = await _register_and_login(async_session, client, f"inventory_{uuid4().hex[:6]}@example.com")
+        product = await _create_product(async_session, client)
+        headers = {"Authorization": f"Bearer {inventory_token}"}
+        url = path.format(id=product["id"])
+        cache = _CommittedLevelCache(product["id"])
+        key = StockLevelCache.key(product["id"])
+        await cache.set(key, 0)
+        app.dependency_overrides[get_cache_service] = lambda: cache
+        try:
+            resp = await client.post(url, json={"quantity": 5, "direction": "in", "reason": "count"}, headers=headers)
+            assert resp.status_code == 201, resp.text
+            # Dropped once the movement was visible to other sessions, so no reader can refill the old level.
+            assert cache.levels_at_drop == [5]
+            assert await cache.get(key) is None
+
+            await cache.set(key, 5)
+            execute = RecordInventoryMovementUseCase.execute
+
+            async def execute_then_fail(self, data):
+                await execute(self, data)
+                raise ConflictError("simulated failure after the movement was written")
+
+            monkeypatch.setattr(RecordInventoryMovementUseCase, "execute", execute_then_fail)
+            failed = await client.post(
+                url, json={"quantity": 2, "direction": "out", "reason": "count"}, headers=headers
+            )
+            assert failed.status_code == 409, failed.text
+            # The rolled-back movement leaves the (still correct) cached level alone.
+            assert cache.levels_at_drop == [5]
+            assert await cache.get(key) == 5
+        finally:
+            app.dependency_overrides.pop(get_cache_service, None)
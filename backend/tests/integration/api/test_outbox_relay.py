@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.domain.common.identifiers import new_ulid
+from app.domain.sales.events import SaleRecordedEvent
+from app.infrastructure.db.models.outbox_model import OUTBOX_FAILED, OutboxEventModel
+from app.infrastructure.db.repositories.outbox_repository import SqlAlchemyOutboxRepository
+from app.infrastructure.db.session import async_session_factory
+from app.infrastructure.events.in_memory import InMemoryEventDispatcher
+from app.infrastructure.events.outbox_relay import OutboxRelay
+
+
+def _event(aggregate_id: str, total: str) -> SaleRecordedEvent:
+    return SaleRecordedEvent(aggregate_id=aggregate_id, total_amount=total, currency="USD", customer_id=None)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime.now(UTC) + timedelta(seconds=1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _drain(relay: OutboxRelay) -> None:
+    while await relay.relay_once():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_failed_event_is_retried_with_backoff_and_holds_back_its_aggregate(async_session):
+    aggregate_id = new_ulid()
+    outbox = SqlAlchemyOutboxRepository(async_session)
+    await outbox.add([_event(aggregate_id, "1.00"), _event(aggregate_id, "2.00")])
+    await async_session.commit()
+
+    delivered: list[str] = []
+    calls = 0
+
+    async def handler(event):
+        nonlocal calls
+        if event.aggregate_id != aggregate_id:
+            return
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("projection unavailable")
+        delivered.append(event.total_amount)
+
+    dispatcher = InMemoryEventDispatcher()
+    dispatcher.subscribe(SaleRecordedEvent, handler)
+    clock = _Clock()
+    relay = OutboxRelay(async_session_factory, dispatcher, batch_size=500, retry_base=30.0, clock=clock)
+
+    await _drain(relay)
+    assert delivered == []  # the second event waits behind the first one's backoff
+
+    clock.now += timedelta(seconds=31)
+    await _drain(relay)
+    assert delivered == ["1.00", "2.00"]
+
+
+@pytest.mark.asyncio
+async def test_event_is_parked_as_failed_after_max_attempts(async_session):
+    aggregate_id = new_ulid()
+    await SqlAlchemyOutboxRepository(async_session).add([_event(aggregate_id, "1.00")])
+    await async_session.commit()
+
+    async def handler(event):
+        if event.aggregate_id == aggregate_id:
+            raise RuntimeError("boom")
+
+    dispatcher = InMemoryEventDispatcher()
+    dispatcher.subscribe(SaleRecordedEvent, handler)
+    clock = _Clock()
+    relay = OutboxRelay(async_session_factory, dispatcher, batch_size=500, max_attempts=2, retry_base=1.0, clock=clock)
+    await _drain(relay)
+    clock.now += timedelta(seconds=2)
+    await _drain(relay)
+
+    async with async_session_factory() as session:
+        row = (
+            await session.execute(select(OutboxEventModel).where(OutboxEventModel.aggregate_id == aggregate_id))
+        ).scalar_one()
+    assert (row.status, row.attempts, row.last_error) == (OUTBOX_FAILED, 2, "RuntimeError: boom")
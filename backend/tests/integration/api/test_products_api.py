@@ -183,3 +183,42 @@ async def test_deactivate_product_already_inactive(async_session):
         payload = second.json()
         assert payload["code"] == "validation_error"
         assert payload["trace_id"] == second.headers.get("X-Trace-Id")
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_products_reports_row_errors(async_session):
+    unique_email = f"user_{uuid4().hex[:6]}@example.com"
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        token = await _register_and_login(async_session, client, unique_email)
+        first = await _create_product(client, token)
+        second = await _create_product(client, token)
+        third = await _create_product(client, token)
+
+        resp = await client.post(
+            "/api/v1/products/bulk-update",
+            json={
+                "items": [
+                    {"id": first["id"], "expected_version": first["version"], "retail_price": "15.00"},
+                    {"id": second["id"], "expected_version": second["version"] + 1, "retail_price": "15.00"},
+                    {"id": third["id"], "expected_version": third["version"], "retail_price": "10.00"},
+                    {"id": "01MISSINGPRODUCT0000000000", "expected_version": 0, "name": "Ghost"},
+                ]
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 200, resp.text
+        payload = resp.json()
+        assert [p["id"] for p in payload["updated"]] == [first["id"]]
+        assert payload["updated"][0]["retail_price"] == "15.00"
+        assert payload["updated"][0]["version"] == first["version"] + 1
+        assert payload["unchanged"] == [third["id"]]
+        errors = {error["product_id"]: error["code"] for error in payload["errors"]}
+        assert errors == {second["id"]: "conflict", "01MISSINGPRODUCT0000000000": "not_found"}
+
+        stale = await client.patch(
+            f"/api/v1/products/{first['id']}",
+            json={"expected_version": first["version"], "name": "Stale"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert stale.status_code == 409
@@ -173,3 +173,37 @@ async def test_list_products_sort_by_name(async_session):
         data = resp.json()
         names = [item["name"] for item in data["items"]]
         assert names == sorted(names, key=str.lower)
+
+
+@pytest.mark.asyncio
+async def test_list_products_sort_by_updated_at(async_session):
+    await ensure_seed()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        token = await create_user_and_login(
+            async_session,
+            client,
+            f"mgr_sort_{uuid4().hex[:6]}@example.com",
+            "Secretp@ss1",
+            UserRole.MANAGER,
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        oldest, version = (
+            await async_session.execute(
+                select(ProductModel.id, ProductModel.version).order_by(ProductModel.created_at).limit(1)
+            )
+        ).one()
+        updated = await client.patch(
+            f"/api/v1/products/{oldest}",
+            json={"expected_version": version, "name": "Recently Touched"},
+            headers=headers,
+        )
+        assert updated.status_code == 200, updated.text
+
+        resp = await client.get(
+            "/api/v1/products",
+            params={"limit": 1, "sort_by": "updated_at", "sort_direction": "desc"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert [item["id"] for item in resp.json()["items"]] == [oldest]
@@ -263,6 +263,19 @@ async def test_list_purchases_supports_supplier_filter(async_session):
         filtered = filter_resp.json()
         assert filtered["meta"]["total"] == 1
         assert filtered["items"][0]["id"] == order_a["purchase"]["id"]
+        assert filtered["items"][0]["total_amount"] == "12.00"
+        assert filtered["items"][0]["items"] == []
+
+        detailed_resp = await client.get(
+            "/api/v1/purchases",
+            params={"supplier_id": supplier_a["id"], "include": "items"},
+            headers={"Authorization": f"Bearer {purchasing_token}"},
+        )
+        assert detailed_resp.status_code == 200, detailed_resp.text
+        lines = detailed_resp.json()["items"][0]["items"]
+        assert len(lines) == 1
+        assert lines[0]["product_id"] == product["id"]
+        assert lines[0]["line_total"] == "12.00"
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import shutil
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.api.main import app
+from app.core.metrics import metrics
+from app.core.settings import get_settings
+from app.domain.auth.entities import UserRole
+from app.infrastructure.db import session as db_session
+from tests.integration.api.helpers import login_as
+
+
+@pytest.mark.asyncio
+async def test_reads_use_a_lagging_replica_unless_the_caller_just_wrote(async_session, monkeypatch, tmp_path):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        headers = {"Authorization": f"Bearer {await login_as(async_session, ac, UserRole.MANAGER)}"}
+
+        # The replica is a snapshot of the primary taken now and never replayed: maximal lag.
+        replica_path = tmp_path / "replica.db"
+        shutil.copyfile(make_url(get_settings().DATABASE_URL).database, replica_path)
+        replica_engine = create_async_engine(f"sqlite+aiosqlite:///{replica_path}")
+        monkeypatch.setattr(db_session, "replica_engine", replica_engine)
+
+        created = await ac.post(
+            "/api/v1/customers",
+            json={"first_name": "Lag", "last_name": "Test", "email": f"{uuid4().hex[:8]}@example.com"},
+            headers=headers,
+        )
+        assert created.status_code == 201, created.text
+        token = created.headers["X-Consistency-Token"]
+        customer_id = created.json()["id"]
+
+        stale = await ac.get(f"/api/v1/customers/{customer_id}", headers=headers)
+        assert stale.status_code == 404
+
+        fresh = await ac.get(
+            f"/api/v1/customers/{customer_id}", headers={**headers, "X-Consistency-Token": token}
+        )
+        assert fresh.status_code == 200, fresh.text
+        assert "X-Consistency-Token" not in fresh.headers
+
+        # Once the assumed lag has passed, the same token is served by the replica again.
+        monkeypatch.setattr(db_session._settings, "DATABASE_REPLICA_MAX_LAG_SECONDS", 0.0)
+        replayed = await ac.get(
+            f"/api/v1/customers/{customer_id}", headers={**headers, "X-Consistency-Token": token}
+        )
+        assert replayed.status_code == 404
+
+    await replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_cached_reads_never_check_out_a_connection(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        headers = {"Authorization": f"Bearer {await login_as(async_session, ac, UserRole.MANAGER)}"}
+        params = {"search": uuid4().hex}
+        warm = await ac.get("/api/v1/categories", params=params, headers=headers)
+        assert warm.status_code == 200, warm.text
+
+        checkouts = metrics.counter("db.pool.checkouts")
+        cached = await ac.get("/api/v1/categories", params=params, headers=headers)
+        assert cached.status_code == 200
+        assert cached.json() == warm.json()
+        assert metrics.counter("db.pool.checkouts") == checkouts
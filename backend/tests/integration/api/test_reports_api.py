@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+import string
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+
+from app.api.main import app
+from app.domain.auth.entities import UserRole
+from app.infrastructure.db.models.sales_rollup_model import SalesHourlyRollupModel
+from app.infrastructure.db.queries.sales_report_query_service import SqlAlchemySalesReportQueryService
+from app.infrastructure.db.repositories import sales_rollup_repository as rollup_repository
+from app.infrastructure.db.repositories.sales_rollup_repository import RollupLine, SqlAlchemySalesRollupRepository
+from tests.integration.api.helpers import login_as
+
+
+async def _create_product(client: AsyncClient, token: str) -> dict:
+    resp = await client.post(
+        "/api/v1/products",
+        json={
+            "name": "Report Prod",
+            "sku": f"SKU{uuid4().hex[:8]}",
+            "retail_price": "10.00",
+            "purchase_price": "5.00",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 201, resp.text
+    product = resp.json()
+    stock = await client.post(
+        f"/api/v1/products/{product['id']}/inventory/movements",
+        json={"quantity": 20, "direction": "in", "reason": "initial_stock"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert stock.status_code == 201, stock.text
+    return product
+
+
+async def _record_sale(client: AsyncClient, token: str, product_id: str, quantity: int) -> dict:
+    resp = await client.post(
+        "/api/v1/sales",
+        json={
+            "currency": "USD",
+            "lines": [{"product_id": product_id, "quantity": quantity, "unit_price": "12.50"}],
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()["sale"]
+
+
+async def _daily_for_product(client: AsyncClient, token: str, product_id: str) -> dict:
+    today = datetime.now(UTC).date().isoformat()
+    resp = await client.get(
+        "/api/v1/reports/sales/daily",
+        params={"date_from": today, "date_to": today, "product_id": product_id},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert resp.status_code == 200, resp.text
+    items = resp.json()["items"]
+    assert len(items) == 1
+    return items[0]
+
+
+@pytest.mark.asyncio
+async def test_daily_sales_report_reflects_sales_and_returns(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        cashier = await login_as(async_session, client, UserRole.CASHIER)
+        manager = await login_as(async_session, client, UserRole.MANAGER)
+        product = await _create_product(client, manager)
+
+        await _record_sale(client, cashier, product["id"], 2)
+        sale = await _record_sale(client, cashier, product["id"], 3)
+        returned = await client.post(
+            "/api/v1/returns",
+            json={"sale_id": sale["id"], "lines": [{"sale_item_id": sale["items"][0]["id"], "quantity": 1}]},
+            headers={"Authorization": f"Bearer {cashier}"},
+        )
+        assert returned.status_code == 201, returned.text
+
+        row = await _daily_for_product(client, manager, product["id"])
+        assert row["sales_count"] == 2
+        assert row["quantity"] == 5
+        assert row["revenue"] == "62.50"
+        assert row["returned_quantity"] == 1
+        assert row["returned_amount"] == "12.50"
+        assert row["net_revenue"] == "50.00"
+
+        await SqlAlchemySalesRollupRepository(async_session).rebuild()
+        await async_session.commit()
+        assert await _daily_for_product(client, manager, product["id"]) == row
+
+
+@pytest.mark.asyncio
+async def test_daily_sales_report_validates_range(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        manager = await login_as(async_session, client, UserRole.MANAGER)
+        cashier = await login_as(async_session, client, UserRole.CASHIER)
+
+        inverted = await client.get(
+            "/api/v1/reports/sales/daily",
+            params={"date_from": "2025-02-01", "date_to": "2025-01-01"},
+            headers={"Authorization": f"Bearer {manager}"},
+        )
+        assert inverted.status_code == 400
+
+        forbidden = await client.get(
+            "/api/v1/reports/sales/daily",
+            params={"date_from": "2025-01-01", "date_to": "2025-01-31"},
+            headers={"Authorization": f"Bearer {cashier}"},
+        )
+        assert forbidden.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_hourly_rollup_is_spread_over_slots_and_summed_on_read(async_session, monkeypatch):
+    currency = "Q" + "".join(random.choices(string.ascii_uppercase, k=2))
+    moment = datetime(2024, 3, 5, 10, 30, tzinfo=UTC)
+    slots = iter(range(3))
+    monkeypatch.setattr(rollup_repository.random, "randrange", lambda _: next(slots))
+
+    repo = SqlAlchemySalesRollupRepository(async_session)
+    for _ in range(3):
+        line = RollupLine(product_id=uuid4().hex[:26], quantity=2, amount=Decimal("5.00"))
+        await repo.record_sale(created_at=moment, currency=currency, customer_id=None, lines=[line])
+    await async_session.commit()
+
+    rows = await async_session.execute(
+        select(SalesHourlyRollupModel.slot).where(SalesHourlyRollupModel.currency == currency)
+    )
+    assert sorted(rows.scalars()) == [0, 1, 2]
+    [daily] = [
+        row
+        for row in await SqlAlchemySalesReportQueryService(async_session).daily_sales(
+            date_from=moment.date(), date_to=moment.date()
+        )
+        if row.currency == currency
+    ]
+    assert (daily.sales_count, daily.quantity, daily.revenue) == (3, 6, Decimal("15.00"))
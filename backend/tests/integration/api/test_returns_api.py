@@ -7,6 +7,7 @@ from httpx import ASGITransport, AsyncClient
 
 from app.api.main import app
 from app.domain.auth.entities import UserRole
+from app.infrastructure.db.repositories.returns_repository import SqlAlchemyReturnsRepository
 from tests.integration.api.helpers import login_as
 
 
@@ -166,6 +167,36 @@ async def test_record_return_cannot_exceed_remaining_quantity(async_session):
         assert payload["code"] == "validation_error"
 
 
+@pytest.mark.asyncio
+async def test_claim_returned_quantities_is_conditional(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        returns_token, manager_token = await _login_returns_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], quantity=5)
+        sale = await _record_sale(client, returns_token, product_id=product["id"], quantity=2)
+        sale_item_id = sale["items"][0]["id"]
+
+        repo = SqlAlchemyReturnsRepository(async_session)
+        assert await repo.claim_returned_quantities(sale["id"], {sale_item_id: 2}) == set()
+        assert await repo.claim_returned_quantities(sale["id"], {sale_item_id: 1}) == {sale_item_id}
+        await async_session.commit()
+
+        detail = await client.get(
+            f"/api/v1/sales/{sale['id']}",
+            headers={"Authorization": f"Bearer {returns_token}"},
+        )
+        assert detail.status_code == 200, detail.text
+        assert detail.json()["items"][0]["returned_quantity"] == 2
+
+        rejected = await client.post(
+            "/api/v1/returns",
+            json={"sale_id": sale["id"], "lines": [{"sale_item_id": sale_item_id, "quantity": 1}]},
+            headers={"Authorization": f"Bearer {returns_token}"},
+        )
+        assert rejected.status_code == 400, rejected.text
+
+
 @pytest.mark.asyncio
 async def test_record_return_unknown_sale_returns_404(async_session):
     transport = ASGITransport(app=app)
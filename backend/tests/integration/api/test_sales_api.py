@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import csv
+import io
+import json
 from datetime import UTC, datetime
+from decimal import Decimal
 from uuid import uuid4
 
 import pytest
@@ -8,6 +13,7 @@ from httpx import ASGITransport, AsyncClient
 
 from app.api.main import app
 from app.domain.auth.entities import UserRole
+from app.domain.common.identifiers import new_ulid
 from tests.integration.api.helpers import login_as
 
 
@@ -367,6 +373,26 @@ async def test_list_sales_supports_filters(async_session):
         filtered = filter_resp.json()
         assert filtered["meta"]["total"] >= 1
         assert all(item["customer_id"] == customer["id"] for item in filtered["items"])
+        assert all(item["items"] == [] for item in filtered["items"])
+
+        detailed_resp = await client.get(
+            "/api/v1/sales",
+            params={"customer_id": customer["id"], "include": "items"},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert detailed_resp.status_code == 200, detailed_resp.text
+        detailed = {item["id"]: item for item in detailed_resp.json()["items"]}
+        lines = detailed[sale_with_customer["id"]]["items"]
+        assert len(lines) == 1
+        assert lines[0]["quantity"] == 3
+        assert lines[0]["line_total"] == "42.00"
+
+        invalid_resp = await client.get(
+            "/api/v1/sales",
+            params={"include": "payments"},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert invalid_resp.status_code == 422
 
 
 @pytest.mark.asyncio
@@ -394,4 +420,225 @@ async def test_get_sale_returns_detail(async_session):
         assert detail["id"] == sale["id"]
         assert detail["total_amount"] == sale["total_amount"]
         assert len(detail["items"]) == 1
-        assert detail["items"][0]["product_id"] == product["id"]
\ No newline at end of file
+        assert detail["items"][0]["product_id"] == product["id"]
+
+@pytest.mark.asyncio
+async def test_export_sales_streams_csv_and_ndjson(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token, manager_token = await _login_sales_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], 5)
+        customer = await _create_customer(client, manager_token)
+        first = await _record_sale(
+            client, sales_token, product_id=product["id"], quantity=1, unit_price="10.00", customer_id=customer["id"]
+        )
+        second = await _record_sale(
+            client, sales_token, product_id=product["id"], quantity=2, unit_price="10.00", customer_id=customer["id"]
+        )
+        headers = {"Authorization": f"Bearer {manager_token}"}
+
+        csv_resp = await client.get("/api/v1/sales/export", params={"customer_id": customer["id"]}, headers=headers)
+        assert csv_resp.status_code == 200, csv_resp.text
+        assert csv_resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="sales.csv"' in csv_resp.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(csv_resp.text)))
+        assert [row["id"] for row in rows] == [first["id"], second["id"]]
+        assert rows[1]["total_quantity"] == "2"
+        assert rows[1]["total_amount"] == "20.00"
+
+        ndjson_resp = await client.get(
+            "/api/v1/sales/export",
+            params={"customer_id": customer["id"], "format": "ndjson"},
+            headers=headers,
+        )
+        assert ndjson_resp.status_code == 200, ndjson_resp.text
+        assert ndjson_resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in ndjson_resp.text.splitlines()]
+        assert [line["id"] for line in lines] == [first["id"], second["id"]]
+        assert lines[0]["customer_id"] == customer["id"]
+
+        bad_range = await client.get(
+            "/api/v1/sales/export",
+            params={"date_from": "2025-02-01T00:00:00Z", "date_to": "2025-01-01T00:00:00Z"},
+            headers=headers,
+        )
+        assert bad_range.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_record_sales_batch_is_idempotent_and_reports_each_sale(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token, manager_token = await _login_sales_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], quantity=5)
+
+        def _sale(quantity: int, **extra) -> dict:
+            return {
+                "id": new_ulid(),
+                "currency": "USD",
+                "lines": [{"product_id": product["id"], "quantity": quantity, "unit_price": "10.00"}],
+                **extra,
+            }
+
+        offline_at = "2025-01-02T09:30:00+00:00"
+        first, second, oversold = _sale(2, occurred_at=offline_at), _sale(3), _sale(1)
+        unknown = {
+            **_sale(1),
+            "lines": [{"product_id": "01HZZUNKNOWNPRODUCT0000000", "quantity": 1, "unit_price": "1.00"}],
+        }
+        batch = {"sales": [first, second, first, oversold, unknown]}
+
+        resp = await client.post(
+            "/api/v1/sales/batch",
+            json=batch,
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert resp.status_code == 200, resp.text
+        payload = resp.json()
+        assert [result["status"] for result in payload["results"]] == [
+            "recorded",
+            "recorded",
+            "duplicate",
+            "rejected",
+            "rejected",
+        ]
+        assert (payload["recorded"], payload["duplicates"], payload["rejected"]) == (2, 1, 2)
+        assert payload["results"][0]["sale"]["id"] == first["id"]
+        assert payload["results"][0]["sale"]["created_at"].startswith("2025-01-02T09:30:00")
+        assert "Insufficient stock" in payload["results"][3]["detail"]
+        assert payload["results"][4]["code"] == "not_found"
+
+        stock = await client.get(
+            f"/api/v1/products/{product['id']}/stock",
+            headers={"Authorization": f"Bearer {manager_token}"},
+        )
+        assert stock.json()["quantity_on_hand"] == 0
+
+        replay = await client.post(
+            "/api/v1/sales/batch",
+            json={"sales": [first, second]},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert replay.status_code == 200, replay.text
+        assert [result["status"] for result in replay.json()["results"]] == ["duplicate", "duplicate"]
+
+
+@pytest.mark.asyncio
+async def test_record_sales_batch_validates_payload(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token = await _register_and_login(async_session, client)
+        resp = await client.post(
+            "/api/v1/sales/batch",
+            json={"sales": [{"id": "not-a-ulid", "lines": [{"product_id": "x", "quantity": 1, "unit_price": "1"}]}]},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_recorded_sale_event_is_relayed_from_the_outbox_after_commit(async_session):
+    from app.domain.sales.events import SaleRecordedEvent
+    from app.infrastructure.db.session import async_session_factory
+    from app.infrastructure.events.in_memory import InMemoryEventDispatcher
+    from app.infrastructure.events.outbox_relay import OutboxRelay
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token, manager_token = await _login_sales_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], quantity=5)
+        sale = await _record_sale(client, sales_token, product_id=product["id"], quantity=2, unit_price="15.00")
+
+    received: list[SaleRecordedEvent] = []
+
+    async def on_sale(event):
+        received.append(event)
+
+    dispatcher = InMemoryEventDispatcher()
+    dispatcher.subscribe(SaleRecordedEvent, on_sale)
+    relay = OutboxRelay(async_session_factory, dispatcher, batch_size=500)
+    while await relay.relay_once():
+        pass
+
+    [event] = [event for event in received if event.aggregate_id == sale["id"]]
+    assert (event.total_amount, event.currency, event.customer_id) == ("30.00", "USD", None)
+    assert await relay.relay_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_replays_of_a_batch_record_each_sale_once(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token, manager_token = await _login_sales_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], quantity=5)
+        batch = {
+            "sales": [
+                {
+                    "id": new_ulid(),
+                    "currency": "USD",
+                    "lines": [{"product_id": product["id"], "quantity": 2, "unit_price": "10.00"}],
+                }
+            ]
+        }
+        headers = {"Authorization": f"Bearer {sales_token}"}
+
+        # A till that timed out re-sends the batch while the first upload is still in flight.
+        responses = await asyncio.gather(
+            client.post("/api/v1/sales/batch", json=batch, headers=headers),
+            client.post("/api/v1/sales/batch", json=batch, headers=headers),
+        )
+        assert [resp.status_code for resp in responses] == [200, 200], [resp.text for resp in responses]
+        statuses = sorted(resp.json()["results"][0]["status"] for resp in responses)
+        assert statuses == ["duplicate", "recorded"]
+
+
+@pytest.mark.asyncio
+async def test_batch_replay_that_loses_the_insert_race_is_retried_as_duplicate(async_session):
+    from app.application.sales.use_cases.record_sale import RecordSaleInput, RecordSaleUseCase, SaleLineInput
+    from app.infrastructure.db.repositories.inventory_movement_repository import (
+        SqlAlchemyInventoryMovementRepository,
+    )
+    from app.infrastructure.db.repositories.inventory_repository import SqlAlchemyProductRepository
+    from app.infrastructure.db.repositories.sales_repository import SqlAlchemySalesRepository
+    from app.infrastructure.db.retry import run_transaction
+    from app.infrastructure.db.session import async_session_factory
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        sales_token, manager_token = await _login_sales_and_manager(async_session, client)
+        product = await _create_product(client, manager_token)
+        await _add_stock(client, manager_token, product["id"], quantity=5)
+        sale_id = new_ulid()
+        line = {"product_id": product["id"], "quantity": 2, "unit_price": "10.00"}
+        resp = await client.post(
+            "/api/v1/sales/batch",
+            json={"sales": [{"id": sale_id, "currency": "USD", "lines": [line]}]},
+            headers={"Authorization": f"Bearer {sales_token}"},
+        )
+        assert resp.json()["results"][0]["status"] == "recorded"
+
+    class _StaleOnceSalesRepository(SqlAlchemySalesRepository):
+        """Answers the first duplicate check as if the original upload had not committed yet."""
+
+        stale = True
+
+        async def existing_ids(self, sale_ids):
+            if self.stale:
+                self.stale = False
+                return set()
+            return await super().existing_ids(sale_ids)
+
+    async with async_session_factory() as session:
+        use_case = RecordSaleUseCase(
+            SqlAlchemyProductRepository(session),
+            _StaleOnceSalesRepository(session),
+            SqlAlchemyInventoryMovementRepository(session),
+        )
+        replay = [RecordSaleInput(sale_id=sale_id, lines=[SaleLineInput(product["id"], 2, Decimal("10.00"))])]
+        result = await run_transaction(session, lambda: use_case.execute_batch(replay), operation="test_sale_batch")
+
+    assert [outcome.status for outcome in result.outcomes] == ["duplicate"]
@@ -159,6 +159,8 @@ async def test_get_supplier_summary_returns_aggregates(async_session):
         assert summary["total_amount"] == format(total_amount, "0.2f")
         assert summary["average_order_value"] == format(total_amount / Decimal(2), "0.2f")
         assert summary["average_lead_time_hours"] == "7.00"
+        assert summary["p50_lead_time_hours"] == "4.50"
+        assert summary["p90_lead_time_hours"] == "9.50"
         assert summary["first_order_at"] is not None
         assert summary["last_order_at"] is not None
         assert summary["last_order_id"] == second_order["purchase"]["id"]
@@ -194,3 +196,55 @@ async def test_get_supplier_summary_handles_no_orders(async_session):
         assert summary["last_order_id"] is None
         assert summary["last_order_amount"] is None
         assert summary["open_orders"] == 0
+
+
+@pytest.mark.asyncio
+async def test_list_supplier_summaries_batches_lead_times(async_session):
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        manager_token = await _login_user(async_session, client, role=UserRole.MANAGER)
+        purchasing_token = await _login_user(async_session, client, role=UserRole.INVENTORY)
+        marker = uuid4().hex[:8]
+        busy = await _create_supplier(client, manager_token, name=f"Busy {marker}")
+        idle = await _create_supplier(client, manager_token, name=f"Idle {marker}")
+        product = await _create_product(client, manager_token)
+
+        lead_hours = [1, 2, 3, 4, 10]
+        for hours in lead_hours:
+            order = await _record_purchase(
+                client,
+                purchasing_token,
+                supplier_id=busy["id"],
+                product_id=product["id"],
+                quantity=1,
+                unit_cost="2.00",
+            )
+            created = datetime.fromisoformat(order["purchase"]["created_at"])
+            await async_session.execute(
+                update(PurchaseOrderModel)
+                .where(PurchaseOrderModel.id == order["purchase"]["id"])
+                .values(received_at=created + timedelta(hours=hours))
+            )
+            await async_session.commit()
+
+        resp = await client.get(
+            "/api/v1/suppliers/summaries",
+            params={"search": marker},
+            headers={"Authorization": f"Bearer {purchasing_token}"},
+        )
+        assert resp.status_code == 200, resp.text
+        payload = resp.json()
+        assert payload["meta"]["total"] == 2
+        by_id = {item["supplier_id"]: item for item in payload["items"]}
+
+        busy_summary = by_id[busy["id"]]
+        assert busy_summary["name"] == f"Busy {marker}"
+        assert busy_summary["total_orders"] == 5
+        assert busy_summary["total_amount"] == "10.00"
+        assert busy_summary["average_lead_time_hours"] == "4.00"
+        assert busy_summary["p50_lead_time_hours"] == "3.00"
+        assert busy_summary["p90_lead_time_hours"] == "10.00"
+
+        idle_summary = by_id[idle["id"]]
+        assert idle_summary["total_orders"] == 0
+        assert idle_summary["p50_lead_time_hours"] is None
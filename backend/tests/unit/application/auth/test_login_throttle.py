@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+
+from app.application.auth.services.login_throttle import LoginThrottle, LoginThrottlePolicy
+from app.infrastructure.cache.sliding_window_store import MemorySlidingWindowStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _throttle(clock: FakeClock, events: list[str] | None = None) -> LoginThrottle:
+    policy = LoginThrottlePolicy(
+        max_failures_per_email=3,
+        max_failures_per_client=5,
+        window_seconds=60,
+        lockout_base_seconds=10,
+        lockout_max_seconds=25,
+    )
+    return LoginThrottle(
+        MemorySlidingWindowStore(), policy, clock=clock, on_event=events.append if events is not None else None
+    )
+
+
+@pytest.mark.asyncio
+async def test_email_locks_after_limit_and_lockout_doubles_up_to_max():
+    clock = FakeClock()
+    events: list[str] = []
+    throttle = _throttle(clock, events)
+
+    for _ in range(2):
+        await throttle.record_failure(email="a@example.com", client=None)
+    assert await throttle.retry_after(email="a@example.com", client=None) is None
+
+    await throttle.record_failure(email="A@example.com ", client=None)
+    assert await throttle.retry_after(email="a@example.com", client=None) == 10
+
+    clock.now += 10
+    assert await throttle.retry_after(email="a@example.com", client=None) is None
+    await throttle.record_failure(email="a@example.com", client=None)
+    assert await throttle.retry_after(email="a@example.com", client=None) == 20
+
+    clock.now += 20
+    await throttle.record_failure(email="a@example.com", client=None)
+    assert await throttle.retry_after(email="a@example.com", client=None) == 25
+    assert events.count("lockout") == 3
+    assert events.count("throttled") == 3
+
+
+@pytest.mark.asyncio
+async def test_failures_outside_the_window_are_forgotten():
+    clock = FakeClock()
+    throttle = _throttle(clock)
+
+    for _ in range(2):
+        await throttle.record_failure(email="a@example.com", client=None)
+    clock.now += 61
+    await throttle.record_failure(email="a@example.com", client=None)
+
+    assert await throttle.retry_after(email="a@example.com", client=None) is None
+
+
+@pytest.mark.asyncio
+async def test_client_bucket_spans_emails_and_survives_success():
+    clock = FakeClock()
+    throttle = _throttle(clock)
+
+    for n in range(5):
+        await throttle.record_failure(email=f"user{n}@example.com", client="10.0.0.1")
+    await throttle.record_success(email="user0@example.com", client="10.0.0.1")
+
+    assert await throttle.retry_after(email="other@example.com", client="10.0.0.1") == 10
+    assert await throttle.retry_after(email="other@example.com", client="10.0.0.2") is None
+
+
+@pytest.mark.asyncio
+async def test_success_clears_the_email_bucket():
+    clock = FakeClock()
+    throttle = _throttle(clock)
+
+    for _ in range(2):
+        await throttle.record_failure(email="a@example.com", client=None)
+    await throttle.record_success(email="a@example.com", client=None)
+    await throttle.record_failure(email="a@example.com", client=None)
+
+    assert await throttle.retry_after(email="a@example.com", client=None) is None
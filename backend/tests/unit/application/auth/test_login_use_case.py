@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.application.auth.use_cases.login import LoginInput, LoginUseCase
+from app.domain.auth.entities import RefreshToken, User, UserRole
+from app.domain.common.errors import UnauthorizedError
+
+
+class UpgradingHasher:
+    """Treats `legacy::` hashes as valid but outdated."""
+
+    async def hash(self, raw: str) -> str:
+        return f"current::{raw}"
+
+    async def verify(self, raw: str, hashed: str) -> bool:
+        return hashed.split("::", 1)[1] == raw
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return hashed.startswith("legacy::")
+
+
+class InMemoryUsers:
+    def __init__(self, user: User) -> None:
+        self.user = user
+        self.updates: list[int] = []
+
+    async def get_by_email(self, email: str) -> User | None:
+        return self.user if email == self.user.email else None
+
+    async def update(self, user: User, expected_version: int) -> bool:
+        self.updates.append(expected_version)
+        self.user = user
+        return True
+
+
+class StubTokens:
+    def create_access_token(self, subject: str, extra: dict | None = None) -> str:
+        return f"access-{subject}"
+
+    def create_refresh_token_with_id(self, subject: str, token_id: str | None = None):
+        return f"refresh-{subject}", "RID", datetime.now(UTC) + timedelta(days=1)
+
+
+class RefreshTokens:
+    def __init__(self) -> None:
+        self.added: list[RefreshToken] = []
+
+    async def add(self, token: RefreshToken) -> None:
+        self.added.append(token)
+
+
+def _user(password_hash: str) -> User:
+    now = datetime.now(UTC)
+    return User(
+        id="U1",
+        email="cashier@example.com",
+        password_hash=password_hash,
+        role=UserRole.CASHIER,
+        active=True,
+        created_at=now,
+        updated_at=now,
+        version=3,
+    )
+
+
+def _use_case(users: InMemoryUsers) -> LoginUseCase:
+    return LoginUseCase(users, UpgradingHasher(), StubTokens(), RefreshTokens())  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_hash():
+    users = InMemoryUsers(_user("legacy::Secretp@ss1"))
+
+    result = await _use_case(users).execute(LoginInput(email="cashier@example.com", password="Secretp@ss1"))
+
+    assert result.access_token == "access-U1"
+    assert users.user.password_hash == "current::Secretp@ss1"
+    assert users.updates == [3]
+    assert users.user.version == 4
+
+
+@pytest.mark.asyncio
+async def test_login_keeps_current_hash_untouched():
+    users = InMemoryUsers(_user("current::Secretp@ss1"))
+
+    await _use_case(users).execute(LoginInput(email="cashier@example.com", password="Secretp@ss1"))
+
+    assert users.updates == []
+
+
+@pytest.mark.asyncio
+async def test_wrong_password_never_rehashes():
+    users = InMemoryUsers(_user("legacy::Secretp@ss1"))
+
+    with pytest.raises(UnauthorizedError):
+        await _use_case(users).execute(LoginInput(email="cashier@example.com", password="nope-nope"))
+    assert users.updates == []
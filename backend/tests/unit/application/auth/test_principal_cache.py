@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.application.auth.services.principal_cache import PrincipalCache
+from app.domain.auth.entities import User, UserRole
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user(user_id: str = "U1") -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=user_id,
+        email=f"{user_id.lower()}@example.com",
+        password_hash="x" * 20,
+        role=UserRole.CASHIER,
+        active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_entries_expire_after_ttl_and_count_hits():
+    clock = FakeClock()
+    cache = PrincipalCache(ttl=5, clock=clock)
+    cache.put(_user())
+
+    assert cache.get("U1") is not None
+    clock.now = 5.0
+    assert cache.get("U1") is None
+    assert (cache.hits, cache.misses, cache.hit_ratio) == (1, 1, 0.5)
+
+
+def test_callers_cannot_mutate_the_cached_entry():
+    cache = PrincipalCache(ttl=5)
+    cache.put(_user())
+
+    cache.get("U1").role = UserRole.ADMIN  # type: ignore[union-attr]
+
+    assert cache.get("U1").role == UserRole.CASHIER  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_locally_and_broadcasts():
+    published: list[str] = []
+
+    async def broadcast(user_id: str) -> None:
+        published.append(user_id)
+
+    cache = PrincipalCache(ttl=5)
+    cache.set_broadcaster(broadcast)
+    cache.put(_user())
+
+    await cache.invalidate("U1")
+
+    assert cache.get("U1") is None
+    assert published == ["U1"]
+
+
+def test_zero_ttl_disables_caching():
+    cache = PrincipalCache(ttl=0)
+    cache.put(_user())
+    assert cache.get("U1") is None
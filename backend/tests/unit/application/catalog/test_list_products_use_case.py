@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from app.application.catalog.ports import ProductListItem
+from app.application.catalog.use_cases.list_products import ListProductsInput, ListProductsUseCase
+from app.domain.common.errors import ValidationError
+
+
+class InMemoryProductQueryService:
+    def __init__(self, items: list[ProductListItem]):
+        self._items = items
+        self.calls: list[dict[str, object]] = []
+
+    async def list_products(self, **kwargs: object) -> tuple[list[ProductListItem], int]:
+        self.calls.append(kwargs)
+        offset = int(kwargs.get("offset", 0))  # type: ignore[arg-type]
+        limit = int(kwargs.get("limit", 20))  # type: ignore[arg-type]
+        return self._items[offset : offset + limit], len(self._items)
+
+
+def _item(index: int) -> ProductListItem:
+    return ProductListItem(
+        id=f"P{index}",
+        name=f"Product {index}",
+        sku=f"SKU{index}",
+        retail_price=Decimal("10.00"),
+        purchase_price=Decimal("5.00"),
+        category_id=None,
+        active=True,
+        version=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_returns_read_models_for_requested_page():
+    queries = InMemoryProductQueryService([_item(i) for i in range(5)])
+    use_case = ListProductsUseCase(queries)
+
+    result = await use_case.execute(ListProductsInput(page=2, limit=2, sort_by="name", sort_direction="asc"))
+
+    assert [item.id for item in result.products] == ["P2", "P3"]
+    assert result.total == 5
+    assert result.pages == 3
+    assert queries.calls[0]["offset"] == 2
+    assert queries.calls[0]["sort_by"] == "name"
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_unknown_sort_field():
+    use_case = ListProductsUseCase(InMemoryProductQueryService([]))
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(ListProductsInput(sort_by="stock"))
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import pytest
+
+from app.application.inventory.services.stock_cache import StockLevelCache
+from app.infrastructure.cache.memory_cache import MemoryCacheService
+
+
+class CountingInventoryRepository:
+    def __init__(self, levels: dict[str, int]):
+        self.levels = levels
+        self.calls: list[list[str]] = []
+
+    async def get_stock_levels(self, product_ids: Sequence[str]) -> dict[str, int]:
+        self.calls.append(list(product_ids))
+        return {pid: self.levels[pid] for pid in product_ids if pid in self.levels}
+
+
+@pytest.mark.asyncio
+async def test_get_levels_fetches_only_missing_products():
+    repo = CountingInventoryRepository({"P1": 5, "P2": 3})
+    stock = StockLevelCache(MemoryCacheService(), repo)  # type: ignore[arg-type]
+
+    assert await stock.get_levels(["P1", "P2", "P3"]) == {"P1": 5, "P2": 3, "P3": 0}
+    assert await stock.get_levels(["P1", "P2", "P3"]) == {"P1": 5, "P2": 3, "P3": 0}
+    assert repo.calls == [["P1", "P2", "P3"]]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_refreshes_only_touched_products():
+    repo = CountingInventoryRepository({"P1": 5, "P2": 3})
+    stock = StockLevelCache(MemoryCacheService(), repo)  # type: ignore[arg-type]
+    await stock.get_levels(["P1", "P2"])
+
+    repo.levels["P1"] = 4
+    await stock.invalidate(["P1", "P1"])
+
+    assert await stock.get_levels(["P1", "P2"]) == {"P1": 4, "P2": 3}
+    assert repo.calls[-1] == ["P1"]
@@ -62,14 +62,20 @@ class FakeUserRepository:
 
 
 class FakeHasher:
-    def hash(self, raw: str) -> str:
+    def hash_now(self, raw: str) -> str:
         if not raw or len(raw) < 6:
             raise ValidationError("password too short")
         return f"hashed::{raw}"
 
-    def verify(self, raw: str, hashed: str) -> bool:
+    async def hash(self, raw: str) -> str:
+        return self.hash_now(raw)
+
+    async def verify(self, raw: str, hashed: str) -> bool:
         return hashed == f"hashed::{raw}"
 
+    def needs_rehash(self, hashed: str) -> bool:
+        return False
+
 
 @pytest.mark.asyncio
 async def test_activate_user_reactivates_and_increments_version():
@@ -138,7 +144,7 @@ async def test_change_user_role_detects_version_conflict():
 @pytest.mark.asyncio
 async def test_reset_password_updates_hash_and_version():
     hasher = FakeHasher()
-    user = _make_user(password_hash=hasher.hash("CurrentPass1!"), version=5)
+    user = _make_user(password_hash=hasher.hash_now("CurrentPass1!"), version=5)
     repo = FakeUserRepository(user)
     use_case = ResetUserPasswordUseCase(repo, hasher)
 
@@ -150,16 +156,16 @@ async def test_reset_password_updates_hash_and_version():
         )
     )
 
-    assert hasher.verify("N3wSecretPass!", result.password_hash)
+    assert await hasher.verify("N3wSecretPass!", result.password_hash)
     assert result.version == user.version + 1
     stored = await repo.get_by_id(user.id)
-    assert stored is not None and hasher.verify("N3wSecretPass!", stored.password_hash)
+    assert stored is not None and await hasher.verify("N3wSecretPass!", stored.password_hash)
 
 
 @pytest.mark.asyncio
 async def test_reset_password_rejects_same_password():
     hasher = FakeHasher()
-    user = _make_user(password_hash=hasher.hash("SamePass1!"), version=1)
+    user = _make_user(password_hash=hasher.hash_now("SamePass1!"), version=1)
     repo = FakeUserRepository(user)
     use_case = ResetUserPasswordUseCase(repo, hasher)
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pickle
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from app.domain.common.errors import ValidationError
+from app.domain.common.money import Money
+from app.domain.sales import Sale, SaleItem
+
+CENT = Decimal("0.01")
+
+
+def _reference(value: Decimal) -> Decimal:
+    """Rounding the Decimal-backed Money applied: half-up to cents."""
+    return value.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def _random_amount(rng: random.Random) -> Decimal:
+    digits = rng.randint(0, 10**9)
+    return Decimal(digits).scaleb(-rng.randint(0, 6))
+
+
+def test_construction_matches_decimal_rounding():
+    rng = random.Random(20241019)
+    for _ in range(5000):
+        value = _random_amount(rng)
+        money = Money(value)
+        assert money.amount == _reference(value)
+        assert money.amount.as_tuple().exponent == -2
+        assert money.cents == int(_reference(value) * 100)
+
+
+def test_arithmetic_matches_decimal_semantics():
+    rng = random.Random(7)
+    for _ in range(2000):
+        a, b = _random_amount(rng), _random_amount(rng)
+        quantity = rng.randint(1, 500)
+        factor = Decimal(rng.randint(0, 10**4)).scaleb(-3)
+        left, right = Money(a), Money(b)
+
+        assert left.add(right).amount == _reference(_reference(a) + _reference(b))
+        assert left.multiply(quantity).amount == _reference(_reference(a) * quantity)
+        assert left.multiply(factor).amount == _reference(_reference(a) * factor)
+        if right <= left:
+            assert left.subtract(right).amount == _reference(a) - _reference(b)
+        else:
+            with pytest.raises(ValidationError):
+                left.subtract(right)
+        assert (left < right) == (_reference(a) < _reference(b))
+        assert (left == right) == (_reference(a) == _reference(b))
+
+
+def test_half_cent_rounds_up_and_negative_rejected():
+    assert Money(Decimal("0.005")).amount == Decimal("0.01")
+    assert Money(Decimal("2.675")).amount == Decimal("2.68")
+    assert Money(Decimal("-0.004")).amount == Decimal("0.00")
+    with pytest.raises(ValidationError):
+        Money(Decimal("-0.01"))
+    with pytest.raises(ValidationError):
+        Money(Decimal("1.00"), "USD").add(Money(Decimal("1.00"), "EUR"))
+
+
+def test_money_is_immutable_hashable_and_picklable():
+    money = Money(Decimal("12.50"), "EUR")
+    with pytest.raises(AttributeError):
+        money.currency = "USD"  # type: ignore[misc]
+    assert {money, Money(Decimal("12.5"), "EUR")} == {money}
+    assert pickle.loads(pickle.dumps(money)) == money
+
+
+def test_sale_totals_follow_item_changes():
+    sale = Sale.start("USD")
+    sale.add_line(product_id="p1", quantity=3, unit_price=Decimal("1.10"))
+    assert sale.total_amount.amount == Decimal("3.30")
+
+    sale.items.append(
+        SaleItem(
+            id="i2",
+            product_id="p2",
+            quantity=2,
+            unit_price=Money(Decimal("0.25")),
+            line_total=Money(Decimal("0.50")),
+        )
+    )
+    assert sale.total_amount.amount == Decimal("3.80")
+    assert sale.total_quantity == 5
+
+    # Same list, same length, different lines: nothing keyed on the list may serve stale totals.
+    sale.items[1] = SaleItem(
+        id="i3",
+        product_id="p3",
+        quantity=4,
+        unit_price=Money(Decimal("1.00")),
+        line_total=Money(Decimal("4.00")),
+    )
+    totals = sale.totals()
+    assert (totals.amount.amount, totals.quantity) == (Decimal("7.30"), 7)
+
+    sale.items = sale.items[:1]
+    assert sale.total_amount.amount == Decimal("3.30")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from app.core.settings import Settings
+from app.infrastructure.db.instrumentation import TimedQueuePool
+from app.infrastructure.db.session import engine_options
+
+
+def test_pool_settings_are_passed_to_the_engine():
+    settings = Settings(
+        DATABASE_URL="postgresql+asyncpg://pos@db/pos",
+        DB_POOL_SIZE=5,
+        DB_MAX_OVERFLOW=2,
+        DB_POOL_TIMEOUT_SECONDS=3,
+        DB_POOL_RECYCLE_SECONDS=600,
+        DB_STATEMENT_TIMEOUT_MS=1500,
+    )
+
+    options = engine_options(settings)
+
+    assert options["poolclass"] is TimedQueuePool
+    assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (5, 2, 3)
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"server_settings": {"statement_timeout": "1500"}}
+
+
+def test_statement_timeout_is_left_to_the_server_by_default_and_memory_sqlite_keeps_its_pool():
+    assert "connect_args" not in engine_options(Settings(DATABASE_URL="postgresql+asyncpg://pos@db/pos"))
+    assert "poolclass" not in engine_options(Settings(DATABASE_URL="sqlite+aiosqlite:///:memory:"))
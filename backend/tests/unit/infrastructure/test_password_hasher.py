@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core.metrics import metrics
+from app.infrastructure.auth import password_hasher
+from app.infrastructure.auth.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hashing_runs_on_the_worker_pool(monkeypatch):
+    threads: list[str] = []
+    real_context = password_hasher._pwd_context()
+
+    class RecordingContext:
+        def hash(self, raw: str) -> str:
+            threads.append(threading.current_thread().name)
+            return real_context.hash(raw)
+
+        def verify(self, raw: str, hashed: str) -> bool:
+            threads.append(threading.current_thread().name)
+            return real_context.verify(raw, hashed)
+
+    monkeypatch.setattr(password_hasher, "_pwd_context", lambda: RecordingContext())
+    before = metrics.snapshot()["timings"].get("auth.password_verify.queue_seconds", {}).get("count", 0)
+    hasher = PasswordHasher()
+
+    hashed = await hasher.hash("Secretp@ss1")
+    assert await hasher.verify("Secretp@ss1", hashed)
+    assert not await hasher.verify("wrong-password", hashed)
+
+    assert all(name.startswith("password-hash") for name in threads) and len(threads) == 3
+    assert metrics.snapshot()["timings"]["auth.password_verify.queue_seconds"]["count"] == before + 2
+
+
+def test_hashes_with_other_cost_parameters_need_rehash():
+    cheaper = CryptContext(schemes=["argon2"], argon2__rounds=1, argon2__memory_cost=1024, argon2__parallelism=1)
+    hasher = PasswordHasher()
+
+    assert hasher.needs_rehash(cheaper.hash("Secretp@ss1"))
+    assert not hasher.needs_rehash(password_hasher._pwd_context().hash("Secretp@ss1"))
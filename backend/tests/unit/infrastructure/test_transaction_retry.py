@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.metrics import metrics
+from app.domain.common.errors import ConcurrencyConflictError, ConflictError
+from app.infrastructure.db.retry import run_transaction
+
+
+class _Session:
+    def __init__(self) -> None:
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        self.rollbacks += 1
+
+
+@pytest.mark.asyncio
+async def test_lost_version_race_is_replayed_until_it_commits():
+    session = _Session()
+    calls = 0
+    retries_before = metrics.counter("db.transaction.retries.test_sale")
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ConcurrencyConflictError("Product p1 was modified concurrently")
+        return "recorded"
+
+    assert await run_transaction(session, work, operation="test_sale") == "recorded"  # type: ignore[arg-type]
+    assert (calls, session.rollbacks, session.commits) == (3, 2, 1)
+    assert metrics.counter("db.transaction.retries.test_sale") - retries_before == 2
+
+
+@pytest.mark.asyncio
+async def test_business_conflicts_fail_fast_and_exhausted_budgets_reraise():
+    session = _Session()
+
+    async def duplicate() -> None:
+        raise ConflictError("Sale already exists")
+
+    with pytest.raises(ConflictError):
+        await run_transaction(session, duplicate, operation="test_sale")  # type: ignore[arg-type]
+    assert session.rollbacks == 1
+
+    async def always_stale() -> None:
+        raise ConcurrencyConflictError("Product p1 was modified concurrently")
+
+    exhausted_before = metrics.counter("db.transaction.retries_exhausted.test_sale")
+    with pytest.raises(ConcurrencyConflictError):
+        await run_transaction(_Session(), always_stale, operation="test_sale")  # type: ignore[arg-type]
+    assert metrics.counter("db.transaction.retries_exhausted.test_sale") - exhausted_before == 1
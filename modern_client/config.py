@@ -7,5 +7,9 @@ class Settings:
     API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000/api/v1")
     APP_TITLE = "Retail POS - Modern"
     THEME_MODE = "dark"
+    LOCAL_DB_PATH = os.getenv("POS_LOCAL_DB_PATH", os.path.join(os.path.expanduser("~"), ".retail_pos", "till.db"))
+    SYNC_INTERVAL_SECONDS = float(os.getenv("POS_SYNC_INTERVAL_SECONDS", "15"))
+    SYNC_BATCH_SIZE = int(os.getenv("POS_SYNC_BATCH_SIZE", "100"))
+    CATALOG_FULL_REFRESH_SECONDS = float(os.getenv("POS_CATALOG_FULL_REFRESH_SECONDS", "600"))
 
 settings = Settings()
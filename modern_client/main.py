@@ -11,6 +11,7 @@ from views.users import UsersView
 from views.returns import ReturnsView
 from components.sidebar import Sidebar
 from services.api import api_service
+from services.sync import sync_service
 
 class ModernPOSApp:
     def __init__(self, page: ft.Page):
@@ -59,6 +60,9 @@ class ModernPOSApp:
             print(f"Error decoding token: {e}")
             self.user_role = "CASHIER"
 
+        # Queued offline sales and the catalog replica sync in the background from here on
+        sync_service.start()
+
         if self.user_role == "CASHIER":
             self.navigate("pos")
         else:
@@ -84,6 +88,7 @@ class ModernPOSApp:
             return
             
         if route == "logout":
+            sync_service.stop()
             self.token = None
             self.user_role = None
             self.current_route = None
@@ -2,12 +2,27 @@ import httpx
 import os
 from config import settings
 
+CONSISTENCY_HEADER = "X-Consistency-Token"
+
+
 class ApiService:
     def __init__(self):
         self.token = None
-        self.client = httpx.Client(base_url=settings.API_BASE_URL, timeout=10.0)
+        self.consistency_token = None
+        self.client = httpx.Client(
+            base_url=settings.API_BASE_URL,
+            timeout=10.0,
+            event_hooks={"response": [self._remember_consistency_token]},
+        )
         self.error_handler = None
 
+    def _remember_consistency_token(self, response):
+        # Echoed on later reads so a lagging read replica never hides this till's own writes.
+        token = response.headers.get(CONSISTENCY_HEADER)
+        if token:
+            self.consistency_token = token
+            self.client.headers[CONSISTENCY_HEADER] = token
+
     def set_error_handler(self, handler):
         self.error_handler = handler
 
@@ -46,44 +61,12 @@ class ApiService:
             self._handle_error("Fetch products failed", e)
             return []
 
-    def get_dashboard_stats(self):
+    def get_dashboard_stats(self, days=30):
         try:
-            stats = {
-                "total_sales": "$0.00",
-                "orders": "0",
-                "customers": "0",
-                "inventory": "0 Items",
-                "recent_sales": []
-            }
-            
-            # Get Inventory Count
-            resp_prod = self.client.get("/products", params={"limit": 1})
-            if resp_prod.status_code == 200:
-                data = resp_prod.json()
-                stats["inventory"] = f"{data.get('meta', {}).get('total', 0)} Items"
-
-            # Get Customers Count
-            resp_cust = self.client.get("/customers", params={"limit": 1})
-            if resp_cust.status_code == 200:
-                data = resp_cust.json()
-                stats["customers"] = str(data.get('meta', {}).get('total', 0))
-
-            # Get Sales/Orders Count and Estimate Total
-            resp_sales = self.client.get("/sales", params={"limit": 100}) # Fetch last 100 for sum
-            if resp_sales.status_code == 200:
-                data = resp_sales.json()
-                total_count = data.get('meta', {}).get('total', 0)
-                stats["orders"] = str(total_count)
-                
-                # Calculate sum from the fetched items (approximate if > 100)
-                items = data.get("items", [])
-                total_amount = sum(float(s.get("total_amount", 0)) for s in items)
-                stats["total_sales"] = f"${total_amount:,.2f}"
-                
-                # Recent Sales (Top 5)
-                stats["recent_sales"] = items[:5]
-
-            return stats
+            # One aggregated call; totals come from server-side rollups, not from summing a page of sales
+            response = self.client.get("/dashboard/summary", params={"days": days, "recent_limit": 5})
+            response.raise_for_status()
+            return dashboard_stats(response.json())
         except Exception as e:
             print(f"Error fetching dashboard stats: {e}")
             return None
@@ -192,6 +175,18 @@ class ApiService:
             self._handle_error("Create sale failed", e)
             return None
 
+    def sync_sales(self, sales):
+        # Used by the background sync thread: errors propagate so the queue keeps the batch for retry.
+        response = self.client.post("/sales/batch", json={"sales": sales})
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_page(self, path, page, limit=100, **params):
+        # Quiet paged read for replica refreshes; raises httpx.HTTPError instead of surfacing a snack bar.
+        response = self.client.get(path, params={"page": page, "limit": limit, **params})
+        response.raise_for_status()
+        return response.json()
+
     def get_sale(self, sale_id):
         try:
             response = self.client.get(f"/sales/{sale_id}")
@@ -339,4 +334,18 @@ class ApiService:
             self._handle_error("Reset password failed", e)
             return None
 
+def dashboard_stats(data):
+    totals = data.get("totals", [])
+    primary = next((t for t in totals if t.get("currency") == "USD"), totals[0] if totals else None)
+    net_revenue = float(primary["net_revenue"]) if primary else 0.0
+
+    return {
+        "total_sales": f"${net_revenue:,.2f}",
+        "orders": str(data.get("orders", 0)),
+        "customers": str(data.get("customer_count", 0)),
+        "inventory": f"{data.get('catalog_size', 0)} Items",
+        "recent_sales": data.get("recent_sales", []),
+    }
+
+
 api_service = ApiService()
@@ -0,0 +1,128 @@
+import asyncio
+import importlib.util
+import random
+import threading
+
+import httpx
+
+from config import settings
+from services.api import CONSISTENCY_HEADER, api_service, dashboard_stats
+
+_HTTP2 = importlib.util.find_spec("h2") is not None  # pip install "httpx[http2]" to enable
+_RETRY_STATUSES = {429, 502, 503, 504}
+
+
+class AsyncApiService:
+    """Non-blocking reads for views, on a pooled ``httpx.AsyncClient`` running in its own loop thread.
+
+    Views call ``run``/``gather`` with callbacks and render placeholders meanwhile, so the Flet UI
+    thread never waits on the network. Identical in-flight GETs share one request, and transient
+    failures (connection errors, 429/502/503/504) are retried with jittered exponential backoff.
+    Auth and error reporting follow ``api_service``.
+    """
+
+    def __init__(self, api=api_service, retries=3, backoff=0.25):
+        self.api = api
+        self.retries = retries
+        self.backoff = backoff
+        self._loop = None
+        self._client = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="pos-http", daemon=True).start()
+            return self._loop
+
+    def _http(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=settings.API_BASE_URL,
+                timeout=10.0,
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+            )
+        return self._client
+
+    def run(self, coro, on_done=None):
+        """Schedule ``coro`` on the HTTP loop; ``on_done(result)`` runs on that loop's thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        if on_done is not None:
+            future.add_done_callback(lambda f: self._deliver(on_done, f))
+        return future
+
+    def gather(self, on_done=None, **coros):
+        """Run named coroutines concurrently and deliver ``{name: result}`` once all have finished."""
+
+        async def _all():
+            results = await asyncio.gather(*coros.values())
+            return dict(zip(coros.keys(), results))
+
+        return self.run(_all(), on_done)
+
+    @staticmethod
+    def _deliver(callback, future):
+        try:
+            callback(future.result())
+        except Exception as e:
+            print(f"Async callback failed: {e}")
+
+    async def get_json(self, path, params=None):
+        key = (path, tuple(sorted((params or {}).items())), self.api.token)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get_with_retry(path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get_with_retry(self, path, params):
+        headers = {"Authorization": f"Bearer {self.api.token}"} if self.api.token else {}
+        if self.api.consistency_token:
+            headers[CONSISTENCY_HEADER] = self.api.consistency_token
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            try:
+                response = await self._http().get(path, params=params, headers=headers)
+            except httpx.TransportError:
+                if last:
+                    raise
+            else:
+                if last or response.status_code not in _RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response.json()
+            await asyncio.sleep(self.backoff * 2**attempt * (0.5 + random.random()))
+
+    async def _fetch(self, context, fallback, path, params=None, pick=None):
+        try:
+            data = await self.get_json(path, params)
+            return pick(data) if pick else data
+        except httpx.HTTPError as e:
+            self.api._handle_error(context, e)
+            return fallback
+
+    async def get_products(self, search=None, category_id=None, active=None, limit=100):
+        params = {"limit": limit}
+        if search: params["search"] = search
+        if category_id: params["category_id"] = category_id
+        if active is not None: params["active"] = str(active).lower()
+        return await self._fetch("Fetch products failed", [], "/products", params, lambda d: d["items"])
+
+    async def get_customers(self, search=None, active=None, limit=100):
+        params = {"limit": limit}
+        if search: params["search"] = search
+        if active is not None: params["active"] = str(active).lower()
+        return await self._fetch("Fetch customers failed", [], "/customers", params, lambda d: d["items"])
+
+    async def get_sales(self):
+        return await self._fetch("Fetch sales failed", [], "/sales", None, lambda d: d["items"])
+
+    async def get_dashboard_stats(self, days=30):
+        params = {"days": days, "recent_limit": 5}
+        return await self._fetch("Fetch dashboard failed", None, "/dashboard/summary", params, dashboard_stats)
+
+
+async_api = AsyncApiService()
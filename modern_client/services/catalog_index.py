@@ -0,0 +1,47 @@
+import bisect
+import re
+
+_WORD = re.compile(r"\w+")
+
+
+def _tokens(text):
+    return _WORD.findall((text or "").lower())
+
+
+class ProductIndex:
+    """Sorted prefix index over product name words and SKUs.
+
+    Each query word narrows the match set by a bisect range scan, so a keystroke costs
+    O(log n + matches) instead of a substring test against every product.
+    """
+
+    def __init__(self, products=()):
+        self.products = list(products)
+        entries = []
+        for position, product in enumerate(self.products):
+            keys = set(_tokens(product.get("name")))
+            sku = (product.get("sku") or "").lower()
+            if sku:
+                keys.add(sku)
+                keys.update(_tokens(sku))
+            entries.extend((key, position) for key in keys)
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._positions = [position for _, position in entries]
+
+    def _prefix(self, word):
+        start = bisect.bisect_left(self._keys, word)
+        end = bisect.bisect_left(self._keys, word + "\uffff", start)
+        return set(self._positions[start:end])
+
+    def search(self, query):
+        words = _tokens(query)
+        if not words:
+            return self.products
+        matches = None
+        for word in words:
+            found = self._prefix(word)
+            matches = found if matches is None else matches & found
+            if not matches:
+                return []
+        return [self.products[position] for position in sorted(matches)]
@@ -0,0 +1,261 @@
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from config import settings
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+PENDING = "pending"
+REJECTED = "rejected"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    retail_price TEXT NOT NULL,
+    category_id TEXT,
+    active INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    stock_quantity INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS customers (
+    id TEXT PRIMARY KEY,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    email TEXT,
+    active INTEGER NOT NULL,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sale_queue (
+    id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    occurred_at TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_sale_queue_status ON sale_queue (status, id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+# Quantities still sitting in the pending queue; a fresh server stock figure does not include them yet.
+_PENDING_HOLDS = """
+    SELECT json_extract(line.value, '$.product_id') AS product_id,
+           json_extract(line.value, '$.quantity') AS quantity
+    FROM sale_queue, json_each(sale_queue.payload, '$.lines') AS line
+    WHERE sale_queue.status = 'pending'
+"""
+
+_UPSERT_PRODUCT = f"""
+    INSERT INTO products (id, name, sku, retail_price, category_id, active, version, stock_quantity)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        name = excluded.name,
+        sku = excluded.sku,
+        retail_price = excluded.retail_price,
+        category_id = excluded.category_id,
+        active = excluded.active,
+        version = excluded.version,
+        stock_quantity = excluded.stock_quantity - (
+            SELECT COALESCE(SUM(held.quantity), 0) FROM ({_PENDING_HOLDS}) AS held WHERE held.product_id = excluded.id
+        )
+"""
+
+
+def new_ulid(now=None):
+    """Monotonic-enough ULID: 48-bit millisecond timestamp + 80 random bits, Crockford base32."""
+    millis = int((now if now is not None else time.time()) * 1000)
+    value = (millis << 80) | secrets.randbits(80)
+    chars = []
+    for _ in range(26):
+        chars.append(_CROCKFORD[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+class LocalStore:
+    """Till-local SQLite replica of the catalog/customers plus the durable outbound sale queue.
+
+    The UI thread and the sync thread each get their own connection; WAL lets the till keep
+    reading and enqueueing while the sync thread writes.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or settings.LOCAL_DB_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # Catalog replica
+
+    def upsert_products(self, products):
+        rows = [
+            (
+                p["id"],
+                p.get("name", ""),
+                p.get("sku", ""),
+                str(p.get("retail_price", "0")),
+                p.get("category_id"),
+                1 if p.get("active", True) else 0,
+                int(p.get("version", 0)),
+                int(p.get("stock_quantity", 0)),
+            )
+            for p in products
+        ]
+        with self._connect() as conn:
+            conn.executemany(_UPSERT_PRODUCT, rows)
+
+    def product_versions(self, ids):
+        if not ids:
+            return {}
+        marks = ",".join("?" for _ in ids)
+        rows = self._connect().execute(f"SELECT id, version FROM products WHERE id IN ({marks})", list(ids))
+        return {row["id"]: row["version"] for row in rows}
+
+    def products(self, active=True):
+        sql = "SELECT * FROM products"
+        params = []
+        if active is not None:
+            sql += " WHERE active = ?"
+            params.append(1 if active else 0)
+        rows = self._connect().execute(sql + " ORDER BY lower(name)", params)
+        return [
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "sku": row["sku"],
+                "retail_price": row["retail_price"],
+                "category_id": row["category_id"],
+                "active": bool(row["active"]),
+                "version": row["version"],
+                "stock_quantity": row["stock_quantity"],
+            }
+            for row in rows
+        ]
+
+    def upsert_customers(self, customers):
+        rows = [
+            (
+                c["id"],
+                c.get("first_name", ""),
+                c.get("last_name", ""),
+                c.get("email"),
+                1 if c.get("active", True) else 0,
+                int(c.get("version", 0)),
+            )
+            for c in customers
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO customers (id, first_name, last_name, email, active, version)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    first_name = excluded.first_name,
+                    last_name = excluded.last_name,
+                    email = excluded.email,
+                    active = excluded.active,
+                    version = excluded.version
+                """,
+                rows,
+            )
+
+    def customers(self, active=True):
+        sql = "SELECT * FROM customers"
+        params = []
+        if active is not None:
+            sql += " WHERE active = ?"
+            params.append(1 if active else 0)
+        rows = self._connect().execute(sql + " ORDER BY lower(last_name), lower(first_name)", params)
+        return [dict(row) | {"active": bool(row["active"])} for row in rows]
+
+    def get_state(self, key, default=None):
+        row = self._connect().execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_state(self, key, value):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (key, str(value)),
+            )
+
+    # Outbound sale queue
+
+    def enqueue_sale(self, sale_data):
+        """Persist a sale for upload and hold its stock locally; returns the client sale id."""
+        sale_id = new_ulid()
+        occurred_at = datetime.now(timezone.utc).isoformat()
+        payload = {
+            **sale_data,
+            "id": sale_id,
+            "occurred_at": occurred_at,
+            "lines": [
+                {**line, "unit_price": str(Decimal(str(line["unit_price"])))} for line in sale_data["lines"]
+            ],
+        }
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sale_queue (id, payload, occurred_at) VALUES (?, ?, ?)",
+                (sale_id, json.dumps(payload), occurred_at),
+            )
+            conn.executemany(
+                "UPDATE products SET stock_quantity = stock_quantity - ? WHERE id = ?",
+                [(line["quantity"], line["product_id"]) for line in payload["lines"]],
+            )
+        return sale_id
+
+    def pending_sales(self, limit):
+        rows = self._connect().execute(
+            "SELECT payload FROM sale_queue WHERE status = ? ORDER BY id LIMIT ?", (PENDING, limit)
+        )
+        return [json.loads(row["payload"]) for row in rows]
+
+    def complete_sales(self, sale_ids):
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM sale_queue WHERE id = ?", [(sale_id,) for sale_id in sale_ids])
+
+    def reject_sale(self, sale_id, error):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE sale_queue SET status = ?, attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (REJECTED, error, sale_id),
+            )
+
+    def record_attempt(self, sale_ids, error):
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE sale_queue SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                [(error, sale_id) for sale_id in sale_ids],
+            )
+
+    def queue_counts(self):
+        rows = self._connect().execute("SELECT status, COUNT(*) AS n FROM sale_queue GROUP BY status")
+        counts = {PENDING: 0, REJECTED: 0}
+        counts.update({row["status"]: row["n"] for row in rows})
+        return counts
+
@@ -0,0 +1,161 @@
+import threading
+import time
+import traceback
+
+import httpx
+
+from config import settings
+from services.api import api_service
+from services.local_store import LocalStore
+
+_PAGE_LIMIT = 100  # backend maximum for list endpoints
+_MAX_BACKOFF_SECONDS = 300.0
+
+
+class SyncService:
+    """Background thread that uploads queued sales and keeps the local replica fresh.
+
+    Each cycle drains the sale queue through ``POST /sales/batch`` (client ULIDs make replays
+    no-ops), then refreshes the catalog. Incremental refreshes walk products by ``updated_at``
+    and stop at the first page the replica already has; a full pass also picks up stock moved
+    by other tills and customer changes. Failed cycles, network or otherwise, back off
+    exponentially and never reach the UI thread.
+    """
+
+    def __init__(self, store, api=api_service):
+        self.store = store
+        self.api = api
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._listeners = []
+        self._failures = 0
+        self.online = False
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            self.trigger()
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="pos-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def trigger(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                changed = self.run_once()
+                self._failures = 0
+                self.online = True
+            except httpx.HTTPError as e:
+                changed = self._failed()
+                print(f"Sync deferred: {e}")
+            except Exception:
+                # A malformed response or a local store error must not end the thread; the next cycle backs off.
+                changed = self._failed()
+                print("Sync failed:")
+                traceback.print_exc()
+            self._notify(changed)
+            self._wake.wait(self._delay())
+            self._wake.clear()
+
+    def _failed(self):
+        self._failures += 1
+        self.online = False
+        return False
+
+    def _delay(self):
+        if not self._failures:
+            return settings.SYNC_INTERVAL_SECONDS
+        return min(settings.SYNC_INTERVAL_SECONDS * 2 ** self._failures, _MAX_BACKOFF_SECONDS)
+
+    def run_once(self):
+        uploaded = self.drain_queue()
+        last_full = float(self.store.get_state("catalog_full_refresh_at", "0"))
+        if time.time() - last_full >= settings.CATALOG_FULL_REFRESH_SECONDS:
+            self.refresh_full()
+            refreshed = True
+        else:
+            refreshed = self.refresh_incremental()
+        return bool(uploaded or refreshed)
+
+    def drain_queue(self):
+        uploaded = 0
+        while not self._stop.is_set():
+            batch = self.store.pending_sales(settings.SYNC_BATCH_SIZE)
+            if not batch:
+                break
+            try:
+                result = self.api.sync_sales(batch)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 422:
+                    self.store.record_attempt([sale["id"] for sale in batch], str(e))
+                    raise
+                # The whole envelope failed validation; upload one by one so a bad sale cannot block the rest.
+                result = {"results": []}
+                for sale in batch:
+                    try:
+                        result["results"] += self.api.sync_sales([sale])["results"]
+                    except httpx.HTTPStatusError as single:
+                        if single.response.status_code != 422:
+                            raise
+                        result["results"].append({"id": sale["id"], "status": "rejected", "detail": single.response.text})
+            done = []
+            for outcome in result["results"]:
+                if outcome["status"] == "rejected":
+                    self.store.reject_sale(outcome["id"], outcome.get("detail") or outcome.get("code") or "rejected")
+                else:
+                    done.append(outcome["id"])
+            self.store.complete_sales(done)
+            uploaded += len(done)
+        return uploaded
+
+    def refresh_incremental(self):
+        changed = False
+        page = 1
+        while True:
+            data = self.api.fetch_page("/products", page, _PAGE_LIMIT, sort_by="updated_at", sort_direction="desc")
+            items = data["items"]
+            known = self.store.product_versions([item["id"] for item in items])
+            fresh = [item for item in items if known.get(item["id"]) != item["version"]]
+            # Stock is not versioned, so the fetched page is applied whole.
+            self.store.upsert_products(items)
+            changed = changed or bool(fresh)
+            if not fresh or page >= data["meta"]["pages"]:
+                return changed
+            page += 1
+
+    def refresh_full(self):
+        for path, upsert in (("/products", self.store.upsert_products), ("/customers", self.store.upsert_customers)):
+            page = 1
+            while True:
+                data = self.api.fetch_page(path, page, _PAGE_LIMIT)
+                upsert(data["items"])
+                if page >= data["meta"]["pages"]:
+                    break
+                page += 1
+        self.store.set_state("catalog_full_refresh_at", time.time())
+
+    def _notify(self, changed):
+        for callback in list(self._listeners):
+            try:
+                callback(changed)
+            except Exception as e:
+                print(f"Sync listener failed: {e}")
+
+
+local_store = LocalStore()
+sync_service = SyncService(local_store)
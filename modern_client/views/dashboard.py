@@ -1,5 +1,5 @@
 import flet as ft
-from services.api import api_service
+from services.async_api import async_api
 
 icons = ft.icons
 
@@ -11,12 +11,14 @@ class DashboardView(ft.Container):
         self.padding = 30
         
         # Stats Text Controls
-        self.total_sales_text = ft.Text("$0.00", color="white", size=24, weight=ft.FontWeight.BOLD)
-        self.orders_text = ft.Text("0", color="white", size=24, weight=ft.FontWeight.BOLD)
-        self.customers_text = ft.Text("0", color="white", size=24, weight=ft.FontWeight.BOLD)
-        self.inventory_text = ft.Text("0 Items", color="white", size=24, weight=ft.FontWeight.BOLD)
+        self.total_sales_text = ft.Text("—", color="white", size=24, weight=ft.FontWeight.BOLD)
+        self.orders_text = ft.Text("—", color="white", size=24, weight=ft.FontWeight.BOLD)
+        self.customers_text = ft.Text("—", color="white", size=24, weight=ft.FontWeight.BOLD)
+        self.inventory_text = ft.Text("—", color="white", size=24, weight=ft.FontWeight.BOLD)
 
-        self.recent_sales_list = ft.ListView(expand=True, spacing=10)
+        self.recent_sales_list = ft.ListView(
+            expand=True, spacing=10, controls=[ft.Row([ft.ProgressRing(width=24, height=24)], alignment=ft.MainAxisAlignment.CENTER)]
+        )
 
         self.content = ft.Column(
             [
@@ -38,8 +40,13 @@ class DashboardView(ft.Container):
         self._load_data()
 
     def _load_data(self):
-        stats = api_service.get_dashboard_stats()
-        if stats:
+        # Placeholders render immediately; the stats fill in when the request completes
+        async_api.run(async_api.get_dashboard_stats(), self._apply_stats)
+
+    def _apply_stats(self, stats):
+        if not stats:
+            self.recent_sales_list.controls = []
+        else:
             self.total_sales_text.value = stats.get("total_sales", "$0.00")
             self.orders_text.value = stats.get("orders", "0")
             self.customers_text.value = stats.get("customers", "0")
@@ -65,8 +72,8 @@ class DashboardView(ft.Container):
                     )
                 )
 
-            if self.page:
-                self.page.update()
+        if self.page:
+            self.update()
 
     def _build_stats_row(self):
         return ft.Row(
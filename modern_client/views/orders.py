@@ -1,5 +1,5 @@
 import flet as ft
-from services.api import api_service
+from services.async_api import async_api
 
 class OrdersView(ft.Container):
     def __init__(self, app):
@@ -23,6 +23,8 @@ class OrdersView(ft.Container):
             heading_row_color="#2d3033",
         )
 
+        self.loading = ft.ProgressBar(color="#bb86fc", bgcolor="#2d3033", visible=False)
+
         self.content = ft.Column(
             [
                 ft.Row(
@@ -33,6 +35,7 @@ class OrdersView(ft.Container):
                     alignment=ft.MainAxisAlignment.SPACE_BETWEEN
                 ),
                 ft.Divider(height=20, color="transparent"),
+                self.loading,
                 ft.Container(
                     content=self.data_table,
                     bgcolor="#1a1c1e",
@@ -45,7 +48,13 @@ class OrdersView(ft.Container):
         self._load_data()
 
     def _load_data(self):
-        sales = api_service.get_sales()
+        self.loading.visible = True
+        if self.page:
+            self.loading.update()
+        async_api.run(async_api.get_sales(), self._apply_sales)
+
+    def _apply_sales(self, sales):
+        self.loading.visible = False
         self.data_table.rows = [
             ft.DataRow(
                 cells=[
@@ -58,4 +67,4 @@ class OrdersView(ft.Container):
             ) for sale in sales
         ]
         if self.page:
-            self.page.update()
+            self.update()
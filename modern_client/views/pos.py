@@ -1,8 +1,16 @@
+import threading
+
 import flet as ft
-from services.api import api_service
+from services.async_api import async_api
+from services.catalog_index import ProductIndex
+from services.local_store import PENDING, REJECTED
+from services.sync import local_store, sync_service
 
 icons = ft.icons
 
+GRID_PAGE_SIZE = 48
+SEARCH_DEBOUNCE_SECONDS = 0.2
+
 class POSView(ft.Container):
     def __init__(self, app):
         super().__init__()
@@ -14,6 +22,15 @@ class POSView(ft.Container):
         self.products = []
         self.customers = []
         self.selected_customer = None
+        self.search_query = ""
+        self._seeding = False
+        self.index = ProductIndex()
+        self._matches = []
+        self._visible = GRID_PAGE_SIZE
+        self._search_timer = None
+        self._cards = {}
+        self._cart_rows = {}
+        self._customer_keys = None
         
         # UI Components
         self.product_grid = ft.GridView(
@@ -24,8 +41,10 @@ class POSView(ft.Container):
             spacing=20,
             run_spacing=20,
         )
+        self.more_button = ft.TextButton("Show more", visible=False, on_click=lambda e: self._show_more())
         self.cart_list = ft.ListView(expand=True, spacing=10)
         self.total_text = ft.Text("$0.00", size=24, weight=ft.FontWeight.BOLD, color="white")
+        self.sync_text = ft.Text("", size=12, color="grey")
         self.customer_dropdown = ft.Dropdown(
             label="Select Customer",
             hint_text="Guest Customer",
@@ -52,7 +71,8 @@ class POSView(ft.Container):
                     content=ft.Column(
                         [
                             self._build_header(),
-                            self.product_grid
+                            self.product_grid,
+                            ft.Row([self.more_button], alignment=ft.MainAxisAlignment.CENTER),
                         ]
                     )
                 ),
@@ -65,6 +85,7 @@ class POSView(ft.Container):
                     content=ft.Column(
                         [
                             ft.Text("Current Sale", size=24, weight=ft.FontWeight.BOLD, color="white"),
+                            self.sync_text,
                             ft.Container(height=10),
                             self.customer_dropdown,
                             ft.Divider(color="#2d3033"),
@@ -101,7 +122,7 @@ class POSView(ft.Container):
                 on_change=self._on_search
             ),
             ft.IconButton(icons.FILTER_LIST, icon_color="white", tooltip="Filter"),
-            ft.IconButton(icons.REFRESH, icon_color="white", tooltip="Refresh", on_click=lambda e: self._load_data()),
+            ft.IconButton(icons.REFRESH, icon_color="white", tooltip="Refresh", on_click=lambda e: self._refresh()),
         ]
 
         if self.app.user_role == "CASHIER":
@@ -111,29 +132,115 @@ class POSView(ft.Container):
 
         return ft.Row(controls)
 
+    def did_mount(self):
+        sync_service.add_listener(self._on_sync)
+
+    def will_unmount(self):
+        sync_service.remove_listener(self._on_sync)
+        if self._search_timer:
+            self._search_timer.cancel()
+
+    def _refresh(self):
+        sync_service.trigger()
+        self._load_data()
+
     def _load_data(self):
-        # Only load active products for POS
-        self.products = api_service.get_products(active=True)
-        self.customers = api_service.get_customers()
-        
-        self._render_products(self.products)
-        
-        self.customer_dropdown.options = [
-            ft.dropdown.Option(key=c["id"], text=f"{c['first_name']} {c['last_name']}")
-            for c in self.customers
-        ]
-        if self.page:
-            self.page.update()
+        # The till reads from the local replica; the sync thread keeps it current
+        self.products = local_store.products(active=True)
+        self.customers = local_store.customers(active=True)
+        if not self.products and not self._seeding:
+            # First run on this till: seed the replica with products and customers fetched in parallel
+            self._seeding = True
+            async_api.gather(
+                self._seed_replica,
+                products=async_api.get_products(active=None),
+                customers=async_api.get_customers(),
+            )
+
+        self.index = ProductIndex(self.products)
+        live = {p["id"] for p in self.products}
+        self._cards = {pid: card for pid, card in self._cards.items() if pid in live}
+        self._matches = self.index.search(self.search_query)
+        self._render_products()
+        self._update_sync_status()
+
+        customer_keys = [(c["id"], c["first_name"], c["last_name"]) for c in self.customers]
+        if customer_keys != self._customer_keys:
+            self._customer_keys = customer_keys
+            self.customer_dropdown.options = [
+                ft.dropdown.Option(key=cid, text=f"{first} {last}") for cid, first, last in customer_keys
+            ]
+            if self.page:
+                self.customer_dropdown.update()
 
-    def _render_products(self, products):
-        self.product_grid.controls = [self._build_product_card(p) for p in products]
+    def _seed_replica(self, results):
+        local_store.upsert_products(results["products"])
+        local_store.upsert_customers(results["customers"])
+        self._seeding = False
+        if results["products"]:
+            self._load_data()
+
+    def _render_products(self):
+        # Only the first `_visible` matches get controls; unchanged products reuse their card,
+        # so Flet sends just the added, removed or modified cards.
+        controls = [self._card_for(p) for p in self._matches[: self._visible]]
+        more = len(self._matches) > self._visible
+        grid_changed = len(controls) != len(self.product_grid.controls) or any(
+            a is not b for a, b in zip(controls, self.product_grid.controls)
+        )
+        more_changed = more != self.more_button.visible
+        self.product_grid.controls = controls
+        self.more_button.visible = more
         if self.page:
-            self.product_grid.update()
+            if grid_changed:
+                self.product_grid.update()
+            if more_changed:
+                self.more_button.update()
+
+    def _card_for(self, product):
+        signature = (product.get("name"), product.get("retail_price"), product.get("stock_quantity"))
+        cached = self._cards.get(product["id"])
+        if cached and cached[0] == signature:
+            return cached[1]
+        card = self._build_product_card(product)
+        self._cards[product["id"]] = (signature, card)
+        return card
+
+    def _show_more(self):
+        self._visible += GRID_PAGE_SIZE
+        self._render_products()
 
     def _on_search(self, e):
-        query = e.control.value.lower()
-        filtered = [p for p in self.products if query in p.get("name", "").lower()]
-        self._render_products(filtered)
+        self.search_query = e.control.value
+        if self._search_timer:
+            self._search_timer.cancel()
+        self._search_timer = threading.Timer(SEARCH_DEBOUNCE_SECONDS, self._apply_search)
+        self._search_timer.daemon = True
+        self._search_timer.start()
+
+    def _apply_search(self):
+        self._matches = self.index.search(self.search_query)
+        self._visible = GRID_PAGE_SIZE
+        self._render_products()
+
+    def _on_sync(self, changed):
+        # Called from the sync thread
+        if changed:
+            self._load_data()
+        else:
+            self._update_sync_status()
+
+    def _update_sync_status(self):
+        counts = local_store.queue_counts()
+        parts = ["Online" if sync_service.online else "Offline"]
+        if counts[PENDING]:
+            parts.append(f"{counts[PENDING]} sale(s) waiting to sync")
+        if counts[REJECTED]:
+            parts.append(f"{counts[REJECTED]} rejected by server")
+        self.sync_text.value = " · ".join(parts)
+        self.sync_text.color = "#cf6679" if counts[REJECTED] else "grey"
+        if self.page:
+            self.sync_text.update()
 
     def _build_product_card(self, product):
         name = product.get("name", "Unknown")
@@ -202,7 +309,18 @@ class POSView(ft.Container):
         self._update_cart_ui()
 
     def _update_cart_ui(self):
-        self.cart_list.controls = [self._build_cart_item(item) for item in self.cart_items]
+        # Rows are keyed by product id; a +/- click only changes that row's quantity text
+        rows = []
+        for item in self.cart_items:
+            row = self._cart_rows.get(item["id"])
+            if row is None:
+                row = self._build_cart_item(item)
+                self._cart_rows[item["id"]] = row
+            row.data.value = str(item["qty"])
+            rows.append(row)
+        in_cart = {item["id"] for item in self.cart_items}
+        self._cart_rows = {pid: row for pid, row in self._cart_rows.items() if pid in in_cart}
+        self.cart_list.controls = rows
         total = sum(item["price"] * item["qty"] for item in self.cart_items)
         self.total_text.value = f"${total:.2f}"
         if self.page:
@@ -210,7 +328,9 @@ class POSView(ft.Container):
             self.total_text.update()
 
     def _build_cart_item(self, item):
+        qty_text = ft.Text(str(item["qty"]), color="white")
         return ft.Container(
+            data=qty_text,
             bgcolor="#2d3033",
             padding=10,
             border_radius=10,
@@ -225,7 +345,7 @@ class POSView(ft.Container):
                     ft.Row(
                         [
                             ft.IconButton(icons.REMOVE, icon_size=16, icon_color="white", on_click=lambda e: self._update_qty(item, -1)),
-                            ft.Text(str(item["qty"]), color="white"),
+                            qty_text,
                             ft.IconButton(icons.ADD, icon_size=16, icon_color="white", on_click=lambda e: self._update_qty(item, 1)),
                         ],
                         spacing=0
@@ -261,10 +381,10 @@ class POSView(ft.Container):
             ]
         }
         
-        result = api_service.create_sale(sale_data)
-        if result:
-            self.cart_items = []
-            self._update_cart_ui()
-            self.page.show_snack_bar(ft.SnackBar(content=ft.Text("Sale recorded successfully!")))
-        else:
-            self.page.show_snack_bar(ft.SnackBar(content=ft.Text("Failed to record sale.")))
+        # Completes against local disk; the sync thread uploads it via /sales/batch
+        local_store.enqueue_sale(sale_data)
+        sync_service.trigger()
+        self.cart_items = []
+        self._update_cart_ui()
+        self._load_data()
+        self.page.show_snack_bar(ft.SnackBar(content=ft.Text("Sale recorded successfully!")))
@@ -0,0 +1,54 @@
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../modern_client')))
+
+from modern_client.services.api import ApiService
+from modern_client.services.async_api import AsyncApiService
+import httpx
+
+
+class TestAsyncApiService(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.api_service = ApiService()
+        self.api_service.set_error_handler(MagicMock())
+        self.async_api = AsyncApiService(self.api_service, retries=2, backoff=0)
+
+    def _mount(self, handler):
+        def record(request):
+            self.calls.append(request.url.path)
+            return handler(request, len(self.calls))
+        self.async_api._client = httpx.AsyncClient(base_url="http://test", transport=httpx.MockTransport(record))
+
+    def test_concurrent_identical_reads_share_one_request(self):
+        self._mount(lambda request, n: httpx.Response(200, json={"items": [{"id": "p1"}]}))
+
+        async def fan_out():
+            return await asyncio.gather(self.async_api.get_products(), self.async_api.get_products())
+
+        first, second = asyncio.run(fan_out())
+        self.assertEqual(first, [{"id": "p1"}])
+        self.assertEqual(second, first)
+        self.assertEqual(self.calls, ["/products"])
+
+    def test_transient_failures_are_retried(self):
+        self._mount(lambda request, n: httpx.Response(503) if n < 3 else httpx.Response(200, json={"items": []}))
+        self.assertEqual(asyncio.run(self.async_api.get_sales()), [])
+        self.assertEqual(len(self.calls), 3)
+        self.assertFalse(self.api_service.error_handler.called)
+
+    def test_client_errors_are_reported_without_retry(self):
+        self._mount(lambda request, n: httpx.Response(404))
+        self.assertEqual(asyncio.run(self.async_api.get_customers()), [])
+        self.assertEqual(len(self.calls), 1)
+        args, _ = self.api_service.error_handler.call_args
+        self.assertIn("Fetch customers failed", args[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../modern_client')))
+
+from modern_client.services.catalog_index import ProductIndex
+
+
+class TestProductIndex(unittest.TestCase):
+    def setUp(self):
+        self.products = [
+            {"id": "1", "name": "Green Apple", "sku": "FRU-001"},
+            {"id": "2", "name": "Apple Juice", "sku": "DRK-010"},
+            {"id": "3", "name": "Banana", "sku": "FRU-002"},
+        ]
+        self.index = ProductIndex(self.products)
+
+    def ids(self, query):
+        return [p["id"] for p in self.index.search(query)]
+
+    def test_matches_word_prefixes_in_catalog_order(self):
+        self.assertEqual(self.ids("app"), ["1", "2"])
+        self.assertEqual(self.ids("APPLE ju"), ["2"])
+        self.assertEqual(self.ids("ban"), ["3"])
+        self.assertEqual(self.ids("pple"), [])
+
+    def test_matches_sku_prefixes(self):
+        self.assertEqual(self.ids("fru-00"), ["1", "3"])
+        self.assertEqual(self.ids("drk"), ["2"])
+
+    def test_blank_query_returns_everything(self):
+        self.assertEqual(self.ids("  "), ["1", "2", "3"])
+
+
+if __name__ == '__main__':
+    unittest.main()
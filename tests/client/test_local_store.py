@@ -0,0 +1,57 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../modern_client')))
+
+from modern_client.services.local_store import PENDING, REJECTED, LocalStore, new_ulid
+
+
+class TestLocalStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = LocalStore(os.path.join(self.tmp.name, "till.db"))
+        self.store.upsert_products([
+            {"id": "p1", "name": "Apple", "sku": "APL", "retail_price": "1.50", "version": 1, "stock_quantity": 10}
+        ])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_enqueued_sale_holds_stock_until_uploaded(self):
+        sale_id = self.store.enqueue_sale(
+            {"customer_id": None, "currency": "USD", "lines": [{"product_id": "p1", "quantity": 3, "unit_price": 1.5}]}
+        )
+        self.assertEqual(len(sale_id), 26)
+        self.assertEqual(self.store.products()[0]["stock_quantity"], 7)
+
+        # A refresh with the server's pre-upload stock keeps the local hold applied
+        self.store.upsert_products([
+            {"id": "p1", "name": "Apple", "sku": "APL", "retail_price": "1.50", "version": 1, "stock_quantity": 10}
+        ])
+        self.assertEqual(self.store.products()[0]["stock_quantity"], 7)
+
+        (queued,) = self.store.pending_sales(10)
+        self.assertEqual(queued["id"], sale_id)
+        self.assertEqual(queued["lines"][0]["unit_price"], "1.5")
+        self.assertIn("occurred_at", queued)
+
+        self.store.complete_sales([sale_id])
+        self.assertEqual(self.store.queue_counts(), {PENDING: 0, REJECTED: 0})
+
+    def test_rejected_sales_leave_the_upload_queue(self):
+        sale_id = self.store.enqueue_sale(
+            {"customer_id": None, "currency": "USD", "lines": [{"product_id": "p1", "quantity": 1, "unit_price": 1.5}]}
+        )
+        self.store.reject_sale(sale_id, "insufficient stock")
+        self.assertEqual(self.store.pending_sales(10), [])
+        self.assertEqual(self.store.queue_counts(), {PENDING: 0, REJECTED: 1})
+
+    def test_ulids_sort_by_creation_time(self):
+        self.assertLess(new_ulid(1_700_000_000), new_ulid(1_700_000_001))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../modern_client')))
+
+from modern_client.services import sync
+from modern_client.services.sync import SyncService
+
+
+class _FlakyStore:
+    def __init__(self):
+        self.calls = 0
+
+    def pending_sales(self, limit):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("database is locked")
+        return []
+
+    def get_state(self, key, default=None):
+        return default
+
+    def set_state(self, key, value):
+        pass
+
+    def upsert_products(self, items):
+        pass
+
+    def upsert_customers(self, items):
+        pass
+
+
+class _EmptyApi:
+    def fetch_page(self, path, page, limit, **params):
+        return {"items": [], "meta": {"pages": 1}}
+
+
+class TestSyncService(unittest.TestCase):
+    def test_unexpected_error_backs_off_and_keeps_the_thread_alive(self):
+        service = SyncService(_FlakyStore(), api=_EmptyApi())
+        outcomes = []
+        recovered = threading.Event()
+
+        def listener(changed):
+            outcomes.append((service.online, service._failures))
+            if service.online:
+                recovered.set()
+
+        service.add_listener(listener)
+        with mock.patch.object(sync.settings, "SYNC_INTERVAL_SECONDS", 0.01), \
+                mock.patch("traceback.print_exc"):
+            service.start()
+            try:
+                self.assertTrue(recovered.wait(5))
+            finally:
+                service.stop()
+                service._thread.join(5)
+
+        self.assertEqual(outcomes[:2], [(False, 1), (True, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()